@@ -7,6 +7,7 @@ from logging.config import fileConfig
 from alembic import context
 from sqlalchemy import engine_from_config, pool
 
+import app.models  # noqa: F401 - registers every table on Base.metadata
 from app.db import Base
 from app.settings import get_settings
 
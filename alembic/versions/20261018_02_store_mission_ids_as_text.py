@@ -0,0 +1,39 @@
+"""Store mission ids as CHAR(32) on SQLite."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_02"
+down_revision = "20261018_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # PostgreSQL keeps its native UUID column. On SQLite a column declared as
+    # UUID has NUMERIC affinity, so hex ids made only of digits (and at most
+    # one "e") were stored as numbers; TEXT affinity stores them verbatim.
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    with op.batch_alter_table("missions", recreate="always") as batch_op:
+        batch_op.alter_column(
+            "id",
+            existing_type=sa.dialects.postgresql.UUID(as_uuid=True),
+            type_=sa.CHAR(length=32),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    with op.batch_alter_table("missions", recreate="always") as batch_op:
+        batch_op.alter_column(
+            "id",
+            existing_type=sa.CHAR(length=32),
+            type_=sa.dialects.postgresql.UUID(as_uuid=True),
+            existing_nullable=False,
+        )
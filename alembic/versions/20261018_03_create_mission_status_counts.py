@@ -0,0 +1,112 @@
+"""Create mission status rollup table and its maintenance triggers."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_03"
+down_revision = "20261018_02"
+branch_labels = None
+depends_on = None
+
+
+MISSION_STATUSES = (
+    "DRAFT",
+    "PLANNED",
+    "CONFIRMED",
+    "IN_PROGRESS",
+    "DONE",
+    "CANCELED",
+)
+
+SQLITE_TRIGGERS = (
+    """
+    CREATE TRIGGER trg_missions_count_insert AFTER INSERT ON missions
+    BEGIN
+        INSERT INTO mission_status_counts (day, status, count)
+        VALUES (date(NEW.start_time), NEW.status, 1)
+        ON CONFLICT (day, status) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER trg_missions_count_update AFTER UPDATE OF status, start_time ON missions
+    WHEN OLD.status IS NOT NEW.status OR date(OLD.start_time) IS NOT date(NEW.start_time)
+    BEGIN
+        UPDATE mission_status_counts SET count = count - 1
+        WHERE day = date(OLD.start_time) AND status = OLD.status;
+        INSERT INTO mission_status_counts (day, status, count)
+        VALUES (date(NEW.start_time), NEW.status, 1)
+        ON CONFLICT (day, status) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER trg_missions_count_delete AFTER DELETE ON missions
+    BEGIN
+        UPDATE mission_status_counts SET count = count - 1
+        WHERE day = date(OLD.start_time) AND status = OLD.status;
+    END
+    """,
+)
+
+POSTGRESQL_TRIGGERS = (
+    """
+    CREATE OR REPLACE FUNCTION missions_count_status() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' AND OLD.status = NEW.status
+                AND OLD.start_time::date = NEW.start_time::date THEN
+            RETURN NULL;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE mission_status_counts SET count = count - 1
+            WHERE day = OLD.start_time::date AND status = OLD.status;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO mission_status_counts (day, status, count)
+            VALUES (NEW.start_time::date, NEW.status, 1)
+            ON CONFLICT (day, status) DO UPDATE SET count = mission_status_counts.count + 1;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER trg_missions_count_status
+    AFTER INSERT OR DELETE OR UPDATE OF status, start_time ON missions
+    FOR EACH ROW EXECUTE FUNCTION missions_count_status()
+    """,
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "mission_status_counts",
+        sa.Column("day", sa.Date(), primary_key=True, nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(*MISSION_STATUSES, name="mission_status", native_enum=False, validate_strings=True),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("count", sa.Integer(), nullable=False),
+    )
+    dialect = op.get_bind().dialect.name
+    triggers = {"sqlite": SQLITE_TRIGGERS, "postgresql": POSTGRESQL_TRIGGERS}.get(dialect, ())
+    for statement in triggers:
+        op.execute(statement)
+    op.execute(
+        "INSERT INTO mission_status_counts (day, status, count) "
+        "SELECT date(start_time), status, count(*) FROM missions GROUP BY date(start_time), status"
+    )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for name in ("insert", "update", "delete"):
+            op.execute(f"DROP TRIGGER IF EXISTS trg_missions_count_{name}")
+    elif dialect == "postgresql":
+        op.execute("DROP TRIGGER IF EXISTS trg_missions_count_status ON missions")
+        op.execute("DROP FUNCTION IF EXISTS missions_count_status()")
+    op.drop_table("mission_status_counts")
@@ -0,0 +1,24 @@
+"""Index missions by (updated_at, id) for the change feed."""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261018_04"
+down_revision = "20261018_03"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_missions_updated_at",
+        "missions",
+        ["updated_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_missions_updated_at", table_name="missions")
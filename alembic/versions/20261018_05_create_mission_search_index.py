@@ -0,0 +1,86 @@
+"""Create the full-text search index over mission titles and notes."""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "20261018_05"
+down_revision = "20261018_04"
+branch_labels = None
+depends_on = None
+
+
+SQLITE_SEARCH_DDL = (
+    """
+    CREATE TABLE mission_search_docs (
+        docid INTEGER PRIMARY KEY,
+        mission_id CHAR(32) NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE missions_fts USING fts5(
+        title, notes, tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER trg_missions_search_insert AFTER INSERT ON missions
+    BEGIN
+        INSERT INTO mission_search_docs (mission_id) VALUES (NEW.id);
+        INSERT INTO missions_fts (rowid, title, notes)
+        VALUES ((SELECT docid FROM mission_search_docs WHERE mission_id = NEW.id), NEW.title, NEW.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER trg_missions_search_update AFTER UPDATE OF title, notes ON missions
+    WHEN OLD.title IS NOT NEW.title OR OLD.notes IS NOT NEW.notes
+    BEGIN
+        UPDATE missions_fts SET title = NEW.title, notes = NEW.notes
+        WHERE rowid = (SELECT docid FROM mission_search_docs WHERE mission_id = NEW.id);
+    END
+    """,
+    """
+    CREATE TRIGGER trg_missions_search_delete AFTER DELETE ON missions
+    BEGIN
+        DELETE FROM missions_fts
+        WHERE rowid = (SELECT docid FROM mission_search_docs WHERE mission_id = OLD.id);
+        DELETE FROM mission_search_docs WHERE mission_id = OLD.id;
+    END
+    """,
+    "INSERT INTO mission_search_docs (mission_id) SELECT id FROM missions",
+    """
+    INSERT INTO missions_fts (rowid, title, notes)
+    SELECT docs.docid, missions.title, missions.notes
+    FROM mission_search_docs AS docs JOIN missions ON missions.id = docs.mission_id
+    """,
+)
+
+POSTGRESQL_SEARCH_DDL = (
+    """
+    ALTER TABLE missions ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(notes, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX ix_missions_search ON missions USING GIN (search_vector)",
+)
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    statements = {"sqlite": SQLITE_SEARCH_DDL, "postgresql": POSTGRESQL_SEARCH_DDL}.get(dialect, ())
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for name in ("insert", "update", "delete"):
+            op.execute(f"DROP TRIGGER IF EXISTS trg_missions_search_{name}")
+        op.execute("DROP TABLE IF EXISTS missions_fts")
+        op.execute("DROP TABLE IF EXISTS mission_search_docs")
+    elif dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_missions_search")
+        op.execute("ALTER TABLE missions DROP COLUMN IF EXISTS search_vector")
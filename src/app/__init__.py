@@ -1,5 +1,18 @@
 """Core application package for the Codex backend."""
 
-from .main import app, create_app
+from __future__ import annotations
+
+from typing import Any
 
 __all__ = ["app", "create_app"]
+
+
+def __getattr__(name: str) -> Any:
+    # Importing ``app.db`` or ``app.models`` (Alembic, CLI tools) should not
+    # pull in FastAPI and every router, so the application is only imported
+    # when one of these names is actually used.
+    if name in __all__:
+        from . import main
+
+        return getattr(main, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,15 @@
 """API router exports."""
 
 from .auth import router as auth_router
-from .routes import health_router, version_router
+from .missions import router as missions_router
+from .middleware import RequestMetricsMiddleware
+from .routes import health_router, metrics_router, version_router
 
-__all__ = ["auth_router", "health_router", "version_router"]
+__all__ = [
+    "RequestMetricsMiddleware",
+    "auth_router",
+    "health_router",
+    "metrics_router",
+    "missions_router",
+    "version_router",
+]
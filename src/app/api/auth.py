@@ -3,60 +3,128 @@
 from __future__ import annotations
 
 import logging
+import math
+from datetime import UTC, datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from .deps import get_current_user
-from ..db.session import get_db
+from .deps import get_current_user, load_active_user
+from .responses import JSONBytesResponse, serialized
+from ..db.dialects import dialect_insert
+from ..db.session import get_async_db
 from ..models import User
-from ..schemas import AccessToken, RefreshRequest, TokenPair, UserCreate, UserLogin, UserRead
+from ..schemas import RefreshRequest, TokenPair, TokenPayload, UserCreate, UserLogin, UserRead
+from ..schemas.serializers import USER_READ
 from ..security import (
+    LoginRateLimiter,
+    PasswordRehasher,
+    PasswordService,
+    PasswordServiceBusyError,
+    RevocationStore,
     TokenError,
     TokenExpiredError,
+    UserCache,
+    UserSnapshot,
     create_access_token,
     create_refresh_token,
     decode_token,
-    hash_password,
-    verify_password,
+    get_login_rate_limiter,
+    get_password_rehasher,
+    get_password_service,
+    get_revocation_store,
+    get_user_cache,
 )
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# Buckets configured with ``*_PER_MINUTE=0`` never refill and report an
+# infinite wait; clients are told to come back after this many seconds.
+MAX_RETRY_AFTER_SECONDS = 60
+
+
+def _password_service_busy(exc: PasswordServiceBusyError) -> HTTPException:
+    """Translate a saturated hashing queue into a fast 503 response."""
+
+    logger.warning("Shedding auth request: %s", exc)
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication service is busy, retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
 
 @router.post("/signup", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def signup(user_in: UserCreate, db: Session = Depends(get_db)) -> User:
-    """Create a new user with the provided credentials."""
+async def signup(
+    user_in: UserCreate,
+    db: AsyncSession = Depends(get_async_db),
+    passwords: PasswordService = Depends(get_password_service),
+) -> JSONBytesResponse:
+    """Create a new user with the provided credentials.
+
+    The row is written with a single ``INSERT ... ON CONFLICT DO NOTHING
+    RETURNING`` statement, so concurrent signups for the same email cannot
+    race past an existence check and no follow-up refresh query is needed.
+    """
+
+    try:
+        password_hash = await passwords.hash_password(user_in.password)
+    except PasswordServiceBusyError as exc:
+        raise _password_service_busy(exc) from exc
+
+    statement = (
+        dialect_insert(db.get_bind().dialect.name, User)
+        .values(email=user_in.email, password_hash=password_hash, is_active=True)
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User.id, User.email, User.is_active, User.created_at)
+    )
+    row = (await db.execute(statement)).one_or_none()
+    await db.commit()
 
-    existing = db.scalar(select(User).where(User.email == user_in.email))
-    if existing is not None:
+    if row is None:
         logger.error("Signup failed: email already registered (%s)", user_in.email)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email is already registered",
         )
 
-    user = User(
-        email=user_in.email,
-        password_hash=hash_password(user_in.password),
-        is_active=True,
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-
+    user = UserSnapshot(**row._mapping)
     logger.info("User created: %s", user.email)
-    return user
+    return serialized(USER_READ, user, status_code=status.HTTP_201_CREATED)
 
 
 @router.post("/login", response_model=TokenPair)
-def login(credentials: UserLogin, db: Session = Depends(get_db)) -> TokenPair:
-    """Authenticate a user and return access/refresh tokens."""
+async def login(
+    credentials: UserLogin,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db),
+    passwords: PasswordService = Depends(get_password_service),
+    rehasher: PasswordRehasher = Depends(get_password_rehasher),
+    limiter: LoginRateLimiter = Depends(get_login_rate_limiter),
+) -> TokenPair:
+    """Authenticate a user and return access/refresh tokens.
+
+    Attempts over the per-email or per-IP budget are rejected with 429 before
+    any database or bcrypt work. Hashes weaker than the current bcrypt cost
+    are upgraded after the response is sent, so the rehash never adds to
+    login latency.
+    """
+
+    client_ip = request.client.host if request.client else None
+    retry_after = await limiter.check(credentials.email, client_ip)
+    if retry_after:
+        logger.debug("Login throttled for %s from %s", credentials.email, client_ip)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts",
+            headers={"Retry-After": str(max(1, math.ceil(min(retry_after, MAX_RETRY_AFTER_SECONDS))))},
+        )
 
-    user = db.scalar(select(User).where(User.email == credentials.email))
+    user = await db.scalar(select(User).where(User.email == credentials.email))
     if user is None:
         logger.error("Login failed: unknown email %s", credentials.email)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
@@ -65,10 +133,18 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)) -> TokenPair:
         logger.error("Login failed: inactive user %s", credentials.email)
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User is inactive")
 
-    if not verify_password(credentials.password, user.password_hash):
+    try:
+        password_valid = await passwords.verify_password(credentials.password, user.password_hash)
+    except PasswordServiceBusyError as exc:
+        raise _password_service_busy(exc) from exc
+
+    if not password_valid:
         logger.error("Login failed: bad password for %s", credentials.email)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
+    if passwords.needs_rehash(user.password_hash):
+        background_tasks.add_task(rehasher.submit, user.id, credentials.password, user.password_hash)
+
     access_token = create_access_token(user.id)
     refresh_token = create_refresh_token(user.id)
 
@@ -77,18 +153,17 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)) -> TokenPair:
 
 
 @router.get("/me", response_model=UserRead)
-def read_current_user(current_user: User = Depends(get_current_user)) -> User:
+def read_current_user(current_user: UserSnapshot = Depends(get_current_user)) -> JSONBytesResponse:
     """Return the authenticated user."""
 
-    return current_user
+    return serialized(USER_READ, current_user)
 
 
-@router.post("/refresh", response_model=AccessToken)
-def refresh_token(request: RefreshRequest) -> AccessToken:
-    """Generate a new access token from a refresh token."""
+def _decode_refresh_token(raw_token: str) -> TokenPayload:
+    """Decode a refresh token, mapping every failure to a 401."""
 
     try:
-        payload = decode_token(request.refresh_token)
+        payload = decode_token(raw_token)
     except TokenExpiredError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token expired") from exc
     except TokenError as exc:
@@ -97,13 +172,66 @@ def refresh_token(request: RefreshRequest) -> AccessToken:
     if payload.type != "refresh":
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token type")
 
+    if payload.jti is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+
+    return payload
+
+
+def _expiry(payload: TokenPayload) -> datetime:
+    return datetime.fromtimestamp(payload.exp, tz=UTC).replace(tzinfo=None)
+
+
+@router.post("/refresh", response_model=TokenPair)
+async def refresh_token(
+    request: RefreshRequest,
+    db: AsyncSession = Depends(get_async_db),
+    revocations: RevocationStore = Depends(get_revocation_store),
+    user_cache: UserCache = Depends(get_user_cache),
+) -> TokenPair:
+    """Rotate a refresh token into a new access/refresh token pair.
+
+    The presented refresh token is revoked as part of the exchange, so each
+    one can be used exactly once.
+    """
+
+    payload = _decode_refresh_token(request.refresh_token)
+
     try:
         subject = int(payload.sub)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token subject") from exc
 
-    access_token = create_access_token(subject)
-    return AccessToken(access_token=access_token)
+    if await revocations.is_revoked(db, payload.jti):
+        logger.error("Refresh rejected: revoked token reused for user %s", subject)
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token revoked")
+
+    await load_active_user(db, user_cache, subject)
+
+    if not await revocations.revoke(db, payload.jti, _expiry(payload)):
+        await db.rollback()
+        logger.error("Refresh rejected: concurrent reuse of token for user %s", subject)
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token revoked")
+    await db.commit()
+
+    return TokenPair(
+        access_token=create_access_token(subject),
+        refresh_token=create_refresh_token(subject),
+    )
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    request: RefreshRequest,
+    db: AsyncSession = Depends(get_async_db),
+    revocations: RevocationStore = Depends(get_revocation_store),
+) -> Response:
+    """Revoke a refresh token so it can no longer be exchanged."""
+
+    payload = _decode_refresh_token(request.refresh_token)
+    await revocations.revoke(db, payload.jti, _expiry(payload))
+    await db.commit()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 __all__ = ["router"]
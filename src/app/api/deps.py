@@ -4,20 +4,51 @@ from __future__ import annotations
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db.session import get_db
+from ..db.session import get_async_db
 from ..models import User
-from ..security import TokenError, TokenExpiredError, decode_token
+from ..security import (
+    TokenError,
+    TokenExpiredError,
+    UserCache,
+    UserSnapshot,
+    decode_token,
+    get_user_cache,
+)
 
 _bearer_scheme = HTTPBearer(auto_error=False)
 
 
-def get_current_user(
+async def load_active_user(db: AsyncSession, user_cache: UserCache, user_id: int) -> UserSnapshot:
+    """Return the active user ``user_id``, preferring the user cache over the database."""
+
+    user = user_cache.get(user_id)
+    if user is None:
+        record = await db.get(User, user_id)
+        if record is not None:
+            user = UserSnapshot.from_user(record)
+            user_cache.put(user)
+
+    if user is None or not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found or inactive",
+        )
+
+    return user
+
+
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(_bearer_scheme),
-    db: Session = Depends(get_db),
-) -> User:
-    """Return the authenticated user from the bearer token."""
+    db: AsyncSession = Depends(get_async_db),
+    user_cache: UserCache = Depends(get_user_cache),
+) -> UserSnapshot:
+    """Return a snapshot of the authenticated user from the bearer token.
+
+    Snapshots are served from the user cache when possible so most requests
+    do not need a database round-trip just to check ``is_active``.
+    """
 
     if credentials is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
@@ -46,14 +77,7 @@ def get_current_user(
             detail="Invalid token subject",
         ) from exc
 
-    user = db.get(User, user_id)
-    if user is None or not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found or inactive",
-        )
-
-    return user
+    return await load_active_user(db, user_cache, user_id)
 
 
-__all__ = ["get_current_user"]
+__all__ = ["get_current_user", "load_active_user"]
@@ -0,0 +1,51 @@
+"""ASGI middleware recording per-route request latency."""
+
+from __future__ import annotations
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..core.metrics import HTTP_REQUEST_SECONDS
+
+# Route label for requests no route matched, so unknown paths cannot grow
+# the number of series without bound.
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestMetricsMiddleware:
+    """Time each HTTP request into ``codex_http_request_duration_seconds``.
+
+    Requests are labelled with the matched route's path template (e.g.
+    ``/missions/{mission_id}``) rather than the raw path. The router records
+    the route in the shared ASGI scope, so it is read once the application
+    returns. A request that raises before starting a response counts as 500.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = getattr(scope.get("route"), "path_format", UNMATCHED_ROUTE)
+            HTTP_REQUEST_SECONDS.labels(scope["method"], route, str(status_code)).observe(
+                time.perf_counter() - started
+            )
+
+
+__all__ = ["RequestMetricsMiddleware", "UNMATCHED_ROUTE"]
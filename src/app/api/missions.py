@@ -0,0 +1,619 @@
+"""Mission API routes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import suppress
+from datetime import date, datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import ColumnElement, Select, and_, or_, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from .deps import get_current_user
+from .pagination import decode_cursor, encode_cursor
+from .responses import JSONBytesResponse, serialized
+from ..db.session import get_db
+from ..missions import (
+    CHANGE_MAX_SEEN,
+    ChangePosition,
+    ExportFormat,
+    MissionImporter,
+    MissionChangeFeed,
+    MissionIntervalIndex,
+    MissionSnapshot,
+    find_mission_conflicts,
+    get_mission_change_feed,
+    get_mission_interval_index,
+    get_mission_snapshot,
+    iter_mission_export,
+    read_changes,
+    search_missions,
+    search_terms,
+    status_summary,
+    utc_naive,
+)
+from ..models import Mission, MissionStatus
+from ..schemas import (
+    MissionBoardItem,
+    MissionChangePage,
+    MissionConflictReport,
+    MissionConflictRequest,
+    MissionCreate,
+    MissionDaySummary,
+    MissionImportReport,
+    MissionPage,
+    MissionRead,
+    MissionTransitionReport,
+    MissionTransitionRequest,
+    MissionUpdate,
+)
+from ..schemas.serializers import MISSION_BOARD, MISSION_PAGE, MISSION_READ
+from ..settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+DEFAULT_BOARD_SIZE = 500
+MAX_BOARD_SIZE = 5000
+DEFAULT_CHANGES_SIZE = 100
+DEFAULT_SEARCH_SIZE = 20
+MAX_SEARCH_QUERY_LENGTH = 200
+MAX_CHANGES_WAIT = 30.0
+SSE_HEARTBEAT_SECONDS = 15.0
+
+router = APIRouter(prefix="/missions", tags=["missions"], dependencies=[Depends(get_current_user)])
+
+
+def _mission_or_404(db: Session, mission_id: uuid.UUID) -> Mission:
+    mission = db.get(Mission, mission_id)
+    if mission is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mission not found")
+    return mission
+
+
+def _decode_mission_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    start_time, mission_id = decode_cursor(cursor, 2)
+    try:
+        return utc_naive(datetime.fromisoformat(start_time)), uuid.UUID(mission_id)
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
+
+def _parse_window(raw: str) -> tuple[datetime, datetime]:
+    """Parse an ISO 8601 ``<start>/<end>`` interval."""
+
+    try:
+        start_raw, end_raw = raw.split("/")
+        start, end = (utc_naive(datetime.fromisoformat(value)) for value in (start_raw, end_raw))
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="overlaps must be an ISO 8601 interval '<start>/<end>'",
+        ) from exc
+    if end <= start:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="overlaps must end after it starts",
+        )
+    return start, end
+
+
+def mission_filters(
+    *,
+    start_from: datetime | None = None,
+    start_to: datetime | None = None,
+    statuses: list[MissionStatus] | None = None,
+    overlaps: tuple[datetime, datetime] | None = None,
+) -> list[ColumnElement[bool]]:
+    """Return the WHERE conditions shared by mission listings and exports."""
+
+    conditions: list[ColumnElement[bool]] = []
+    if start_from is not None:
+        conditions.append(Mission.start_time >= utc_naive(start_from))
+    if start_to is not None:
+        conditions.append(Mission.start_time < utc_naive(start_to))
+    if statuses:
+        conditions.append(Mission.status.in_(statuses))
+    if overlaps is not None:
+        conditions.extend((Mission.start_time < overlaps[1], Mission.end_time > overlaps[0]))
+    return conditions
+
+
+def list_missions_statement(
+    *,
+    limit: int,
+    after: tuple[datetime, uuid.UUID] | None = None,
+    start_from: datetime | None = None,
+    start_to: datetime | None = None,
+    statuses: list[MissionStatus] | None = None,
+    overlaps: tuple[datetime, datetime] | None = None,
+) -> Select[tuple[Mission]]:
+    """Return the keyset query for one page of missions ordered by ``(start_time, id)``.
+
+    Every predicate on ``start_time`` is a plain range, so the planner can
+    walk ``ix_missions_time_range`` from the cursor position instead of
+    skipping an OFFSET's worth of rows. The keyset condition is spelled as
+    ``start_time >= t AND (start_time > t OR id > i)`` rather than a row-value
+    comparison so the range stays sargable on every backend.
+    """
+
+    statement = select(Mission).where(
+        *mission_filters(
+            start_from=start_from, start_to=start_to, statuses=statuses, overlaps=overlaps
+        )
+    )
+    if after is not None:
+        after_start, after_id = after
+        statement = statement.where(
+            and_(
+                Mission.start_time >= after_start,
+                or_(Mission.start_time > after_start, Mission.id > after_id),
+            )
+        )
+    return statement.order_by(Mission.start_time, Mission.id).limit(limit)
+
+
+def _indexed_overlaps(
+    db: Session,
+    index: MissionIntervalIndex,
+    window: tuple[datetime, datetime],
+    *,
+    limit: int,
+    after: tuple[datetime, uuid.UUID] | None,
+    start_from: datetime | None,
+    start_to: datetime | None,
+    statuses: list[MissionStatus] | None,
+) -> list[Mission]:
+    """Resolve an overlap page from the interval index, fetching only the rows returned.
+
+    Keys come back in ``(start_time, id)`` order, so the cursor and start
+    window are applied before touching the database. Rows are then loaded by
+    primary key in chunks until the page is full, which takes a single query
+    unless a status filter discards some of them. Index keys are naive UTC,
+    so bounds carrying a UTC offset are converted before comparing.
+    """
+
+    if start_from is not None:
+        start_from = utc_naive(start_from)
+    if start_to is not None:
+        start_to = utc_naive(start_to)
+    keys = [
+        key
+        for key in index.query(db, *window)
+        if (after is None or key > after)
+        and (start_from is None or key[0] >= start_from)
+        and (start_to is None or key[0] < start_to)
+    ]
+    missions: list[Mission] = []
+    for offset in range(0, len(keys), limit):
+        chunk = [mission_id for _, mission_id in keys[offset : offset + limit]]
+        statement = select(Mission).where(Mission.id.in_(chunk))
+        if statuses:
+            statement = statement.where(Mission.status.in_(statuses))
+        found = {mission.id: mission for mission in db.scalars(statement)}
+        missions.extend(found[mission_id] for mission_id in chunk if mission_id in found)
+        if len(missions) >= limit:
+            break
+    return missions[:limit]
+
+
+@router.get("", response_model=MissionPage)
+def list_missions(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None, description="Opaque cursor returned as next_cursor."),
+    start_from: datetime | None = Query(None, description="Only missions starting at or after this time."),
+    start_to: datetime | None = Query(None, description="Only missions starting before this time."),
+    status_filter: list[MissionStatus] | None = Query(None, alias="status"),
+    overlaps: str | None = Query(
+        None, description="Only missions overlapping an ISO 8601 '<start>/<end>' interval."
+    ),
+    db: Session = Depends(get_db),
+    index: MissionIntervalIndex | None = Depends(get_mission_interval_index),
+) -> JSONBytesResponse:
+    """Return missions ordered by start time, one keyset page at a time.
+
+    ``overlaps`` queries are answered by the in-memory interval index when it
+    is enabled and by a range query on ``ix_missions_time_range`` otherwise.
+    """
+
+    after = _decode_mission_cursor(cursor) if cursor else None
+    window = _parse_window(overlaps) if overlaps else None
+    if window is not None and index is not None:
+        missions = _indexed_overlaps(
+            db,
+            index,
+            window,
+            limit=limit + 1,
+            after=after,
+            start_from=start_from,
+            start_to=start_to,
+            statuses=status_filter,
+        )
+    else:
+        statement = list_missions_statement(
+            limit=limit + 1,
+            after=after,
+            start_from=start_from,
+            start_to=start_to,
+            statuses=status_filter,
+            overlaps=window,
+        )
+        missions = list(db.scalars(statement))
+    next_cursor = None
+    if len(missions) > limit:
+        missions = missions[:limit]
+        last = missions[-1]
+        next_cursor = encode_cursor(last.start_time.isoformat(), last.id.hex)
+    return serialized(MISSION_PAGE, {"items": missions, "next_cursor": next_cursor})
+
+
+@router.post("", response_model=MissionRead, status_code=status.HTTP_201_CREATED)
+def create_mission(mission_in: MissionCreate, db: Session = Depends(get_db)) -> JSONBytesResponse:
+    """Create a mission."""
+
+    mission = Mission(**mission_in.model_dump())
+    db.add(mission)
+    db.commit()
+    db.refresh(mission)
+    logger.info("Mission created: %s", mission.id)
+    return serialized(MISSION_READ, mission, status_code=status.HTTP_201_CREATED)
+
+
+@router.post(":import", response_model=MissionImportReport)
+async def import_missions(
+    request: Request,
+    db: Session = Depends(get_db),
+    index: MissionIntervalIndex | None = Depends(get_mission_interval_index),
+) -> MissionImportReport:
+    """Bulk-create missions from a streamed NDJSON body, one mission per line.
+
+    Rows are validated with ``MissionCreate`` and inserted in batches as the
+    body arrives. Invalid rows are reported by line number in the response
+    and do not stop the rest of the upload.
+    """
+
+    importer = MissionImporter(db, get_settings().mission_import_batch_size, index)
+    return await importer.run(request.stream())
+
+
+@router.post(":transition", response_model=MissionTransitionReport)
+def transition_missions(
+    request: MissionTransitionRequest, db: Session = Depends(get_db)
+) -> MissionTransitionReport:
+    """Move many missions to one status with a set-based ``UPDATE`` per batch.
+
+    Missions whose current status does not allow the transition are listed
+    as ``rejected``; unknown ids are listed as ``not_found``.
+    """
+
+    result = Mission.bulk_transition(db, request.ids, request.status)
+    db.commit()
+    logger.info(
+        "Bulk transition to %s: %d updated, %d rejected, %d not found",
+        request.status.value,
+        len(result.updated),
+        len(result.rejected),
+        len(result.not_found),
+    )
+    return MissionTransitionReport(status=request.status, **result._asdict())
+
+
+@router.post(":conflicts", response_model=MissionConflictReport)
+def find_conflicts(
+    request: MissionConflictRequest, db: Session = Depends(get_db)
+) -> MissionConflictReport:
+    """Report every pair of overlapping missions among those matching the filter.
+
+    Only ids and time ranges are loaded; overlaps are found with one sort
+    and a sweep rather than a pairwise comparison. At most ``max_pairs``
+    pairs are listed, but ``pair_count`` and ``clusters`` are always complete.
+    """
+
+    ids, report = find_mission_conflicts(
+        db,
+        mission_filters(
+            start_from=request.start_from, start_to=request.start_to, statuses=request.status
+        ),
+        request.max_pairs,
+    )
+    return MissionConflictReport(
+        missions=len(ids),
+        pair_count=report.pair_count,
+        pairs=[(ids[first], ids[second]) for first, second in report.pairs],
+        pairs_truncated=report.truncated,
+        clusters=[[ids[position] for position in cluster] for cluster in report.clusters],
+    )
+
+
+@router.get("/summary", response_model=list[MissionDaySummary])
+def summarize_missions(
+    start: date | None = Query(None, description="First day to include."),
+    end: date | None = Query(None, description="Day after the last one to include."),
+    db: Session = Depends(get_db),
+) -> list[MissionDaySummary]:
+    """Return mission counts per status for each day of start times.
+
+    Served from the ``mission_status_counts`` rollup, so the cost depends on
+    the number of days requested, not on the number of missions.
+    """
+
+    return [
+        MissionDaySummary(day=day, counts=counts, total=sum(counts.values()))
+        for day, counts in status_summary(db, start, end)
+    ]
+
+
+@router.get("/board", response_model=list[MissionBoardItem])
+def mission_board(
+    limit: int = Query(DEFAULT_BOARD_SIZE, ge=1, le=MAX_BOARD_SIZE),
+    start_from: datetime | None = Query(None, description="Only missions starting at or after this time."),
+    start_to: datetime | None = Query(None, description="Only missions starting before this time."),
+    status_filter: list[MissionStatus] | None = Query(None, alias="status"),
+    db: Session = Depends(get_db),
+    snapshot: MissionSnapshot | None = Depends(get_mission_snapshot),
+) -> JSONBytesResponse:
+    """Return compact mission rows ordered by ``(start_time, id)`` for board views.
+
+    With the snapshot enabled, rows come from the in-memory columnar copy and
+    may lag writes by up to ``MISSION_SNAPSHOT_MAX_AGE`` seconds; otherwise
+    the same columns are read with SQL.
+    """
+
+    if snapshot is not None:
+        rows = snapshot.read(
+            db, start_from=start_from, start_to=start_to, statuses=status_filter, limit=limit
+        )
+        return serialized(MISSION_BOARD, rows)
+    statement = (
+        select(Mission.id, Mission.title, Mission.start_time, Mission.end_time, Mission.status)
+        .where(*mission_filters(start_from=start_from, start_to=start_to, statuses=status_filter))
+        .order_by(Mission.start_time, Mission.id)
+        .limit(limit)
+    )
+    return serialized(MISSION_BOARD, db.execute(statement).all())
+
+
+def _decode_search_cursor(cursor: str) -> tuple[float, uuid.UUID]:
+    score, mission_id = decode_cursor(cursor, 2)
+    try:
+        return float(score), uuid.UUID(mission_id)
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
+
+@router.get("/search", response_model=MissionPage)
+def search_mission_text(
+    q: str = Query(..., min_length=1, max_length=MAX_SEARCH_QUERY_LENGTH, description="Words to look for."),
+    limit: int = Query(DEFAULT_SEARCH_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None, description="Opaque cursor returned as next_cursor."),
+    db: Session = Depends(get_db),
+) -> JSONBytesResponse:
+    """Return missions whose title or notes contain every word of ``q``, best match first.
+
+    Matches are ranked by relevance with title hits above notes hits; the
+    last word also matches as a prefix. Served from the full-text index
+    (FTS5 on SQLite, ``tsvector`` + GIN on PostgreSQL).
+    """
+
+    if not search_terms(q):
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail="Query has no words")
+    after = _decode_search_cursor(cursor) if cursor else None
+    hits = search_missions(db, q, after=after, limit=limit + 1)
+    next_cursor = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        last, score = hits[-1]
+        next_cursor = encode_cursor(score, last.id.hex)
+    return serialized(MISSION_PAGE, {"items": [mission for mission, _ in hits], "next_cursor": next_cursor})
+
+
+def _decode_change_position(cursor: str, skew: timedelta) -> ChangePosition:
+    """Decode a ``/changes`` cursor, or resume from a stream event id (a single change key)."""
+
+    values = decode_cursor(cursor, 2, 3)
+    try:
+        if len(values) == 2:
+            updated_at, mission_id = values
+            return ChangePosition.resume((datetime.fromisoformat(updated_at), uuid.UUID(mission_id)), skew)
+        floor_at, floor_id, seen = values
+        if len(seen) > CHANGE_MAX_SEEN:
+            raise ValueError("too many keys")
+        return ChangePosition(
+            (datetime.fromisoformat(floor_at), uuid.UUID(floor_id)),
+            frozenset((datetime.fromisoformat(at), uuid.UUID(key)) for at, key in seen),
+        )
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
+
+def _encode_change_position(position: ChangePosition) -> str:
+    assert position.floor is not None
+    floor_at, floor_id = position.floor
+    seen = [[updated_at.isoformat(), mission_id.hex] for updated_at, mission_id in sorted(position.seen)]
+    return encode_cursor(floor_at.isoformat(), floor_id.hex, seen)
+
+
+def _read_changes(
+    engine: Engine, position: ChangePosition | None, limit: int, skew: timedelta
+) -> tuple[list[Mission], ChangePosition, bool]:
+    # A session of its own, closed before returning: the request session
+    # would keep its connection checked out while a long-poll waits.
+    with Session(engine) as session:
+        return read_changes(session, position, limit, skew)
+
+
+@router.get("/changes", response_model=MissionChangePage)
+async def list_mission_changes(
+    since: str | None = Query(None, description="Opaque cursor returned as next_cursor."),
+    limit: int = Query(DEFAULT_CHANGES_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    wait: float = Query(0, ge=0, le=MAX_CHANGES_WAIT, description="Seconds to wait for a change."),
+    db: Session = Depends(get_db),
+    feed: MissionChangeFeed = Depends(get_mission_change_feed),
+) -> MissionChangePage:
+    """Return missions created or updated after ``since``, oldest change first.
+
+    Without ``since`` the feed starts at the oldest mission. With ``wait``
+    the request is held open until a change arrives or the wait runs out,
+    so clients can long-poll instead of re-reading whole listings. Deleted
+    missions do not appear in the feed.
+    """
+
+    position = _decode_change_position(since, feed.skew) if since else None
+    engine = db.get_bind()
+    if wait:
+        async with feed.subscribe(engine) as subscription:
+            missions, next_position, has_more = await run_in_threadpool(
+                _read_changes, engine, position, limit, feed.skew
+            )
+            if not missions:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(subscription.get(), wait)
+                missions, next_position, has_more = await run_in_threadpool(
+                    _read_changes, engine, position, limit, feed.skew
+                )
+    else:
+        missions, next_position, has_more = await run_in_threadpool(
+            _read_changes, engine, position, limit, feed.skew
+        )
+    # With nothing new the client's cursor is still exact, so it is handed back.
+    next_cursor = _encode_change_position(next_position) if missions else since
+    return MissionChangePage(
+        items=[MissionRead.model_validate(mission) for mission in missions],
+        next_cursor=next_cursor,
+        has_more=has_more,
+    )
+
+
+async def _change_events(
+    feed: MissionChangeFeed, engine: Engine, position: ChangePosition | None
+) -> AsyncIterator[bytes]:
+    async for change in feed.follow(engine, position, SSE_HEARTBEAT_SECONDS):
+        if change is None:
+            yield b": heartbeat\n\n"
+            continue
+        cursor = encode_cursor(change.updated_at.isoformat(), change.id.hex)
+        yield b"id: %s\nevent: mission\ndata: %s\n\n" % (cursor.encode("ascii"), change.data)
+
+
+@router.get("/changes/stream", response_class=StreamingResponse)
+async def stream_mission_changes(
+    request: Request,
+    since: str | None = Query(None, description="Opaque cursor to resume from."),
+    db: Session = Depends(get_db),
+    feed: MissionChangeFeed = Depends(get_mission_change_feed),
+) -> StreamingResponse:
+    """Push mission changes to the client as Server-Sent Events.
+
+    Each event carries a ``MissionRead`` and its feed cursor as the event id,
+    so reconnecting clients resume through ``Last-Event-ID`` (or ``since``)
+    after first receiving what they missed. An event id only names one
+    change, so resuming from it repeats the changes of the skew window
+    before it rather than risk missing a late commit. Without either, only
+    changes from now on are sent. All streams in a process share one
+    database poller, so an idle subscriber costs only its connection.
+    """
+
+    cursor = since or request.headers.get("last-event-id")
+    position = _decode_change_position(cursor, feed.skew) if cursor else None
+    return StreamingResponse(
+        _change_events(feed, db.get_bind(), position),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+_EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _accepts_gzip(request: Request) -> bool:
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "") not in {"q=0", "q=0.0", "q=0.00", "q=0.000"}
+    return False
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_missions(
+    request: Request,
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    start_from: datetime | None = Query(None, description="Only missions starting at or after this time."),
+    start_to: datetime | None = Query(None, description="Only missions starting before this time."),
+    status_filter: list[MissionStatus] | None = Query(None, alias="status"),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    """Stream every matching mission as NDJSON or CSV, ordered by start time.
+
+    The body is gzip-encoded on the fly when the client sends
+    ``Accept-Encoding: gzip``.
+    """
+
+    gzip = _accepts_gzip(request)
+    body = iter_mission_export(
+        db.get_bind(),
+        mission_filters(start_from=start_from, start_to=start_to, statuses=status_filter),
+        export_format,
+        gzip=gzip,
+    )
+    headers = {
+        "Content-Disposition": f'attachment; filename="missions.{export_format}"',
+        "Vary": "Accept-Encoding",
+    }
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=_EXPORT_MEDIA_TYPES[export_format], headers=headers)
+
+
+@router.get("/{mission_id}", response_model=MissionRead)
+def read_mission(mission_id: uuid.UUID, db: Session = Depends(get_db)) -> JSONBytesResponse:
+    """Return a single mission."""
+
+    return serialized(MISSION_READ, _mission_or_404(db, mission_id))
+
+
+@router.patch("/{mission_id}", response_model=MissionRead)
+def update_mission(
+    mission_id: uuid.UUID, mission_in: MissionUpdate, db: Session = Depends(get_db)
+) -> JSONBytesResponse:
+    """Update mission fields; status changes must follow the transition rules."""
+
+    mission = _mission_or_404(db, mission_id)
+    changes = mission_in.model_dump(exclude_unset=True)
+    target = changes.pop("status", None)
+
+    for field, value in changes.items():
+        setattr(mission, field, value)
+    if mission.start_time >= mission.end_time:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail="end_time must be after start_time",
+        )
+    if target is not None and target != mission.status:
+        try:
+            mission.transition_to(target)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+
+    db.commit()
+    db.refresh(mission)
+    return serialized(MISSION_READ, mission)
+
+
+@router.delete("/{mission_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_mission(mission_id: uuid.UUID, db: Session = Depends(get_db)) -> Response:
+    """Delete a mission."""
+
+    db.delete(_mission_or_404(db, mission_id))
+    db.commit()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+__all__ = ["list_missions_statement", "router"]
@@ -0,0 +1,82 @@
+"""Responses for bodies encoded ahead of time: schema serializers and fixed payloads."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, TypeVar
+
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+from ..schemas.serializers import dump_json
+
+T = TypeVar("T")
+
+
+class JSONBytesResponse(Response):
+    """``application/json`` response whose content is already-encoded JSON bytes.
+
+    Returning a ``Response`` makes FastAPI skip its own validation and
+    encoding of the return value; the route's ``response_model`` still
+    documents the body in the OpenAPI schema.
+    """
+
+    media_type = "application/json"
+
+
+def serialized(
+    adapter: TypeAdapter[T], value: Any, status_code: int = status.HTTP_200_OK
+) -> JSONBytesResponse:
+    """Encode ``value`` with ``adapter`` in one pass and wrap it in a response."""
+
+    return JSONBytesResponse(dump_json(adapter, value), status_code=status_code)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header value matches ``etag``.
+
+    Handles ``*``, comma-separated lists and weak validators (``W/"..."``),
+    which compare equal to the strong tag under RFC 9110's weak comparison.
+    """
+
+    if if_none_match == etag or if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+
+class CachedJSON:
+    """A fixed JSON payload encoded once, with its ETag and encoded headers.
+
+    The body, the ETag and the raw header pairs of the ``200`` and ``304``
+    responses are computed here. Each request gets a fresh response holding
+    its own copy of the header list, because middleware and FastAPI append
+    to a response's headers while sending it; serving one still costs no
+    encoding, hashing or header building.
+    """
+
+    __slots__ = ("content", "body", "etag", "_ok_headers", "_not_modified_headers")
+
+    def __init__(self, content: Any, cache_control: str) -> None:
+        self.body = json.dumps(content, separators=(",", ":")).encode("utf-8")
+        self.content = content
+        self.etag = f'"{hashlib.blake2b(self.body, digest_size=8).hexdigest()}"'
+        headers = {"ETag": self.etag, "Cache-Control": cache_control}
+        self._ok_headers = tuple(JSONBytesResponse(self.body, headers=headers).raw_headers)
+        self._not_modified_headers = tuple(
+            Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers).raw_headers
+        )
+
+    def respond(self, if_none_match: str | None) -> Response:
+        """Return a ``304`` response when ``if_none_match`` matches, else a ``200`` one."""
+
+        if if_none_match is not None and etag_matches(if_none_match, self.etag):
+            response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+            response.raw_headers = list(self._not_modified_headers)
+        else:
+            response = JSONBytesResponse(self.body)
+            response.raw_headers = list(self._ok_headers)
+        return response
+
+
+__all__ = ["CachedJSON", "JSONBytesResponse", "etag_matches", "serialized"]
@@ -1,18 +1,53 @@
-"""Health check endpoint."""
+"""Health, readiness and pool status endpoints."""
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from typing import Any
 
+from fastapi import APIRouter, Header, Response
+
+from app.api.responses import CachedJSON, JSONBytesResponse
+from app.db import get_async_engine, get_engine
+from app.db.pool import pool_status
+from app.db.readiness import get_readiness_probe
 
 router = APIRouter(tags=["health"])
 
+# Probes must always reach the service, so caches revalidate every time;
+# the body never changes, which makes each revalidation an empty 304.
+HEALTH_PAYLOAD = CachedJSON({"status": "ok"}, "no-cache")
+
+READY_HEADERS = {"Cache-Control": "no-store"}
+
 
-@router.get("/health", summary="Service liveness indicator")
-def get_health() -> dict[str, str]:
+@router.get(
+    "/health",
+    summary="Service liveness indicator",
+    responses={200: {"content": {"application/json": {}}}, 304: {"description": "Status unchanged"}},
+)
+async def get_health(if_none_match: str | None = Header(None)) -> Response:
     """Return a simple health status payload."""
 
-    return {"status": "ok"}
+    return HEALTH_PAYLOAD.respond(if_none_match)
+
+
+@router.get(
+    "/ready",
+    summary="Database readiness from the last background check",
+    responses={200: {"content": {"application/json": {}}}, 503: {"description": "Database unavailable"}},
+)
+async def get_ready() -> Response:
+    """Return the cached outcome of the latest database readiness check."""
+
+    status_code, body = get_readiness_probe().status()
+    return JSONBytesResponse(body, status_code=status_code, headers=READY_HEADERS)
+
+
+@router.get("/health/pool", summary="Database connection pool statistics")
+def get_pool_health() -> dict[str, Any]:
+    """Return occupancy and checkout wait metrics for both database pools."""
+
+    return {"sync": pool_status(get_engine()), "async": pool_status(get_async_engine())}
 
 
 __all__ = ["router"]
@@ -0,0 +1,23 @@
+"""Prometheus metrics endpoint."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Response
+
+from app.core.metrics import CONTENT_TYPE, REGISTRY
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get(
+    "/metrics",
+    summary="Request, database, password and token timings in Prometheus text format",
+    responses={200: {"content": {CONTENT_TYPE: {}}}},
+)
+async def get_metrics() -> Response:
+    """Return every registered metric in the Prometheus text exposition format."""
+
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+__all__ = ["router"]
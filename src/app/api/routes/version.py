@@ -2,20 +2,44 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Header, Response
 
-from app.core.config import get_app_version
+from app.api.responses import CachedJSON
+from app.core.config import cached_app_version
+from app.settings import get_settings
 
 
 router = APIRouter(tags=["version"])
 
+# Clients may reuse the version briefly; after that they revalidate with
+# ``If-None-Match`` and get an empty 304 until a deployment changes it.
+VERSION_CACHE_CONTROL = "public, max-age=60"
 
-@router.get("/version", summary="Application version information")
-def read_version() -> dict[str, str]:
-    """Return the semantic version string for the running application."""
+_payload: CachedJSON | None = None
 
-    return {"version": get_app_version()}
 
+def _version_payload() -> CachedJSON:
+    global _payload
+    version = get_settings().app_version or cached_app_version()
+    payload = _payload
+    if payload is None or payload.content["version"] != version:
+        payload = _payload = CachedJSON({"version": version}, VERSION_CACHE_CONTROL)
+    return payload
 
-__all__ = ["router"]
 
+@router.get(
+    "/version",
+    summary="Application version information",
+    responses={200: {"content": {"application/json": {}}}, 304: {"description": "Version unchanged"}},
+)
+async def read_version(if_none_match: str | None = Header(None)) -> Response:
+    """Return the semantic version string for the running application.
+
+    ``APP_VERSION`` wins when set; otherwise the version comes from
+    ``pyproject.toml``, re-read only when the file changes.
+    """
+
+    return _version_payload().respond(if_none_match)
+
+
+__all__ = ["router"]
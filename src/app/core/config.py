@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import threading
+import time
 from pathlib import Path
 from typing import Any, Mapping
 
@@ -9,6 +12,10 @@ import tomllib
 
 APP_VERSION = "0.1.0"
 
+# Seconds between checks of pyproject.toml's modification time by
+# :func:`cached_app_version`.
+VERSION_CHECK_INTERVAL = 1.0
+
 
 def _extract_version(config: Mapping[str, Any]) -> str | None:
     """Return the application version string from a parsed pyproject mapping."""
@@ -47,11 +54,15 @@ def _load_pyproject(path: Path) -> Mapping[str, Any] | None:
         return None
 
 
+def _default_pyproject_path() -> Path:
+    return Path(__file__).resolve().parents[4] / "pyproject.toml"
+
+
 def get_app_version(pyproject_path: Path | None = None) -> str:
     """Resolve the application version from pyproject metadata or defaults."""
 
     if pyproject_path is None:
-        pyproject_path = Path(__file__).resolve().parents[4] / "pyproject.toml"
+        pyproject_path = _default_pyproject_path()
 
     config = _load_pyproject(pyproject_path)
     if config:
@@ -62,5 +73,66 @@ def get_app_version(pyproject_path: Path | None = None) -> str:
     return APP_VERSION
 
 
-__all__ = ["APP_VERSION", "get_app_version"]
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class _VersionCache:
+    """Last resolved version plus the pyproject.toml mtime it was read at."""
+
+    def __init__(self, pyproject_path: Path | None = None) -> None:
+        self._lock = threading.Lock()
+        self._path = pyproject_path
+        self._mtime_ns: int | None = None
+        self._checked_at: float | None = None
+        self._version = APP_VERSION
+
+    def get(self) -> str:
+        now = time.monotonic()
+        checked_at = self._checked_at
+        if checked_at is not None and now - checked_at < VERSION_CHECK_INTERVAL:
+            return self._version
+        with self._lock:
+            if self._path is None:
+                self._path = _default_pyproject_path()
+            mtime_ns = _mtime_ns(self._path)
+            if self._checked_at is None or mtime_ns != self._mtime_ns:
+                self._version = get_app_version(self._path)
+                self._mtime_ns = mtime_ns
+            self._checked_at = now
+            return self._version
+
+
+_version_cache = _VersionCache()
+
+
+def cached_app_version() -> str:
+    """Return :func:`get_app_version`, re-reading pyproject.toml only when it changes.
+
+    The file is parsed on the first call and again only when its
+    modification time differs; that time is checked at most once every
+    :data:`VERSION_CHECK_INTERVAL` seconds, so frequent callers mostly pay
+    for a clock read.
+    """
+
+    return _version_cache.get()
+
+
+def reset_app_version_cache(pyproject_path: Path | None = None) -> None:
+    """Forget the cached version, optionally reading ``pyproject_path`` from now on."""
+
+    global _version_cache
+    _version_cache = _VersionCache(pyproject_path)
+
+
+__all__ = [
+    "APP_VERSION",
+    "VERSION_CHECK_INTERVAL",
+    "cached_app_version",
+    "get_app_version",
+    "reset_app_version_cache",
+]
 
@@ -0,0 +1,353 @@
+"""In-process metrics rendered in the Prometheus text exposition format.
+
+Observations go into per-thread shards: each thread (the event loop, every
+threadpool worker) increments its own list without taking a lock, and a
+scrape merges the shards. Hot paths therefore pay a thread-local lookup and
+two list increments; only creating a shard or a labelled series locks.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import Any
+
+# Seconds; covers sub-millisecond queries up to slow bcrypt and long requests.
+DURATION_BUCKETS: tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+# Seconds; for operations that usually finish within microseconds.
+FAST_BUCKETS: tuple[float, ...] = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.1,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Sharded:
+    """Per-thread lists of numbers that are summed when read.
+
+    Each shard is written only by the thread that owns it, so increments
+    need no lock. Shards of finished threads are kept so their counts are
+    not lost; worker threads are long-lived, so their number stays small.
+    """
+
+    __slots__ = ("_local", "_shards", "_lock", "_width")
+
+    def __init__(self, width: int) -> None:
+        self._local = threading.local()
+        self._shards: list[list[Any]] = []
+        self._lock = threading.Lock()
+        self._width = width
+
+    def _shard(self) -> list[Any]:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: list[Any] = [0] * self._width
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def _merged(self) -> list[Any]:
+        with self._lock:
+            shards = list(self._shards)
+        totals: list[Any] = [0] * self._width
+        for shard in shards:
+            for index, value in enumerate(shard):
+                totals[index] += value
+        return totals
+
+
+class ShardedCounter(_Sharded):
+    """Monotonic counter with per-thread shards."""
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__(1)
+
+    def inc(self, amount: float = 1) -> None:
+        """Add ``amount`` to the counter."""
+
+        self._shard()[0] += amount
+
+    @property
+    def value(self) -> float:
+        """Return the sum over all shards."""
+
+        return self._merged()[0]
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_started")
+
+    def __init__(self, histogram: ShardedHistogram) -> None:
+        self._histogram = histogram
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._histogram.observe(time.perf_counter() - self._started)
+
+
+def _cumulative(buckets: tuple[float, ...], counts: list[int], total: float) -> dict[str, Any]:
+    """Turn per-bucket ``counts`` (overflow last) into a histogram snapshot."""
+
+    cumulative: dict[str, int] = {}
+    running = 0
+    for bound, count in zip(buckets, counts):
+        running += count
+        cumulative[repr(bound)] = running
+    running += counts[len(buckets)]
+    cumulative["+Inf"] = running
+    return {"buckets": cumulative, "count": running, "sum": float(total)}
+
+
+class Histogram:
+    """Fixed-bucket histogram with cumulative, Prometheus-style bucket counts.
+
+    Observations take a lock, which is fine for rare events such as pool
+    checkouts; hot paths use :class:`ShardedHistogram`, which shares the
+    bucketing and snapshot shape.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DURATION_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return cumulative bucket counts plus the running sum and count."""
+
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        return _cumulative(self.buckets, counts, total)
+
+
+class ShardedHistogram(_Sharded):
+    """:class:`Histogram` with per-thread shards instead of a lock.
+
+    A shard holds the same per-bucket and overflow counts followed by the
+    running sum.
+    """
+
+    __slots__ = ("buckets",)
+
+    def __init__(self, buckets: tuple[float, ...] = DURATION_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(len(self.buckets) + 2)
+
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+
+        shard = self._shard()
+        shard[bisect.bisect_left(self.buckets, value)] += 1
+        shard[-1] += value
+
+    def time(self) -> _Timer:
+        """Return a context manager observing the seconds spent inside it."""
+
+        return _Timer(self)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return cumulative bucket counts plus the running sum and count."""
+
+        totals = self._merged()
+        return _cumulative(self.buckets, totals[:-1], totals[-1])
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Family:
+    """A named metric with one child per distinct combination of label values."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._children: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self) -> Any:  # pragma: no cover - overridden
+        raise NotImplementedError
+
+    def labels(self, *values: str) -> Any:
+        """Return the child for ``values``, creating it on first use."""
+
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _samples(self, values: tuple[str, ...], child: Any) -> list[str]:  # pragma: no cover
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        """Return this family's exposition lines."""
+
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in sorted(self._children.items()):
+            lines.extend(self._samples(values, child))
+        return lines
+
+
+class CounterFamily(_Family):
+    """Labelled :class:`ShardedCounter` children."""
+
+    kind = "counter"
+
+    def _new_child(self) -> ShardedCounter:
+        return ShardedCounter()
+
+    def _samples(self, values: tuple[str, ...], child: ShardedCounter) -> list[str]:
+        return [f"{self.name}{_labels(self.labelnames, values)} {child.value!r}"]
+
+
+class HistogramFamily(_Family):
+    """Labelled :class:`ShardedHistogram` children sharing one bucket layout."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...] = DURATION_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+
+    def _new_child(self) -> ShardedHistogram:
+        return ShardedHistogram(self.buckets)
+
+    def _samples(self, values: tuple[str, ...], child: ShardedHistogram) -> list[str]:
+        snapshot = child.snapshot()
+        lines = []
+        for bound, count in snapshot["buckets"].items():
+            le = f'le="{bound}"'
+            lines.append(f"{self.name}_bucket{_labels(self.labelnames, values, le)} {count}")
+        lines.append(f"{self.name}_sum{_labels(self.labelnames, values)} {snapshot['sum']!r}")
+        lines.append(f"{self.name}_count{_labels(self.labelnames, values)} {snapshot['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """The set of metric families exposed by one process."""
+
+    def __init__(self) -> None:
+        self._families: dict[str, _Family] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, family: _Family) -> Any:
+        with self._lock:
+            existing = self._families.get(family.name)
+            if existing is not None:
+                if type(existing) is not type(family) or existing.labelnames != family.labelnames:
+                    raise ValueError(f"Metric {family.name} is already registered differently")
+                return existing
+            self._families[family.name] = family
+            return family
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> CounterFamily:
+        """Return the counter family ``name``, registering it on first use."""
+
+        return self._register(CounterFamily(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DURATION_BUCKETS,
+    ) -> HistogramFamily:
+        """Return the histogram family ``name``, registering it on first use."""
+
+        return self._register(HistogramFamily(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Return every family in the Prometheus text exposition format."""
+
+        with self._lock:
+            families = sorted(self._families.values(), key=lambda family: family.name)
+        lines: list[str] = []
+        for family in families:
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "codex_http_request_duration_seconds",
+    "Time from receiving a request to the application returning, by route template.",
+    ("method", "route", "status"),
+)
+DB_QUERY_SECONDS = REGISTRY.histogram(
+    "codex_db_query_duration_seconds",
+    "Time spent executing SQL statements, by engine and statement verb.",
+    ("engine", "operation"),
+)
+DB_QUERY_ERRORS = REGISTRY.counter(
+    "codex_db_query_errors_total",
+    "SQL statements that raised, by engine and statement verb.",
+    ("engine", "operation"),
+)
+PASSWORD_SECONDS = REGISTRY.histogram(
+    "codex_password_duration_seconds",
+    "Time to hash or verify a password, including waiting for a hashing worker.",
+    ("operation",),
+)
+TOKEN_DECODE_SECONDS = REGISTRY.histogram(
+    "codex_token_decode_duration_seconds",
+    "Time to decode a bearer token, by whether it was cached, verified or rejected.",
+    ("outcome",),
+    FAST_BUCKETS,
+)
+
+
+__all__ = [
+    "CONTENT_TYPE",
+    "DB_QUERY_ERRORS",
+    "DB_QUERY_SECONDS",
+    "DURATION_BUCKETS",
+    "FAST_BUCKETS",
+    "HTTP_REQUEST_SECONDS",
+    "PASSWORD_SECONDS",
+    "REGISTRY",
+    "TOKEN_DECODE_SECONDS",
+    "CounterFamily",
+    "Histogram",
+    "HistogramFamily",
+    "MetricsRegistry",
+    "ShardedCounter",
+    "ShardedHistogram",
+]
@@ -1,6 +1,27 @@
 """Database utilities."""
 
 from .base import Base
-from .session import SessionLocal, engine, get_db, session_scope
+from .session import (
+    AsyncSessionLocal,
+    SessionLocal,
+    async_session_scope,
+    dispose_engines,
+    get_async_db,
+    get_async_engine,
+    get_db,
+    get_engine,
+    session_scope,
+)
 
-__all__ = ["Base", "SessionLocal", "engine", "get_db", "session_scope"]
+__all__ = [
+    "AsyncSessionLocal",
+    "Base",
+    "SessionLocal",
+    "async_session_scope",
+    "dispose_engines",
+    "get_async_db",
+    "get_async_engine",
+    "get_db",
+    "get_engine",
+    "session_scope",
+]
@@ -0,0 +1,28 @@
+"""Dialect-specific statement helpers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+_INSERT_CONSTRUCTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def dialect_insert(dialect_name: str, table: Any) -> Any:
+    """Return an ``INSERT`` construct supporting ``ON CONFLICT`` for ``dialect_name``.
+
+    Raises ``NotImplementedError`` for dialects without ``ON CONFLICT`` support.
+    """
+
+    try:
+        construct = _INSERT_CONSTRUCTS[dialect_name]
+    except KeyError as exc:
+        raise NotImplementedError(f"ON CONFLICT inserts are not supported on {dialect_name}") from exc
+    return construct(table)
+
+
+__all__ = ["dialect_insert"]
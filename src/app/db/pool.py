@@ -0,0 +1,115 @@
+"""Connection pool configuration and live pool metrics."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.engine import URL, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection, QueuePool
+
+from ..core.metrics import Histogram
+from ..settings import Settings
+
+WAIT_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class PoolMetrics:
+    """Checkout wait times and timeout counts for one connection pool."""
+
+    def __init__(self) -> None:
+        self.checkout_wait = Histogram(WAIT_BUCKETS)
+        self.timeouts = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the wait-time histogram and timeout count."""
+
+        return {"checkout_wait_seconds": self.checkout_wait.snapshot(), "timeouts": self.timeouts}
+
+
+class _TimedCheckoutMixin:
+    """Time every checkout so saturation shows up as wait latency."""
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            return super().connect()  # type: ignore[misc]
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.checkout_wait.observe(time.perf_counter() - started)
+
+    def recreate(self) -> Any:
+        pool = super().recreate()  # type: ignore[misc]
+        pool.metrics = self.metrics
+        return pool
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    """``QueuePool`` that records checkout wait times."""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` that records checkout wait times."""
+
+
+def _is_memory_sqlite(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def pool_options(url: URL, settings: Settings, *, asyncio: bool = False) -> dict[str, Any]:
+    """Return ``create_engine`` pool arguments appropriate for ``url``.
+
+    In-memory SQLite keeps SQLAlchemy's single-connection pool because every
+    new connection would see an empty database; other URLs get a timed queue
+    pool sized from settings.
+    """
+
+    options: dict[str, Any] = {"pool_pre_ping": settings.db_pool_pre_ping}
+    if _is_memory_sqlite(url):
+        return options
+    options.update(
+        poolclass=TimedAsyncAdaptedQueuePool if asyncio else TimedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+    )
+    return options
+
+
+def pool_status(engine: Engine | AsyncEngine) -> dict[str, Any]:
+    """Return live occupancy figures and checkout metrics for ``engine``."""
+
+    pool = engine.pool
+    status: dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+    metrics = getattr(pool, "metrics", None)
+    if isinstance(metrics, PoolMetrics):
+        status.update(metrics.snapshot())
+    return status
+
+
+__all__ = [
+    "Histogram",
+    "PoolMetrics",
+    "TimedAsyncAdaptedQueuePool",
+    "TimedQueuePool",
+    "pool_options",
+    "pool_status",
+]
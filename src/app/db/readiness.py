@@ -0,0 +1,142 @@
+"""Background database readiness probe whose latest result is served as-is."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from contextlib import suppress
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..settings import get_settings
+from .pool import pool_status
+
+logger = logging.getLogger(__name__)
+
+# A result older than this many intervals means the probe loop itself is stuck.
+STALE_AFTER_INTERVALS = 3
+
+READY = 200
+UNAVAILABLE = 503
+
+
+def _encode(content: dict[str, Any]) -> bytes:
+    return json.dumps(content, separators=(",", ":")).encode("utf-8")
+
+
+class ReadinessProbe:
+    """Check the database every ``interval`` seconds and keep the last answer.
+
+    Each check takes a connection from the asyncio engine's pool, runs
+    ``SELECT 1`` and records its latency alongside the pool occupancy. The
+    outcome is encoded once, so answering a probe only compares a timestamp
+    and hands back ready-made bytes: it never touches the pool or waits
+    behind request traffic, however busy the database is.
+    """
+
+    def __init__(self, interval: float, timeout: float) -> None:
+        self.interval = interval
+        self.timeout = timeout
+        self.stale_after = interval * STALE_AFTER_INTERVALS
+        self.result: dict[str, Any] | None = None
+        self._checked = 0.0
+        self._current = (UNAVAILABLE, _encode({"status": "starting"}))
+        self._stale: tuple[int, bytes] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def check(self, engine: AsyncEngine) -> dict[str, Any]:
+        """Run one check against ``engine`` and cache its result."""
+
+        started = time.perf_counter()
+        error = None
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+        except TimeoutError:
+            error = f"no answer within {self.timeout:g}s"
+        except Exception as exc:
+            error = type(exc).__name__
+            logger.warning("Database readiness check failed: %s", exc)
+        latency_ms = (time.perf_counter() - started) * 1000
+
+        result: dict[str, Any] = {
+            "status": "ready" if error is None else "unavailable",
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "latency_ms": round(latency_ms, 3),
+            "pool": pool_status(engine),
+        }
+        if error is not None:
+            result["error"] = error
+        self.result = result
+        self._checked = time.monotonic()
+        self._current = (READY if error is None else UNAVAILABLE, _encode(result))
+        self._stale = None
+        return result
+
+    def status(self) -> tuple[int, bytes]:
+        """Return the HTTP status and encoded body of the latest check.
+
+        Before the first check finishes, and once the last one is older than
+        ``stale_after`` seconds, the probe reports itself unavailable.
+        """
+
+        if self.result is None or time.monotonic() - self._checked <= self.stale_after:
+            return self._current
+        if self._stale is None:
+            self._stale = (UNAVAILABLE, _encode({**self.result, "status": "stale"}))
+        return self._stale
+
+    async def run(self, engine: AsyncEngine) -> None:
+        """Check ``engine`` now and then every ``interval`` seconds until cancelled."""
+
+        while True:
+            await self.check(engine)
+            await asyncio.sleep(self.interval)
+
+    def start(self, engine: AsyncEngine) -> None:
+        """Start the background loop unless it is already running."""
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(engine))
+
+    async def stop(self) -> None:
+        """Cancel the background loop and wait for it to finish."""
+
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+
+_probe: ReadinessProbe | None = None
+
+
+def get_readiness_probe() -> ReadinessProbe:
+    """Return the process-wide readiness probe configured from settings."""
+
+    global _probe
+    if _probe is None:
+        settings = get_settings()
+        _probe = ReadinessProbe(settings.ready_check_interval, settings.ready_check_timeout)
+    return _probe
+
+
+def reset_readiness_probe() -> None:
+    """Discard the process-wide probe so it is rebuilt on next use."""
+
+    global _probe
+    _probe = None
+
+
+__all__ = [
+    "ReadinessProbe",
+    "get_readiness_probe",
+    "reset_readiness_probe",
+]
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
-from typing import Generator
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator
 
 from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from ..settings import get_settings
+from .pool import pool_options
+from .sqlite import apply_sqlite_profile
+from .timing import time_queries
+
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
 
 
 def _create_engine() -> Engine:
@@ -19,11 +31,114 @@ def _create_engine() -> Engine:
     connect_args = {}
     if settings.database_url.startswith("sqlite"):  # pragma: no cover - branch deterministic
         connect_args["check_same_thread"] = False
-    return create_engine(settings.database_url, connect_args=connect_args, future=True)
+    engine = create_engine(
+        settings.database_url,
+        connect_args=connect_args,
+        future=True,
+        **pool_options(make_url(settings.database_url), settings),
+    )
+    if settings.sqlite_tuning and engine.dialect.name == "sqlite":
+        apply_sqlite_profile(engine, settings)
+    time_queries(engine, "sync")
+    return engine
+
+
+def async_database_url(database_url: str) -> str:
+    """Return ``database_url`` rewritten to use the matching asyncio driver.
+
+    ``sqlite`` URLs use aiosqlite and ``postgresql`` URLs use asyncpg. URLs that
+    already name any other driver are returned unchanged.
+    """
+
+    url = make_url(database_url)
+    async_driver = _ASYNC_DRIVERS.get(url.drivername)
+    if async_driver is None:
+        return database_url
+    return url.set(drivername=async_driver).render_as_string(hide_password=False)
 
 
-engine: Engine = _create_engine()
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+def _create_async_engine() -> AsyncEngine:
+    """Instantiate the asyncio SQLAlchemy engine based on runtime settings."""
+
+    settings = get_settings()
+    database_url = async_database_url(settings.database_url)
+    engine = create_async_engine(
+        database_url,
+        **pool_options(make_url(database_url), settings, asyncio=True),
+    )
+    if settings.sqlite_tuning and engine.dialect.name == "sqlite":
+        apply_sqlite_profile(engine.sync_engine, settings)
+    time_queries(engine.sync_engine, "async")
+    return engine
+
+
+# Engines and session factories are built on first use rather than at import
+# time, so importing the application (workers, tests, Alembic, CLI tools)
+# does not read settings or set up connection pools it may never use.
+_engine: Engine | None = None
+_session_factory: sessionmaker[Session] | None = None
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """Return the process-wide engine, creating it from settings on first use."""
+
+    global _engine, _session_factory
+    if _session_factory is None:
+        with _lock:
+            if _session_factory is None:
+                _engine = _create_engine()
+                _session_factory = sessionmaker(bind=_engine, autoflush=False, autocommit=False, future=True)
+    assert _engine is not None
+    return _engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """Return the process-wide asyncio engine, creating it from settings on first use."""
+
+    global _async_engine, _async_session_factory
+    if _async_session_factory is None:
+        with _lock:
+            if _async_session_factory is None:
+                _async_engine = _create_async_engine()
+                _async_session_factory = async_sessionmaker(
+                    bind=_async_engine, autoflush=False, expire_on_commit=False
+                )
+    assert _async_engine is not None
+    return _async_engine
+
+
+def SessionLocal() -> Session:  # noqa: N802 - called like the sessionmaker it replaced
+    """Open a session on :func:`get_engine`."""
+
+    if _session_factory is None:
+        get_engine()
+    assert _session_factory is not None
+    return _session_factory()
+
+
+def AsyncSessionLocal() -> AsyncSession:  # noqa: N802 - called like the sessionmaker it replaced
+    """Open an asyncio session on :func:`get_async_engine`."""
+
+    if _async_session_factory is None:
+        get_async_engine()
+    assert _async_session_factory is not None
+    return _async_session_factory()
+
+
+async def dispose_engines() -> None:
+    """Close the pools of whichever engines were created and forget them."""
+
+    global _engine, _session_factory, _async_engine, _async_session_factory
+    with _lock:
+        engine, async_engine = _engine, _async_engine
+        _engine = _session_factory = _async_engine = _async_session_factory = None
+    if engine is not None:
+        engine.dispose()
+    if async_engine is not None:
+        await async_engine.dispose()
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -36,6 +151,16 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield an asyncio database session for FastAPI dependencies."""
+
+    db = AsyncSessionLocal()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
 @contextmanager
 def session_scope() -> Generator[Session, None, None]:
     """Provide a transactional scope around a series of operations."""
@@ -51,4 +176,30 @@ def session_scope() -> Generator[Session, None, None]:
         session.close()
 
 
-__all__ = ["engine", "SessionLocal", "get_db", "session_scope"]
+@asynccontextmanager
+async def async_session_scope() -> AsyncGenerator[AsyncSession, None]:
+    """Provide an asyncio transactional scope around a series of operations."""
+
+    session = AsyncSessionLocal()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+__all__ = [
+    "get_engine",
+    "SessionLocal",
+    "get_db",
+    "session_scope",
+    "get_async_engine",
+    "AsyncSessionLocal",
+    "async_database_url",
+    "dispose_engines",
+    "get_async_db",
+    "async_session_scope",
+]
@@ -0,0 +1,45 @@
+"""Opt-in SQLite performance profile applied to every new connection."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..settings import Settings
+
+
+def sqlite_pragmas(settings: Settings) -> list[str]:
+    """Return the PRAGMA statements making up the configured profile."""
+
+    return [
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA mmap_size={settings.sqlite_mmap_size}",
+        f"PRAGMA cache_size={settings.sqlite_cache_size}",
+        f"PRAGMA busy_timeout={settings.sqlite_busy_timeout}",
+        f"PRAGMA temp_store={settings.sqlite_temp_store}",
+    ]
+
+
+def apply_sqlite_profile(engine: Engine, settings: Settings) -> None:
+    """Run the profile's PRAGMAs on each connection ``engine`` opens.
+
+    Works for both sync engines and the ``sync_engine`` of an async engine,
+    since the aiosqlite adapter exposes a DB-API compatible cursor.
+    """
+
+    pragmas = sqlite_pragmas(settings)
+
+    @event.listens_for(engine, "connect")
+    def _configure(dbapi_connection: Any, _record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+__all__ = ["apply_sqlite_profile", "sqlite_pragmas"]
@@ -0,0 +1,57 @@
+"""Statement timing recorded into the process metrics registry."""
+
+from __future__ import annotations
+
+import time
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..core.metrics import DB_QUERY_ERRORS, DB_QUERY_SECONDS
+
+# Key in ``Connection.info`` holding the start times of in-flight statements.
+_STARTED = "codex_query_started"
+
+_VERBS = frozenset({"select", "insert", "update", "delete", "with", "pragma", "create", "drop", "alter"})
+
+
+@lru_cache(maxsize=1024)
+def statement_operation(statement: str) -> str:
+    """Return the lower-cased leading SQL verb of ``statement``, or ``"other"``.
+
+    The label set stays small however many distinct statements run, and the
+    compiled statements SQLAlchemy caches are the same strings every time.
+    """
+
+    verb = statement.lstrip(" \t\r\n(").split(None, 1)[:1]
+    operation = verb[0].lower() if verb else ""
+    return operation if operation in _VERBS else "other"
+
+
+def time_queries(engine: Engine, label: str) -> None:
+    """Record how long every statement ``engine`` executes takes, labelled ``label``.
+
+    Works for both sync engines and the ``sync_engine`` of an async engine,
+    since the cursor events fire around the DB-API call in either case.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _started(conn: Any, _cursor: Any, _statement: str, _params: Any, _context: Any, _many: bool) -> None:
+        conn.info.setdefault(_STARTED, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _finished(conn: Any, _cursor: Any, statement: str, _params: Any, _context: Any, _many: bool) -> None:
+        elapsed = time.perf_counter() - conn.info[_STARTED].pop()
+        DB_QUERY_SECONDS.labels(label, statement_operation(statement)).observe(elapsed)
+
+    @event.listens_for(engine, "handle_error")
+    def _failed(context: Any) -> None:
+        started = context.connection.info.get(_STARTED) if context.connection is not None else None
+        if started:
+            started.pop()
+        DB_QUERY_ERRORS.labels(label, statement_operation(context.statement or "")).inc()
+
+
+__all__ = ["statement_operation", "time_queries"]
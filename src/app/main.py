@@ -2,26 +2,93 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from typing import Any
 
 from fastapi import FastAPI
 
-from .api import auth_router, health_router, version_router
+from .api import (
+    RequestMetricsMiddleware,
+    auth_router,
+    health_router,
+    metrics_router,
+    missions_router,
+    version_router,
+)
+from .core.config import APP_VERSION, get_app_version
+from .db import dispose_engines, get_async_engine, get_engine
+from .db.readiness import get_readiness_probe
+from .missions import shutdown_mission_change_feed
+from .security import (
+    get_password_service,
+    get_revocation_store,
+    run_revocation_compactor,
+    shutdown_password_rehasher,
+    shutdown_password_service,
+)
 from .settings import get_settings
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Prepare process-wide resources and release them when the application stops.
+
+    Work that importing the application used to do (resolving the version,
+    building the database engines) happens here, once per worker, before the
+    first request is accepted.
+    """
+
+    settings = get_settings()
+    app.version = settings.app_version or get_app_version()
+    get_engine()
+    readiness = get_readiness_probe()
+    readiness.start(get_async_engine())
+    get_password_service()
+    compactor: asyncio.Task[None] | None = None
+    if settings.auth_revocation_compact_interval > 0:
+        compactor = asyncio.create_task(
+            run_revocation_compactor(
+                get_revocation_store(), settings.auth_revocation_compact_interval
+            )
+        )
+    try:
+        yield
+    finally:
+        await readiness.stop()
+        if compactor is not None:
+            compactor.cancel()
+            with suppress(asyncio.CancelledError):
+                await compactor
+        await shutdown_mission_change_feed()
+        await shutdown_password_rehasher()
+        shutdown_password_service()
+        await dispose_engines()
+
+
 def create_app() -> FastAPI:
     """Instantiate the FastAPI application with core routes."""
 
     logging.basicConfig(format="%(asctime)s %(levelname)s %(message)s", level=logging.INFO)
     settings = get_settings()
 
-    app = FastAPI(title=settings.app_name, version=settings.app_version)
+    app = FastAPI(title=settings.app_name, version=settings.app_version or APP_VERSION, lifespan=lifespan)
     app.state.settings = settings
+    app.add_middleware(RequestMetricsMiddleware)
     app.include_router(health_router)
+    app.include_router(metrics_router)
     app.include_router(version_router)
     app.include_router(auth_router)
+    app.include_router(missions_router)
     return app
 
 
-app = create_app()
+def __getattr__(name: str) -> Any:
+    # ``uvicorn app.main:app`` looks the application up as an attribute, so it
+    # is built on that first lookup instead of whenever this module is imported.
+    if name == "app":
+        application = globals()["app"] = create_app()
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
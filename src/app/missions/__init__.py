@@ -0,0 +1,62 @@
+"""In-process mission services."""
+
+from .changes import (
+    CHANGE_MAX_SEEN,
+    ChangePosition,
+    MissionChange,
+    MissionChangeFeed,
+    changes_statement,
+    get_mission_change_feed,
+    read_changes,
+    reset_mission_change_feed,
+    shutdown_mission_change_feed,
+)
+from .conflicts import ConflictReport, detect_conflicts, find_mission_conflicts, load_intervals
+from .export import EXPORT_COLUMNS, ExportFormat, iter_mission_export
+from .importer import MissionImporter, iter_ndjson_lines
+from .interval_index import (
+    MissionIntervalIndex,
+    get_mission_interval_index,
+    reset_mission_interval_index,
+    time_key,
+    utc_naive,
+)
+from .rollup import rebuild_status_counts, status_summary
+from .search import rebuild_search_index, search_missions, search_statement, search_terms
+from .snapshot import MissionSnapshot, SnapshotRow, get_mission_snapshot, reset_mission_snapshot
+
+__all__ = [
+    "CHANGE_MAX_SEEN",
+    "ChangePosition",
+    "ConflictReport",
+    "EXPORT_COLUMNS",
+    "ExportFormat",
+    "MissionImporter",
+    "MissionChange",
+    "MissionChangeFeed",
+    "MissionIntervalIndex",
+    "MissionSnapshot",
+    "SnapshotRow",
+    "changes_statement",
+    "detect_conflicts",
+    "find_mission_conflicts",
+    "get_mission_change_feed",
+    "get_mission_interval_index",
+    "get_mission_snapshot",
+    "iter_mission_export",
+    "iter_ndjson_lines",
+    "load_intervals",
+    "read_changes",
+    "rebuild_search_index",
+    "rebuild_status_counts",
+    "reset_mission_change_feed",
+    "reset_mission_interval_index",
+    "reset_mission_snapshot",
+    "search_missions",
+    "search_statement",
+    "search_terms",
+    "shutdown_mission_change_feed",
+    "status_summary",
+    "time_key",
+    "utc_naive",
+]
@@ -0,0 +1,430 @@
+"""Mission change feed ordered by ``(updated_at, id)`` and its in-process fan-out."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
+
+from sqlalchemy import Select, and_, event, or_, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+from starlette.concurrency import run_in_threadpool
+
+from ..models import Mission
+from ..models.mission import utcnow
+from ..schemas.serializers import MISSION_READ, dump_json
+from ..settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+CHANGE_BATCH_SIZE = 500
+
+# How much later than its ``updated_at`` stamp a transaction may commit and
+# still be delivered: the feed keeps re-reading this window behind its floor.
+CHANGE_SKEW_SECONDS = 2.0
+
+# Most change keys a position remembers inside the skew window; this bounds
+# the size of a ``/changes`` cursor and of the query that re-reads the window.
+CHANGE_MAX_SEEN = 128
+
+ChangeKey = tuple[datetime, uuid.UUID]
+
+_NIL = uuid.UUID(int=0)
+
+
+class MissionChange(NamedTuple):
+    """A changed mission: its feed position and its ``MissionRead`` JSON."""
+
+    updated_at: datetime
+    id: uuid.UUID
+    data: bytes
+
+    @property
+    def key(self) -> ChangeKey:
+        return self.updated_at, self.id
+
+
+class ChangePosition(NamedTuple):
+    """How far a reader has got through the feed.
+
+    Every change keyed at or before ``floor`` has been read, and so has every
+    key in ``seen``. ``seen`` only holds keys above the floor: the changes in
+    the skew window, where a transaction that stamped an earlier
+    ``updated_at`` may still commit and has to be picked up late.
+    """
+
+    floor: ChangeKey | None
+    seen: frozenset[ChangeKey] = frozenset()
+
+    @classmethod
+    def resume(cls, key: ChangeKey, skew: timedelta) -> ChangePosition:
+        """Return a position for a reader that only knows the last key it saw.
+
+        The skew window behind ``key`` is read again, so changes committed
+        late are not lost at the cost of repeating that window's changes.
+        """
+
+        return cls((key[0] - skew, _NIL))
+
+
+def _key(mission: Mission) -> ChangeKey:
+    return mission.updated_at, mission.id
+
+
+def _settled(floor: ChangeKey, keys: Iterable[ChangeKey]) -> ChangePosition:
+    """Return the position at ``floor`` having seen ``keys``, keeping it bounded.
+
+    When more than ``CHANGE_MAX_SEEN`` changes sit above the floor (a bulk
+    import stamps a whole batch alike) the position resumes after the newest
+    of them instead, giving up the skew window for that burst.
+    """
+
+    seen = frozenset(key for key in keys if key > floor)
+    if len(seen) > CHANGE_MAX_SEEN:
+        return ChangePosition(max(seen))
+    return ChangePosition(floor, seen)
+
+
+def read_changes(
+    session: Session,
+    position: ChangePosition | None,
+    limit: int,
+    skew: timedelta,
+    now: datetime | None = None,
+) -> tuple[list[Mission], ChangePosition, bool]:
+    """Return up to ``limit`` unseen changes after ``position``, the new position and whether more remain.
+
+    Changes already in ``position.seen`` are skipped, so re-reading the skew
+    window never repeats a change. While a backlog is paged through the floor
+    moves to the last change returned; once the reader has caught up it
+    trails the clock by ``skew``, and only the keys read above it are
+    carried in ``seen``.
+    """
+
+    position = position or ChangePosition(None)
+    rows = list(session.scalars(changes_statement(position.floor, limit + len(position.seen) + 1)))
+    fresh = [mission for mission in rows if _key(mission) not in position.seen]
+    if len(fresh) > limit:
+        fresh = fresh[:limit]
+        boundary = _key(fresh[-1])
+        return fresh, ChangePosition(boundary, frozenset(key for key in position.seen if key > boundary)), True
+    floor: ChangeKey = ((now or utcnow()) - skew, _NIL)
+    if position.floor is not None and floor < position.floor:
+        floor = position.floor
+    return fresh, _settled(floor, map(_key, rows)), False
+
+
+def current_position(session: Session, skew: timedelta, now: datetime | None = None) -> ChangePosition:
+    """Return the position of a reader that has seen every change committed so far."""
+
+    floor: ChangeKey = ((now or utcnow()) - skew, _NIL)
+    keys = session.execute(
+        select(Mission.updated_at, Mission.id).where(Mission.updated_at >= floor[0])
+    ).all()
+    return _settled(floor, ((updated_at, mission_id) for updated_at, mission_id in keys))
+
+
+def changes_statement(after: ChangeKey | None, limit: int) -> Select[tuple[Mission]]:
+    """Return missions changed after ``after`` in ``(updated_at, id)`` order.
+
+    The keyset condition has the same sargable shape as the mission listing
+    so the query walks ``ix_missions_updated_at`` from the cursor position.
+    """
+
+    statement = select(Mission)
+    if after is not None:
+        updated_at, mission_id = after
+        statement = statement.where(
+            and_(
+                Mission.updated_at >= updated_at,
+                or_(Mission.updated_at > updated_at, Mission.id > mission_id),
+            )
+        )
+    return statement.order_by(Mission.updated_at, Mission.id).limit(limit)
+
+
+def fetch_changes(
+    session: Session, position: ChangePosition | None, limit: int, skew: timedelta
+) -> tuple[list[MissionChange], ChangePosition, bool]:
+    """Like :func:`read_changes`, with each change encoded once."""
+
+    missions, position, has_more = read_changes(session, position, limit, skew)
+    changes = [MissionChange(mission.updated_at, mission.id, dump_json(MISSION_READ, mission)) for mission in missions]
+    return changes, position, has_more
+
+
+class Subscription:
+    """Bounded queue of change batches for one subscriber.
+
+    ``None`` in the queue means the subscription ended: the feed closed, or
+    the subscriber fell ``queue_size`` batches behind and was dropped. Either
+    way the client resumes from its last position through the cursor.
+    """
+
+    __slots__ = ("queue",)
+
+    def __init__(self, queue_size: int) -> None:
+        self.queue: asyncio.Queue[list[MissionChange] | None] = asyncio.Queue(queue_size + 1)
+
+    def _offer(self, batch: list[MissionChange] | None) -> bool:
+        if self.queue.qsize() >= self.queue.maxsize - 1:
+            self.queue.put_nowait(None)
+            return False
+        self.queue.put_nowait(batch)
+        return True
+
+    async def get(self) -> list[MissionChange] | None:
+        return await self.queue.get()
+
+
+class MissionChangeFeed:
+    """Fan out mission changes to any number of in-process subscribers.
+
+    One pump task per process reads new changes from the database and hands
+    each batch, already encoded, to every subscriber queue, so the database
+    work does not grow with the number of listeners and an idle subscriber
+    is just a parked coroutine. The pump wakes when this process commits a
+    mission change and otherwise every ``poll_interval`` seconds, which is
+    how writes by other workers or raw SQL are picked up. It runs only
+    while someone is subscribed.
+
+    Each poll re-reads the last ``skew_seconds`` of changes and skips those
+    it already published (see :class:`ChangePosition`), so a transaction
+    that commits after a newer one is still delivered, exactly once.
+    """
+
+    def __init__(
+        self, poll_interval: float = 1.0, queue_size: int = 64, skew_seconds: float = CHANGE_SKEW_SECONDS
+    ) -> None:
+        self.poll_interval = poll_interval
+        self.queue_size = queue_size
+        self.skew = timedelta(seconds=skew_seconds)
+        self._subscribers: set[Subscription] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._starting: asyncio.Lock | None = None
+        self._position: ChangePosition | None = None
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def notify(self) -> None:
+        """Wake the pump; safe to call from any thread."""
+
+        loop, wake = self._loop, self._wake
+        if loop is None or wake is None:
+            return
+        with suppress(RuntimeError):  # the loop is already closed
+            loop.call_soon_threadsafe(wake.set)
+
+    @asynccontextmanager
+    async def subscribe(self, engine: Engine) -> AsyncIterator[Subscription]:
+        """Register a subscriber for the duration of the ``async with`` block.
+
+        The pump is started on ``engine`` if it is not running yet; changes
+        committed from the moment this returns are delivered.
+        """
+
+        subscription = Subscription(self.queue_size)
+        self._subscribers.add(subscription)
+        try:
+            await self._start(engine)
+            yield subscription
+        finally:
+            self._subscribers.discard(subscription)
+            if not self._subscribers:
+                await self._stop()
+
+    async def _start(self, engine: Engine) -> None:
+        if self._starting is None:
+            self._starting = asyncio.Lock()
+        async with self._starting:
+            if self._task is not None and not self._task.done():
+                return
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            # Start from what is committed now so nothing committed after
+            # this point is missed; older changes are each subscriber's catch-up.
+            self._position = await run_in_threadpool(self._current, engine)
+            self._task = asyncio.create_task(self._pump(engine))
+
+    async def _stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def close(self) -> None:
+        """Stop the pump and end every subscription."""
+
+        for subscription in list(self._subscribers):
+            with suppress(asyncio.QueueFull):
+                subscription.queue.put_nowait(None)
+        self._subscribers.clear()
+        await self._stop()
+
+    def _current(self, engine: Engine) -> ChangePosition:
+        with Session(engine) as session:
+            return current_position(session, self.skew)
+
+    def _fetch(
+        self, engine: Engine, position: ChangePosition | None
+    ) -> tuple[list[MissionChange], ChangePosition, bool]:
+        with Session(engine) as session:
+            return fetch_changes(session, position, CHANGE_BATCH_SIZE, self.skew)
+
+    async def follow(
+        self, engine: Engine, position: ChangePosition | None, heartbeat: float
+    ) -> AsyncIterator[MissionChange | None]:
+        """Yield every change after ``position``, then live changes as they happen.
+
+        Missed changes are first read from the database in batches; then the
+        generator switches to the shared pump, skipping anything already
+        sent. With ``position=None`` only live changes are yielded. ``None``
+        is yielded after ``heartbeat`` idle seconds so callers can keep the
+        connection alive. The generator returns when the subscription ends.
+        """
+
+        async with self.subscribe(engine) as subscription:
+            # Replayed keys the pump may still publish, i.e. those above its floor.
+            replayed: set[ChangeKey] = set()
+            more = position is not None
+            while more:
+                batch, position, more = await run_in_threadpool(self._fetch, engine, position)
+                pump_floor = self._pump_floor()
+                for change in batch:
+                    if pump_floor is None or change.key > pump_floor:
+                        replayed.add(change.key)
+                    yield change
+            while True:
+                try:
+                    live = await asyncio.wait_for(subscription.get(), heartbeat)
+                except TimeoutError:
+                    yield None
+                    continue
+                if live is None:
+                    return
+                for change in live:
+                    if change.key not in replayed:
+                        yield change
+                pump_floor = self._pump_floor()
+                if replayed and pump_floor is not None:
+                    replayed = {key for key in replayed if key > pump_floor}
+
+    def _pump_floor(self) -> ChangeKey | None:
+        return None if self._position is None else self._position.floor
+
+    def publish(self, batch: list[MissionChange]) -> None:
+        """Hand ``batch`` to every subscriber, dropping those too far behind."""
+
+        for subscription in list(self._subscribers):
+            if not subscription._offer(batch):
+                self._subscribers.discard(subscription)
+                logger.info("Dropped a mission change subscriber that fell behind")
+
+    async def _pump(self, engine: Engine) -> None:
+        assert self._wake is not None
+        while True:
+            self._wake.clear()
+            try:
+                batch, self._position, more = await run_in_threadpool(self._fetch, engine, self._position)
+            except Exception:  # pragma: no cover - transient database errors
+                logger.exception("Mission change feed poll failed")
+                batch, more = [], False
+            if batch:
+                self.publish(batch)
+            if more:
+                continue
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+
+
+_feed: MissionChangeFeed | None = None
+
+
+def get_mission_change_feed() -> MissionChangeFeed:
+    """Return the process-wide mission change feed."""
+
+    global _feed
+    if _feed is None:
+        settings = get_settings()
+        _feed = MissionChangeFeed(
+            poll_interval=settings.mission_changes_poll_interval,
+            queue_size=settings.mission_changes_queue_size,
+        )
+    return _feed
+
+
+async def shutdown_mission_change_feed() -> None:
+    """End all subscriptions and discard the process-wide feed."""
+
+    global _feed
+    feed, _feed = _feed, None
+    if feed is not None:
+        await feed.close()
+
+
+def reset_mission_change_feed() -> None:
+    """Discard the process-wide feed without waiting for its pump."""
+
+    global _feed
+    _feed = None
+
+
+_PENDING_KEY = "mission_feed_changed"
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_flushed_missions(session: Session, _flush_context: Any) -> None:
+    if _feed is None or session.info.get(_PENDING_KEY):
+        return
+    if any(
+        isinstance(instance, Mission)
+        for instances in (session.new, session.dirty, session.deleted)
+        for instance in instances
+    ):
+        session.info[_PENDING_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _flag_mission_statements(state: ORMExecuteState) -> None:
+    if _feed is None or not (state.is_insert or state.is_update or state.is_delete):
+        return
+    if getattr(state.statement, "table", None) is Mission.__table__:
+        state.session.info[_PENDING_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_feed(session: Session) -> None:
+    if session.info.pop(_PENDING_KEY, False) and _feed is not None:
+        _feed.notify()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_feed_flag(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+__all__ = [
+    "CHANGE_BATCH_SIZE",
+    "CHANGE_MAX_SEEN",
+    "CHANGE_SKEW_SECONDS",
+    "ChangePosition",
+    "MissionChange",
+    "MissionChangeFeed",
+    "Subscription",
+    "changes_statement",
+    "current_position",
+    "fetch_changes",
+    "get_mission_change_feed",
+    "read_changes",
+    "reset_mission_change_feed",
+    "shutdown_mission_change_feed",
+]
@@ -0,0 +1,170 @@
+"""Sort-and-sweep detection of overlapping missions."""
+
+from __future__ import annotations
+
+import uuid
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Any
+
+from sqlalchemy import ColumnElement, select
+from sqlalchemy.orm import Session
+
+from ..models import Mission
+from .interval_index import time_key
+
+_UNRESOLVED: Any = object()
+
+# NumPy is optional (``pip install codex-app[analytics]``) and takes tens of
+# milliseconds to import, so it is loaded on first use rather than at startup.
+# ``None`` once resolved means it is not installed.
+np: Any = _UNRESOLVED
+
+
+def _numpy() -> Any:
+    global np
+    if np is _UNRESOLVED:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - exercised when the extra is not installed
+            numpy = None
+        np = numpy
+    return np
+
+
+@dataclass(slots=True)
+class ConflictReport:
+    """Overlapping pairs and clusters found among a set of intervals.
+
+    ``pairs`` and ``clusters`` hold positions into the input sequences.
+    ``pair_count`` is the true number of overlapping pairs even when
+    ``pairs`` was truncated to ``max_pairs``. A cluster is a maximal group of
+    at least two intervals chained together by overlaps.
+    """
+
+    pair_count: int = 0
+    pairs: list[tuple[int, int]] = field(default_factory=list)
+    clusters: list[list[int]] = field(default_factory=list)
+
+    @property
+    def truncated(self) -> bool:
+        """Return True when not every overlapping pair is listed."""
+
+        return len(self.pairs) < self.pair_count
+
+
+def _detect_numpy(starts: Any, ends: Any, max_pairs: int) -> ConflictReport:
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    order = np.lexsort((ends, starts))
+    sorted_starts, sorted_ends = starts[order], ends[order]
+    size = len(order)
+
+    # Later intervals overlapping interval i are exactly those whose start
+    # falls before its end, since none of them starts earlier.
+    positions = np.arange(size)
+    partners = np.searchsorted(sorted_starts, sorted_ends, side="left") - positions - 1
+    totals = np.cumsum(partners)
+    pair_count = int(totals[-1]) if size else 0
+
+    listed = min(pair_count, max_pairs)
+    rows = int(np.searchsorted(totals, listed, side="left")) + 1 if listed else 0
+    counts = partners[:rows]
+    firsts = np.repeat(positions[:rows], counts)[:listed]
+    offsets = np.arange(len(firsts)) - np.repeat(totals[:rows] - counts, counts)[:listed]
+    seconds = firsts + 1 + offsets
+    pairs = [
+        (a, b) if a < b else (b, a)
+        for a, b in zip(order[firsts].tolist(), order[seconds].tolist())
+    ]
+
+    clusters: list[list[int]] = []
+    if size:
+        # A cluster ends wherever the next start is at or past every end so far.
+        reach = np.maximum.accumulate(sorted_ends)
+        bounds = np.concatenate(([0], np.flatnonzero(sorted_starts[1:] >= reach[:-1]) + 1, [size]))
+        shared = np.flatnonzero(np.diff(bounds) > 1)
+        for first, last in zip(bounds[shared].tolist(), bounds[shared + 1].tolist()):
+            clusters.append(sorted(order[first:last].tolist()))
+    return ConflictReport(pair_count=pair_count, pairs=pairs, clusters=clusters)
+
+
+def _detect_python(starts: Sequence[int], ends: Sequence[int], max_pairs: int) -> ConflictReport:
+    order = sorted(range(len(starts)), key=lambda position: (starts[position], ends[position]))
+    sorted_starts = [starts[position] for position in order]
+    report = ConflictReport()
+    for rank, position in enumerate(order):
+        last = bisect_left(sorted_starts, ends[position])
+        report.pair_count += last - rank - 1
+        for partner in order[rank + 1 : min(last, rank + 1 + max_pairs - len(report.pairs))]:
+            report.pairs.append((position, partner) if position < partner else (partner, position))
+
+    cluster: list[int] = []
+    reach = accumulate((ends[position] for position in order), max)
+    previous_reach = None
+    for rank, (position, current_reach) in enumerate(zip(order, reach)):
+        if rank and sorted_starts[rank] >= previous_reach:
+            if len(cluster) > 1:
+                report.clusters.append(sorted(cluster))
+            cluster = []
+        cluster.append(position)
+        previous_reach = current_reach
+    if len(cluster) > 1:
+        report.clusters.append(sorted(cluster))
+    return report
+
+
+def detect_conflicts(
+    starts: Sequence[int], ends: Sequence[int], max_pairs: int = 10_000
+) -> ConflictReport:
+    """Find every overlap among half-open intervals ``[starts[i], ends[i])``.
+
+    Intervals are sorted once; the partners of each interval are then a
+    contiguous run found by binary search, and clusters fall out of a
+    running maximum of end points. With NumPy installed all of this is
+    vectorised over int64 arrays; otherwise the same sweep runs in Python.
+    Work is O(n log n + p) for ``p`` listed pairs.
+    """
+
+    if _numpy() is not None:
+        return _detect_numpy(starts, ends, max_pairs)
+    return _detect_python(starts, ends, max_pairs)
+
+
+def load_intervals(
+    session: Session, conditions: Sequence[ColumnElement[bool]] = ()
+) -> tuple[list[uuid.UUID], Any, Any]:
+    """Return ids plus start and end keys of the missions matching ``conditions``.
+
+    Keys are integer microseconds (see :func:`time_key`); they come back as
+    NumPy int64 arrays when NumPy is available and as lists otherwise.
+    """
+
+    rows = session.execute(
+        select(Mission.id, Mission.start_time, Mission.end_time).where(*conditions)
+    ).all()
+    ids = [row[0] for row in rows]
+    if _numpy() is not None:
+        starts = np.fromiter((time_key(row[1]) for row in rows), dtype=np.int64, count=len(rows))
+        ends = np.fromiter((time_key(row[2]) for row in rows), dtype=np.int64, count=len(rows))
+        return ids, starts, ends
+    return ids, [time_key(row[1]) for row in rows], [time_key(row[2]) for row in rows]
+
+
+def find_mission_conflicts(
+    session: Session, conditions: Sequence[ColumnElement[bool]] = (), max_pairs: int = 10_000
+) -> tuple[list[uuid.UUID], ConflictReport]:
+    """Load the missions matching ``conditions`` and detect their overlaps."""
+
+    ids, starts, ends = load_intervals(session, conditions)
+    return ids, detect_conflicts(starts, ends, max_pairs)
+
+
+__all__ = [
+    "ConflictReport",
+    "detect_conflicts",
+    "find_mission_conflicts",
+    "load_intervals",
+]
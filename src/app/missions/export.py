@@ -0,0 +1,113 @@
+"""Constant-memory export of missions as NDJSON or CSV."""
+
+from __future__ import annotations
+
+import csv
+import enum
+import io
+import json
+import zlib
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from typing import Any, Literal
+
+from sqlalchemy import ColumnElement, select
+from sqlalchemy.engine import Engine, Row
+
+from ..models import Mission
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_BATCH_SIZE = 1000
+
+_missions = Mission.__table__
+EXPORT_COLUMNS: tuple[str, ...] = (
+    "id",
+    "title",
+    "start_time",
+    "end_time",
+    "status",
+    "notes",
+    "created_at",
+    "updated_at",
+)
+
+
+def _text(value: Any) -> Any:
+    """Render a column value the way ``MissionRead`` does."""
+
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+
+def _ndjson(rows: Sequence[Row[Any]]) -> bytes:
+    dumps = json.dumps
+    return "".join(
+        dumps(dict(zip(EXPORT_COLUMNS, map(_text, row))), separators=(",", ":")) + "\n"
+        for row in rows
+    ).encode("utf-8")
+
+
+def _csv(rows: Sequence[Row[Any]] | None) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if rows is None:
+        writer.writerow(EXPORT_COLUMNS)
+    else:
+        writer.writerows([_text(value) for value in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _encoded(
+    engine: Engine, conditions: Sequence[ColumnElement[bool]], fmt: ExportFormat, batch_size: int
+) -> Iterator[bytes]:
+    statement = (
+        select(*(_missions.c[name] for name in EXPORT_COLUMNS))
+        .where(*conditions)
+        .order_by(_missions.c.start_time, _missions.c.id)
+    )
+    if fmt == "csv":
+        yield _csv(None)
+    encode = _ndjson if fmt == "ndjson" else _csv
+    with engine.connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=batch_size).execute(
+            statement
+        )
+        for rows in result.partitions():
+            yield encode(rows)
+
+
+def iter_mission_export(
+    engine: Engine,
+    conditions: Sequence[ColumnElement[bool]] = (),
+    fmt: ExportFormat = "ndjson",
+    gzip: bool = False,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[bytes]:
+    """Yield the missions matching ``conditions`` encoded as ``fmt``.
+
+    Rows are read as plain column tuples through a server-side cursor in
+    ``batch_size`` partitions and encoded straight to bytes, so neither ORM
+    instances nor Pydantic models are built and memory stays flat as the
+    table grows. With ``gzip`` the output is compressed incrementally.
+    """
+
+    chunks = _encoded(engine, conditions, fmt, batch_size)
+    return _gzip(chunks) if gzip else chunks
+
+
+__all__ = ["EXPORT_COLUMNS", "ExportFormat", "iter_mission_export"]
@@ -0,0 +1,162 @@
+"""Streaming NDJSON import of missions."""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+from pydantic import ValidationError
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ..models import Mission
+from ..models.mission import utcnow
+from ..schemas import MissionCreate, MissionImportError, MissionImportReport
+from .interval_index import MissionIntervalIndex
+
+logger = logging.getLogger(__name__)
+
+MAX_LINE_BYTES = 64 * 1024
+MAX_REPORTED_ERRORS = 1000
+
+_missions = Mission.__table__
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterable[bytes], max_line_bytes: int = MAX_LINE_BYTES
+) -> AsyncIterator[tuple[int, bytes | None]]:
+    """Yield ``(line_number, line)`` for each non-blank line of an NDJSON stream.
+
+    Only the current partial line is buffered. Lines longer than
+    ``max_line_bytes`` are skipped and yielded as ``None`` so the caller can
+    report them.
+    """
+
+    buffer = bytearray()
+    number = 0
+    oversized = False
+    async for chunk in chunks:
+        start = 0
+        while True:
+            newline = chunk.find(b"\n", start)
+            piece = chunk[start:] if newline < 0 else chunk[start:newline]
+            if not oversized:
+                buffer += piece
+                oversized = len(buffer) > max_line_bytes
+                if oversized:
+                    buffer.clear()
+            if newline < 0:
+                break
+            number += 1
+            if oversized:
+                yield number, None
+            elif buffer.strip():
+                yield number, bytes(buffer)
+            buffer.clear()
+            oversized = False
+            start = newline + 1
+    if oversized:
+        yield number + 1, None
+    elif buffer.strip():
+        yield number + 1, bytes(buffer)
+
+
+class MissionImporter:
+    """Validate NDJSON mission rows and insert them in fixed-size batches.
+
+    Each batch is written with one executemany ``INSERT`` and committed on
+    its own, so memory is bounded by ``batch_size`` rows plus at most
+    ``MAX_REPORTED_ERRORS`` error reports, whatever the upload size. If the
+    database rejects a batch, its rows are retried one by one so a single
+    bad row does not sink its neighbours.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        batch_size: int,
+        index: MissionIntervalIndex | None = None,
+    ) -> None:
+        self.session = session
+        self.batch_size = max(batch_size, 1)
+        self.index = index
+        self.report = MissionImportReport()
+
+    def _fail(self, line: int, errors: list[dict[str, Any]]) -> None:
+        self.report.failed += 1
+        if len(self.report.errors) < MAX_REPORTED_ERRORS:
+            self.report.errors.append(MissionImportError(line=line, errors=errors))
+        else:
+            self.report.errors_truncated = True
+
+    def _row(self, line: bytes) -> dict[str, Any]:
+        # Validating through MissionCreate also converts offset times to naive UTC.
+        mission = MissionCreate.model_validate_json(line)
+        now = utcnow()
+        return {
+            **mission.model_dump(),
+            "id": uuid.uuid4(),
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    def _insert(self, rows: list[dict[str, Any]]) -> None:
+        # Stamped when written rather than when parsed, so the change feed
+        # sees timestamps close to the commit.
+        now = utcnow()
+        for row in rows:
+            row["updated_at"] = now
+        self.session.execute(_missions.insert(), rows)
+        self.session.commit()
+        if self.index is not None:
+            for row in rows:
+                self.index.add(row["id"], row["start_time"], row["end_time"])
+
+    def _write(self, batch: list[tuple[int, dict[str, Any]]]) -> None:
+        try:
+            self._insert([row for _, row in batch])
+            self.report.imported += len(batch)
+            return
+        except DBAPIError:
+            self.session.rollback()
+        for line, row in batch:
+            try:
+                self._insert([row])
+                self.report.imported += 1
+            except DBAPIError as exc:
+                self.session.rollback()
+                self._fail(line, [{"loc": [], "msg": str(exc.orig)}])
+
+    async def run(self, chunks: AsyncIterable[bytes]) -> MissionImportReport:
+        """Consume an NDJSON byte stream and return the import report."""
+
+        batch: list[tuple[int, dict[str, Any]]] = []
+        async for number, line in iter_ndjson_lines(chunks):
+            if line is None:
+                self._fail(number, [{"loc": [], "msg": f"line exceeds {MAX_LINE_BYTES} bytes"}])
+                continue
+            try:
+                batch.append((number, self._row(line)))
+            except ValidationError as exc:
+                self._fail(
+                    number,
+                    [{"loc": list(error["loc"]), "msg": error["msg"]} for error in exc.errors()],
+                )
+                continue
+            if len(batch) >= self.batch_size:
+                await run_in_threadpool(self._write, batch)
+                batch = []
+        if batch:
+            await run_in_threadpool(self._write, batch)
+        logger.info(
+            "Mission import finished: %d imported, %d failed",
+            self.report.imported,
+            self.report.failed,
+        )
+        return self.report
+
+
+__all__ = ["MissionImporter", "iter_ndjson_lines"]
@@ -0,0 +1,339 @@
+"""In-memory interval index answering mission overlap queries."""
+
+from __future__ import annotations
+
+import threading
+import uuid
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from ..models import Mission
+from ..models.mission import utc_naive
+from ..settings import get_settings
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+Interval = tuple[int, int, uuid.UUID]
+
+
+def time_key(value: datetime) -> int:
+    """Return ``value`` as integer microseconds since the epoch (naive UTC)."""
+
+    return (utc_naive(value) - _EPOCH) // _MICROSECOND
+
+
+class _Node:
+    """Centered interval tree node holding the intervals that contain ``center``."""
+
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, center: int, by_start: list[int], by_end: list[int]) -> None:
+        self.center = center
+        self.by_start = by_start
+        self.by_end = by_end
+        self.left: _Node | None = None
+        self.right: _Node | None = None
+
+
+class _StaticIntervals:
+    """Immutable intervals sorted by ``(start, id)`` with a centered interval tree.
+
+    ``starts``/``ends`` are parallel int64 arrays; tree nodes refer to
+    positions in them. Overlap with ``[a, b)`` is the union of two disjoint
+    sets: intervals stabbed by ``a`` (tree walk) and intervals starting inside
+    ``(a, b)`` (one bisect over ``starts``). Both cost O(log n + k).
+    """
+
+    def __init__(self, intervals: list[Interval]) -> None:
+        intervals.sort(key=lambda item: (item[0], item[2]))
+        self.starts = array("q", (item[0] for item in intervals))
+        self.ends = array("q", (item[1] for item in intervals))
+        self.ids = [item[2] for item in intervals]
+        self.root = self._build(list(range(len(intervals))))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _build(self, positions: list[int]) -> _Node | None:
+        if not positions:
+            return None
+        starts, ends = self.starts, self.ends
+        # Median start: at most half the positions start after it and at most
+        # half start before it, so the tree depth stays logarithmic.
+        center = starts[positions[len(positions) // 2]]
+        left = [p for p in positions if ends[p] <= center]
+        right = [p for p in positions if starts[p] > center]
+        here = [p for p in positions if starts[p] <= center < ends[p]]
+        node = _Node(center, here, sorted(here, key=ends.__getitem__, reverse=True))
+        node.left = self._build(left)
+        node.right = self._build(right)
+        return node
+
+    def stab(self, point: int) -> Iterator[int]:
+        """Yield positions of intervals with ``start <= point < end``."""
+
+        starts, ends = self.starts, self.ends
+        node = self.root
+        while node is not None:
+            if point < node.center:
+                for position in node.by_start:
+                    if starts[position] > point:
+                        break
+                    yield position
+                node = node.left
+            else:
+                for position in node.by_end:
+                    if ends[position] <= point:
+                        break
+                    yield position
+                node = node.right
+
+    def overlapping(self, start: int, end: int) -> Iterator[int]:
+        """Yield positions of intervals overlapping ``[start, end)``."""
+
+        yield from self.stab(start)
+        yield from range(bisect_right(self.starts, start), bisect_left(self.starts, end))
+
+
+class MissionIntervalIndex:
+    """Per-process interval index over mission ``start_time``/``end_time``.
+
+    The bulk of the intervals live in an immutable :class:`_StaticIntervals`
+    built from the table on first use. Later changes go to a small overlay
+    that queries merge in: the changed ids in a ``removed`` set, and the new
+    intervals in a list kept sorted by ``(start, id)`` so a query only looks
+    at those starting before its window ends. Once ``rebuild_threshold`` ids
+    have changed, a background thread folds the overlay into a new static
+    part; the commit that crossed the threshold does not wait for it, and
+    queries keep using the old static part until the new one is swapped in.
+    Committed ORM changes reach the index through session events; code
+    writing missions with Core statements must call :meth:`add` or
+    :meth:`discard` itself.
+    """
+
+    def __init__(self, rebuild_threshold: int = 256) -> None:
+        self.rebuild_threshold = rebuild_threshold
+        self._static = _StaticIntervals([])
+        self._added: dict[uuid.UUID, tuple[int, int]] = {}
+        self._overlay: list[tuple[int, uuid.UUID, int]] = []
+        self._removed: set[uuid.UUID] = set()
+        self._lock = threading.Lock()
+        self._build_lock = threading.RLock()
+        self._loaded = False
+        self._replay: list[tuple[uuid.UUID, tuple[int, int] | None]] | None = None
+        self._rebuilder: threading.Thread | None = None
+        self.rebuilds = 0
+
+    @property
+    def loaded(self) -> bool:
+        """Return True once the index has been populated from the database."""
+
+        return self._loaded
+
+    def __len__(self) -> int:
+        with self._lock:
+            live = sum(1 for mission_id in self._static.ids if mission_id not in self._removed)
+            return live + len(self._added)
+
+    def load(self, session: Session) -> int:
+        """Rebuild the index from the ``missions`` table and return its size."""
+
+        with self._build_lock:
+            with self._lock:
+                self._replay = []
+            try:
+                rows = session.execute(select(Mission.start_time, Mission.end_time, Mission.id))
+                intervals = [
+                    (time_key(start), time_key(end), mission_id) for start, end, mission_id in rows
+                ]
+            except BaseException:
+                with self._lock:
+                    self._replay = None
+                raise
+            return self._install(intervals)
+
+    def _install(self, intervals: list[Interval]) -> int:
+        """Build a static part outside the lock, then swap it in and replay changes.
+
+        Changes recorded while the build ran were applied to the old overlay
+        for the benefit of concurrent queries and are replayed on the new one.
+        """
+
+        static = _StaticIntervals(intervals)
+        with self._lock:
+            replay, self._replay = self._replay, None
+            self._static = static
+            self._added = {}
+            self._overlay = []
+            self._removed = set()
+            self._loaded = True
+            for mission_id, interval in replay or ():
+                self._apply(mission_id, interval)
+        return len(static)
+
+    def add(self, mission_id: uuid.UUID, start: datetime, end: datetime) -> None:
+        """Insert or move the interval of ``mission_id``."""
+
+        self._record(mission_id, (time_key(start), time_key(end)))
+
+    def discard(self, mission_id: uuid.UUID) -> None:
+        """Forget ``mission_id`` if it is indexed."""
+
+        self._record(mission_id, None)
+
+    def _record(self, mission_id: uuid.UUID, interval: tuple[int, int] | None) -> None:
+        with self._lock:
+            if self._replay is not None:
+                self._replay.append((mission_id, interval))
+            if not self._loaded:
+                return
+            self._apply(mission_id, interval)
+            # Every overlay entry is in ``_removed``; ``_added`` is a subset of it.
+            if len(self._removed) < self.rebuild_threshold or self._rebuilder is not None:
+                return
+            rebuilder = self._rebuilder = threading.Thread(
+                target=self._rebuild, name="mission-interval-rebuild", daemon=True
+            )
+        rebuilder.start()
+
+    def _apply(self, mission_id: uuid.UUID, interval: tuple[int, int] | None) -> None:
+        self._removed.add(mission_id)
+        previous = self._added.pop(mission_id, None)
+        if previous is not None:
+            del self._overlay[bisect_left(self._overlay, (previous[0], mission_id))]
+        if interval is not None:
+            self._added[mission_id] = interval
+            insort(self._overlay, (interval[0], mission_id, interval[1]))
+
+    def _rebuild(self) -> None:
+        """Fold the overlay into a new static part; runs in its own thread."""
+
+        with self._build_lock:
+            try:
+                with self._lock:
+                    self._replay = []
+                    static, removed = self._static, self._removed
+                    intervals = [
+                        (static.starts[position], static.ends[position], mission_id)
+                        for position, mission_id in enumerate(static.ids)
+                        if mission_id not in removed
+                    ]
+                    intervals.extend((start, end, mission_id) for start, mission_id, end in self._overlay)
+                self._install(intervals)
+                self.rebuilds += 1
+            finally:
+                with self._lock:
+                    self._replay = None
+                    self._rebuilder = None
+
+    def overlapping(self, start: datetime, end: datetime) -> list[tuple[datetime, uuid.UUID]]:
+        """Return ``(start_time, id)`` of missions overlapping ``[start, end)``.
+
+        Results are sorted by ``(start_time, id)``, matching the keyset order
+        used by the mission listing.
+        """
+
+        low, high = time_key(start), time_key(end)
+        with self._lock:
+            static, removed = self._static, self._removed
+            found = [
+                (static.starts[position], static.ids[position])
+                for position in static.overlapping(low, high)
+                if static.ids[position] not in removed
+            ]
+            overlay = self._overlay
+            for position in range(bisect_left(overlay, (high,))):
+                item_start, mission_id, item_end = overlay[position]
+                if item_end > low:
+                    found.append((item_start, mission_id))
+        found.sort()
+        return [(_EPOCH + key * _MICROSECOND, mission_id) for key, mission_id in found]
+
+    def query(self, session: Session, start: datetime, end: datetime) -> list[tuple[datetime, uuid.UUID]]:
+        """Load the index from ``session`` if needed, then run :meth:`overlapping`."""
+
+        if not self._loaded:
+            with self._build_lock:
+                if not self._loaded:
+                    self.load(session)
+        return self.overlapping(start, end)
+
+
+_index: MissionIntervalIndex | None = None
+
+
+def get_mission_interval_index() -> MissionIntervalIndex | None:
+    """Return the process-wide interval index, or None when it is disabled."""
+
+    global _index
+    if _index is None and get_settings().mission_interval_index:
+        _index = MissionIntervalIndex()
+    return _index
+
+
+def reset_mission_interval_index() -> None:
+    """Discard the process-wide index so it is reloaded on next use."""
+
+    global _index
+    _index = None
+
+
+_PENDING_KEY = "mission_interval_changes"
+
+
+def _changed_missions(session: Session) -> Iterable[tuple[Mission, bool]]:
+    for instance in session.new:
+        if isinstance(instance, Mission):
+            yield instance, False
+    for instance in session.dirty:
+        if isinstance(instance, Mission):
+            attrs = inspect(instance).attrs
+            if attrs.start_time.history.has_changes() or attrs.end_time.history.has_changes():
+                yield instance, False
+    for instance in session.deleted:
+        if isinstance(instance, Mission):
+            yield instance, True
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_mission_changes(session: Session, _flush_context: Any) -> None:
+    """Remember flushed mission intervals until the transaction commits."""
+
+    if _index is None:
+        return
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    for mission, deleted in _changed_missions(session):
+        pending[mission.id] = None if deleted else (mission.start_time, mission.end_time)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_mission_changes(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending or _index is None:
+        return
+    for mission_id, interval in pending.items():
+        if interval is None:
+            _index.discard(mission_id)
+        else:
+            _index.add(mission_id, *interval)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_mission_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+__all__ = [
+    "MissionIntervalIndex",
+    "get_mission_interval_index",
+    "reset_mission_interval_index",
+    "time_key",
+    "utc_naive",
+]
@@ -0,0 +1,76 @@
+"""Reads and repair of the per-day mission status rollup."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from collections import defaultdict
+from datetime import date
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from ..db import session_scope
+from ..models import Mission, MissionStatus, MissionStatusCount
+
+logger = logging.getLogger(__name__)
+
+
+def status_summary(
+    session: Session, start: date | None = None, end: date | None = None
+) -> list[tuple[date, dict[MissionStatus, int]]]:
+    """Return ``(day, {status: count})`` pairs for days in ``[start, end)``.
+
+    Reads only the rollup table, so the cost grows with the number of days
+    rather than the number of missions. Days without missions are omitted.
+    """
+
+    statement = select(MissionStatusCount.day, MissionStatusCount.status, MissionStatusCount.count).where(
+        MissionStatusCount.count != 0
+    )
+    if start is not None:
+        statement = statement.where(MissionStatusCount.day >= start)
+    if end is not None:
+        statement = statement.where(MissionStatusCount.day < end)
+    days: dict[date, dict[MissionStatus, int]] = defaultdict(dict)
+    for day, status, count in session.execute(statement.order_by(MissionStatusCount.day)):
+        days[day][status] = count
+    return list(days.items())
+
+
+def rebuild_status_counts(session: Session) -> int:
+    """Recompute the rollup from ``missions`` and return the number of rows written.
+
+    Runs as one ``DELETE`` plus one ``INSERT ... SELECT ... GROUP BY`` inside
+    the caller's transaction, so readers never see a half-built table.
+    """
+
+    day = func.date(Mission.start_time)
+    session.execute(delete(MissionStatusCount))
+    result = session.execute(
+        insert(MissionStatusCount).from_select(
+            ["day", "status", "count"],
+            select(day, Mission.status, func.count()).group_by(day, Mission.status),
+        )
+    )
+    return result.rowcount
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point: ``python -m app.missions.rollup``."""
+
+    parser = argparse.ArgumentParser(
+        description="Rebuild the mission_status_counts rollup from the missions table."
+    )
+    parser.parse_args(argv)
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(message)s", level=logging.INFO)
+    with session_scope() as session:
+        rows = rebuild_status_counts(session)
+    logger.info("Rebuilt mission status rollup: %d rows", rows)
+
+
+__all__ = ["rebuild_status_counts", "status_summary"]
+
+
+if __name__ == "__main__":  # pragma: no cover - exercised via the CLI
+    main()
@@ -0,0 +1,172 @@
+"""Ranked full-text search over mission titles and notes, and index backfill."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import re
+import uuid
+from decimal import Decimal
+
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Numeric,
+    Select,
+    and_,
+    cast,
+    column,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.orm import Session
+
+from ..db import session_scope
+from ..models import Mission
+from ..models.mission_search import POSTGRESQL_SEARCH_DDL, SQLITE_SEARCH_DDL
+
+logger = logging.getLogger(__name__)
+
+MAX_SEARCH_TERMS = 16
+
+# Title matches count ten times as much as notes matches on SQLite; the
+# PostgreSQL equivalent is the 'A'/'B' weighting of ``search_vector``.
+TITLE_WEIGHT = 10.0
+NOTES_WEIGHT = 1.0
+
+# ``ts_rank`` is a float4; it is rounded to an exact numeric so the keyset
+# comparison against a cursor's score cannot drift through float rounding.
+RANK_PLACES = 6
+
+_TERM = re.compile(r"[^\W_]+")
+
+_docs = table("mission_search_docs", column("docid", Integer), column("mission_id", Mission.id.type))
+_fts = table("missions_fts", column("rowid", Integer))
+
+SearchKey = tuple[float | Decimal, uuid.UUID]
+
+
+def search_terms(query: str) -> list[str]:
+    """Split ``query`` into lower-cased word terms, dropping punctuation.
+
+    Only letters and digits survive, so the terms can be placed in an FTS5 or
+    ``tsquery`` expression without any quoting or operator injection.
+    """
+
+    return _TERM.findall(query.lower())[:MAX_SEARCH_TERMS]
+
+
+def _score_and_match(
+    dialect: str, terms: list[str]
+) -> tuple[ColumnElement[float | Decimal], ColumnElement[bool]]:
+    """Return a rank where lower is better and the matching condition.
+
+    All terms must match; the last one also matches as a prefix so results
+    appear while the user is still typing.
+    """
+
+    if dialect == "sqlite":
+        expression = " ".join([f'"{term}"' for term in terms[:-1]] + [f'"{terms[-1]}"*'])
+        score = func.bm25(literal_column("missions_fts"), TITLE_WEIGHT, NOTES_WEIGHT)
+        return score, literal_column("missions_fts").op("MATCH")(expression)
+    if dialect == "postgresql":
+        query = func.to_tsquery("simple", " & ".join(terms[:-1] + [f"{terms[-1]}:*"]))
+        vector = literal_column("missions.search_vector")
+        score = func.round(cast(-func.ts_rank(vector, query), Numeric), RANK_PLACES)
+        return score, vector.op("@@")(query)
+    # No index on other backends: unranked substring matching.
+    conditions = [or_(Mission.title.ilike(f"%{term}%"), Mission.notes.ilike(f"%{term}%")) for term in terms]
+    return literal(0.0), and_(*conditions)
+
+
+def search_statement(
+    dialect: str, terms: list[str], *, after: SearchKey | None = None, limit: int
+) -> Select[tuple[Mission, float | Decimal]]:
+    """Return ``(mission, score)`` rows matching every term, best first.
+
+    Rows are ordered by ``(score, id)`` and ``after`` continues from a
+    previous page's last key, so paging stays stable while scores tie.
+    """
+
+    score, match = _score_and_match(dialect, terms)
+    statement = select(Mission, score.label("score"))
+    if dialect == "sqlite":
+        statement = statement.select_from(_fts).join(_docs, _docs.c.docid == _fts.c.rowid).join(
+            Mission, Mission.id == _docs.c.mission_id
+        )
+    statement = statement.where(match)
+    if after is not None:
+        after_score, mission_id = after
+        if dialect == "postgresql":
+            # Compare the exact numeric rank with the same decimal, not a float8.
+            after_score = Decimal(str(after_score))
+        statement = statement.where(
+            and_(score >= after_score, or_(score > after_score, Mission.id > mission_id))
+        )
+    return statement.order_by(score, Mission.id).limit(limit)
+
+
+def search_missions(
+    session: Session, query: str, *, after: SearchKey | None = None, limit: int
+) -> list[tuple[Mission, float | Decimal]]:
+    """Return up to ``limit`` missions matching ``query`` with their scores."""
+
+    terms = search_terms(query)
+    if not terms:
+        return []
+    dialect = session.get_bind().dialect.name
+    statement = search_statement(dialect, terms, after=after, limit=limit)
+    return [(mission, score) for mission, score in session.execute(statement)]
+
+
+def rebuild_search_index(session: Session) -> int:
+    """Rebuild the search index from ``missions`` and return the number of documents.
+
+    On SQLite the index tables are created if missing, emptied and refilled
+    inside the caller's transaction, then merged into a single FTS5 segment.
+    On PostgreSQL ``search_vector`` is a generated column, so this only
+    ensures the column and index exist.
+    """
+
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        for statement in SQLITE_SEARCH_DDL:
+            session.execute(text(statement))
+        session.execute(text("DELETE FROM missions_fts"))
+        session.execute(text("DELETE FROM mission_search_docs"))
+        session.execute(text("INSERT INTO mission_search_docs (mission_id) SELECT id FROM missions"))
+        session.execute(
+            text(
+                "INSERT INTO missions_fts (rowid, title, notes) "
+                "SELECT docs.docid, missions.title, missions.notes "
+                "FROM mission_search_docs AS docs JOIN missions ON missions.id = docs.mission_id"
+            )
+        )
+        session.execute(text("INSERT INTO missions_fts (missions_fts) VALUES ('optimize')"))
+    elif dialect == "postgresql":
+        for statement in POSTGRESQL_SEARCH_DDL:
+            session.execute(text(statement))
+    return session.scalar(select(func.count()).select_from(Mission)) or 0
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point: ``python -m app.missions.search``."""
+
+    parser = argparse.ArgumentParser(description="Rebuild the mission full-text search index.")
+    parser.parse_args(argv)
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(message)s", level=logging.INFO)
+    with session_scope() as session:
+        documents = rebuild_search_index(session)
+    logger.info("Rebuilt mission search index: %d documents", documents)
+
+
+__all__ = ["rebuild_search_index", "search_missions", "search_statement", "search_terms"]
+
+
+if __name__ == "__main__":  # pragma: no cover - exercised via the CLI
+    main()
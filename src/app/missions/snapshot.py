@@ -0,0 +1,284 @@
+"""Compact columnar snapshot of missions for read-heavy board views."""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ..models import Mission, MissionStatus, MissionStatusCount
+from ..settings import get_settings
+from .interval_index import time_key
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_STATUSES: tuple[MissionStatus, ...] = tuple(MissionStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+_COLUMNS = (
+    Mission.id,
+    Mission.title,
+    Mission.start_time,
+    Mission.end_time,
+    Mission.status,
+    Mission.updated_at,
+)
+
+
+class SnapshotRow(NamedTuple):
+    """One mission as served from the snapshot."""
+
+    id: uuid.UUID
+    title: str
+    start_time: datetime
+    end_time: datetime
+    status: MissionStatus
+
+
+class MissionSnapshot:
+    """Per-process, array-backed copy of the columns board views read.
+
+    Each mission costs a few dozen bytes: the id as 16 raw bytes, times as
+    int64 microseconds, the status as a one-byte code and the title as a
+    slice of one UTF-8 buffer, plus a dict entry mapping the id to its row.
+    Reads bisect a start-ordered permutation and never touch the database.
+
+    :meth:`refresh` fetches only rows whose ``updated_at`` reached the
+    watermark (less ``lag_seconds`` to tolerate clock skew between writers)
+    and upserts them in place. Deletes leave no ``updated_at`` behind, so
+    after each refresh the snapshot size is compared with the total of the
+    trigger-maintained ``mission_status_counts`` rollup, which costs one row
+    per day and status rather than a scan of ``missions``. A mismatch, or
+    titles buffer waste above half its size, triggers a full reload. Writes
+    that bypass ``updated_at`` are only seen on reload.
+    """
+
+    def __init__(self, max_age: float = 5.0, lag_seconds: float = 2.0) -> None:
+        self.max_age = max_age
+        self.lag = int(lag_seconds * 1_000_000)
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._clear()
+        self._loaded = False
+        self._refreshed_at = 0.0
+        self.reloads = 0
+
+    def _clear(self) -> None:
+        self._ids = bytearray()
+        self._starts = array("q")
+        self._ends = array("q")
+        self._updated = array("q")
+        self._status = array("B")
+        self._title_offsets = array("q")
+        self._title_lengths = array("I")
+        self._titles = bytearray()
+        self._title_waste = 0
+        self._rows: dict[bytes, int] = {}
+        self._order = array("q")
+        self._sorted_starts = array("q")
+        self._watermark = 0
+
+    @property
+    def loaded(self) -> bool:
+        """Return True once the snapshot has been populated from the database."""
+
+        return self._loaded
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the bytes held by the column buffers, excluding the id lookup."""
+
+        columns: Sequence[Any] = (
+            self._starts,
+            self._ends,
+            self._updated,
+            self._status,
+            self._title_offsets,
+            self._title_lengths,
+            self._order,
+            self._sorted_starts,
+        )
+        return len(self._ids) + len(self._titles) + sum(
+            column.itemsize * len(column) for column in columns
+        )
+
+    def _upsert(self, rows: Iterable[Any]) -> tuple[int, bool]:
+        """Write changed ``rows`` into the columns.
+
+        Returns the number of rows applied and whether the start order needs
+        recomputing. Rows already held at the same ``updated_at`` are skipped.
+        """
+
+        applied = 0
+        moved = False
+        for mission_id, title, start, end, status, updated in rows:
+            raw_id = mission_id.bytes
+            updated_key = time_key(updated)
+            row = self._rows.get(raw_id)
+            if row is not None and self._updated[row] == updated_key:
+                continue
+            encoded = title.encode("utf-8")
+            start_key = time_key(start)
+            if row is None:
+                moved = True
+                self._rows[raw_id] = len(self._starts)
+                self._ids += raw_id
+                self._starts.append(start_key)
+                self._ends.append(time_key(end))
+                self._updated.append(updated_key)
+                self._status.append(_STATUS_CODES[status])
+                self._title_offsets.append(len(self._titles))
+                self._title_lengths.append(len(encoded))
+                self._titles += encoded
+            else:
+                moved = moved or self._starts[row] != start_key
+                self._starts[row] = start_key
+                self._ends[row] = time_key(end)
+                self._updated[row] = updated_key
+                self._status[row] = _STATUS_CODES[status]
+                offset, length = self._title_offsets[row], self._title_lengths[row]
+                if self._titles[offset : offset + length] != encoded:
+                    self._title_waste += length
+                    self._title_offsets[row] = len(self._titles)
+                    self._title_lengths[row] = len(encoded)
+                    self._titles += encoded
+            self._watermark = max(self._watermark, updated_key)
+            applied += 1
+        return applied, moved
+
+    def _reorder(self) -> None:
+        # The previous order is nearly sorted, which timsort handles in ~O(n).
+        order = sorted(
+            self._order + array("q", range(len(self._order), len(self._starts))),
+            key=self._starts.__getitem__,
+        )
+        self._order = array("q", order)
+        self._sorted_starts = array("q", map(self._starts.__getitem__, order))
+
+    def load(self, session: Session) -> int:
+        """Rebuild the snapshot from the ``missions`` table and return its size."""
+
+        rows = session.execute(select(*_COLUMNS).order_by(Mission.start_time)).all()
+        with self._lock:
+            self._clear()
+            self._upsert(rows)
+            self._reorder()
+            self._loaded = True
+            self._refreshed_at = time.monotonic()
+            self.reloads += 1
+        return len(rows)
+
+    def refresh(self, session: Session) -> int:
+        """Apply rows changed since the watermark and return how many were applied.
+
+        Falls back to :meth:`load` on first use and whenever deleted rows or
+        wasted title space are detected.
+        """
+
+        with self._refresh_lock:
+            if not self._loaded:
+                return self.load(session)
+            since = _EPOCH + (self._watermark - self.lag) * _MICROSECOND
+            rows = session.execute(select(*_COLUMNS).where(Mission.updated_at >= since)).all()
+            total = session.scalar(select(func.coalesce(func.sum(MissionStatusCount.count), 0)))
+            with self._lock:
+                applied, moved = self._upsert(rows)
+                if moved:
+                    self._reorder()
+                self._refreshed_at = time.monotonic()
+                stale = len(self._rows) != total or self._title_waste * 2 > len(self._titles)
+            if stale:
+                return self.load(session)
+            return applied
+
+    def _row(self, position: int) -> SnapshotRow:
+        offset = self._title_offsets[position]
+        return SnapshotRow(
+            id=uuid.UUID(bytes=bytes(self._ids[position * 16 : position * 16 + 16])),
+            title=self._titles[offset : offset + self._title_lengths[position]].decode("utf-8"),
+            start_time=_EPOCH + self._starts[position] * _MICROSECOND,
+            end_time=_EPOCH + self._ends[position] * _MICROSECOND,
+            status=_STATUSES[self._status[position]],
+        )
+
+    def select(
+        self,
+        *,
+        start_from: datetime | None = None,
+        start_to: datetime | None = None,
+        statuses: Iterable[MissionStatus] | None = None,
+        limit: int | None = None,
+    ) -> list[SnapshotRow]:
+        """Return missions starting in ``[start_from, start_to)`` ordered by ``(start_time, id)``.
+
+        Runs entirely in memory: two bisects find the window, then rows are
+        scanned in start order until ``limit`` matches are collected.
+        """
+
+        codes = {_STATUS_CODES[status] for status in statuses} if statuses else None
+        with self._lock:
+            starts = self._sorted_starts
+            low = bisect_left(starts, time_key(start_from)) if start_from is not None else 0
+            high = bisect_left(starts, time_key(start_to)) if start_to is not None else len(starts)
+            found: list[tuple[int, bytes, int]] = []
+            for rank in range(low, high):
+                # Keep going past ``limit`` while start times tie so ids can break the tie.
+                if limit is not None and len(found) >= limit and (not found or starts[rank] != found[-1][0]):
+                    break
+                position = self._order[rank]
+                if codes is None or self._status[position] in codes:
+                    found.append(
+                        (starts[rank], bytes(self._ids[position * 16 : position * 16 + 16]), position)
+                    )
+            found.sort()
+            return [self._row(position) for _, _, position in found[:limit]]
+
+    def read(self, session: Session, **filters: Any) -> list[SnapshotRow]:
+        """Refresh from ``session`` when older than ``max_age``, then run :meth:`select`.
+
+        Only one request refreshes at a time; others keep reading the
+        current data instead of waiting for it.
+        """
+
+        if not self._loaded or time.monotonic() - self._refreshed_at > self.max_age:
+            if not self._loaded or not self._refresh_lock.locked():
+                self.refresh(session)
+        return self.select(**filters)
+
+
+_snapshot: MissionSnapshot | None = None
+
+
+def get_mission_snapshot() -> MissionSnapshot | None:
+    """Return the process-wide mission snapshot, or None when it is disabled."""
+
+    global _snapshot
+    settings = get_settings()
+    if _snapshot is None and settings.mission_snapshot:
+        _snapshot = MissionSnapshot(max_age=settings.mission_snapshot_max_age)
+    return _snapshot
+
+
+def reset_mission_snapshot() -> None:
+    """Discard the process-wide snapshot so it is reloaded on next use."""
+
+    global _snapshot
+    _snapshot = None
+
+
+__all__ = [
+    "MissionSnapshot",
+    "SnapshotRow",
+    "get_mission_snapshot",
+    "reset_mission_snapshot",
+]
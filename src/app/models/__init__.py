@@ -1,8 +1,19 @@
 """SQLAlchemy model exports."""
 
+from . import mission_search  # noqa: F401 - registers the search index DDL
 from .mission import Mission, MissionStatus
+from .mission_status_count import MissionStatusCount
 from .permission import Permission
+from .revoked_token import RevokedToken
 from .role import Role
 from .user import User
 
-__all__ = ["Mission", "MissionStatus", "Permission", "Role", "User"]
+__all__ = [
+    "Mission",
+    "MissionStatus",
+    "MissionStatusCount",
+    "Permission",
+    "RevokedToken",
+    "Role",
+    "User",
+]
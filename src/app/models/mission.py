@@ -4,12 +4,12 @@ from __future__ import annotations
 
 import enum
 import uuid
+from collections.abc import Iterable
 from datetime import UTC, datetime
-from typing import ClassVar
+from typing import ClassVar, NamedTuple
 
-from sqlalchemy import CheckConstraint, DateTime, Enum, Index, String, func
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import CheckConstraint, DateTime, Enum, Index, String, Uuid, func, select, update
+from sqlalchemy.orm import Mapped, Session, mapped_column
 
 from app.db import Base
 
@@ -34,6 +34,22 @@ def utcnow() -> datetime:
     return datetime.now(tz=UTC).replace(tzinfo=None)
 
 
+def utc_naive(value: datetime) -> datetime:
+    """Return ``value`` as a naive UTC datetime, the form mission times are stored in."""
+
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
+
+class BulkTransitionResult(NamedTuple):
+    """Ids grouped by the outcome of a bulk status transition."""
+
+    updated: list[uuid.UUID]
+    rejected: list[uuid.UUID]
+    not_found: list[uuid.UUID]
+
+
 class MissionMixin:
     """Shared transition helpers for missions."""
 
@@ -56,6 +72,14 @@ class MissionMixin:
         MissionStatus.CANCELED: set(),
     }
 
+    @classmethod
+    def allowed_predecessors(cls, target: MissionStatus) -> set[MissionStatus]:
+        """Return the statuses from which ``target`` may be reached."""
+
+        return {
+            current for current, targets in cls._ALLOWED_TRANSITIONS.items() if target in targets
+        }
+
     def can_transition_to(self, nxt: MissionStatus) -> bool:
         """Return True when the transition to ``nxt`` is allowed."""
 
@@ -92,10 +116,13 @@ class Mission(Base, MissionMixin):
     __table_args__ = (
         CheckConstraint("start_time < end_time", name="ck_missions_time_range"),
         Index("ix_missions_time_range", "start_time", "end_time"),
+        Index("ix_missions_updated_at", "updated_at", "id"),
     )
 
+    # Native UUID on PostgreSQL, CHAR(32) elsewhere. A column declared as
+    # ``UUID`` on SQLite gets NUMERIC affinity and coerces digit-only hex ids.
     id: Mapped[uuid.UUID] = mapped_column(
-        PGUUID(as_uuid=True),
+        Uuid(as_uuid=True),
         primary_key=True,
         default=uuid.uuid4,
     )
@@ -123,8 +150,50 @@ class Mission(Base, MissionMixin):
         onupdate=utcnow,
     )
 
+    @classmethod
+    def bulk_transition(
+        cls,
+        session: Session,
+        ids: Iterable[uuid.UUID],
+        target: MissionStatus,
+        batch_size: int = 500,
+    ) -> BulkTransitionResult:
+        """Move every mission in ``ids`` to ``target`` where the transition is allowed.
+
+        Each batch is a single ``UPDATE ... WHERE id IN (...) AND status IN
+        (<allowed predecessors>) RETURNING id``, so no rows are loaded into the
+        session. Ids left over are looked up once to split rejected
+        transitions from unknown missions. The caller commits.
+        """
+
+        predecessors = cls.allowed_predecessors(target)
+        requested = list(dict.fromkeys(ids))
+        updated: list[uuid.UUID] = []
+        now = utcnow()
+        for offset in range(0, len(requested) if predecessors else 0, batch_size):
+            batch = requested[offset : offset + batch_size]
+            statement = (
+                update(cls)
+                .where(cls.id.in_(batch), cls.status.in_(predecessors))
+                .values(status=target, updated_at=now)
+                .returning(cls.id)
+            )
+            updated.extend(session.scalars(statement))
+
+        done = set(updated)
+        leftover = [mission_id for mission_id in requested if mission_id not in done]
+        existing: set[uuid.UUID] = set()
+        for offset in range(0, len(leftover), batch_size):
+            batch = leftover[offset : offset + batch_size]
+            existing.update(session.scalars(select(cls.id).where(cls.id.in_(batch))))
+        return BulkTransitionResult(
+            updated=[mission_id for mission_id in requested if mission_id in done],
+            rejected=[mission_id for mission_id in leftover if mission_id in existing],
+            not_found=[mission_id for mission_id in leftover if mission_id not in existing],
+        )
+
     def __repr__(self) -> str:  # pragma: no cover - debugging helper
         return f"<Mission {self.id} {self.title} {self.status}>"
 
 
-__all__ = ["Mission", "MissionStatus"]
+__all__ = ["BulkTransitionResult", "Mission", "MissionStatus"]
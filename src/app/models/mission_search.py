@@ -0,0 +1,79 @@
+"""Full-text search index over mission titles and notes, kept in sync by the database."""
+
+from __future__ import annotations
+
+from sqlalchemy import DDL, event
+
+from ..db import Base
+
+# Kept in step with alembic/versions/20261018_05_create_mission_search_index.py.
+#
+# SQLite: an FTS5 table holding its own copy of title and notes. Its rowids
+# come from ``mission_search_docs`` rather than from ``missions``, whose
+# implicit rowids VACUUM may renumber.
+SQLITE_SEARCH_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS mission_search_docs (
+        docid INTEGER PRIMARY KEY,
+        mission_id CHAR(32) NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS missions_fts USING fts5(
+        title, notes, tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_missions_search_insert AFTER INSERT ON missions
+    BEGIN
+        INSERT INTO mission_search_docs (mission_id) VALUES (NEW.id);
+        INSERT INTO missions_fts (rowid, title, notes)
+        VALUES ((SELECT docid FROM mission_search_docs WHERE mission_id = NEW.id), NEW.title, NEW.notes);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_missions_search_update AFTER UPDATE OF title, notes ON missions
+    WHEN OLD.title IS NOT NEW.title OR OLD.notes IS NOT NEW.notes
+    BEGIN
+        UPDATE missions_fts SET title = NEW.title, notes = NEW.notes
+        WHERE rowid = (SELECT docid FROM mission_search_docs WHERE mission_id = NEW.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_missions_search_delete AFTER DELETE ON missions
+    BEGIN
+        DELETE FROM missions_fts
+        WHERE rowid = (SELECT docid FROM mission_search_docs WHERE mission_id = OLD.id);
+        DELETE FROM mission_search_docs WHERE mission_id = OLD.id;
+    END
+    """,
+)
+
+SQLITE_SEARCH_DROP = (
+    "DROP TABLE IF EXISTS missions_fts",
+    "DROP TABLE IF EXISTS mission_search_docs",
+)
+
+# PostgreSQL: a generated tsvector column (title weighted above notes) and a
+# GIN index, so no trigger is needed to keep it current.
+POSTGRESQL_SEARCH_DDL = (
+    """
+    ALTER TABLE missions ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(notes, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_missions_search ON missions USING GIN (search_vector)",
+)
+
+
+for _statement in SQLITE_SEARCH_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in SQLITE_SEARCH_DROP:
+    event.listen(Base.metadata, "before_drop", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in POSTGRESQL_SEARCH_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+
+
+__all__ = ["POSTGRESQL_SEARCH_DDL", "SQLITE_SEARCH_DDL", "SQLITE_SEARCH_DROP"]
@@ -0,0 +1,96 @@
+"""Per-day mission status counters maintained by database triggers."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy import DDL, Date, Enum, Integer, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..db import Base
+from .mission import MissionStatus
+
+# Kept in step with alembic/versions/20261018_03_create_mission_status_counts.py.
+SQLITE_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_missions_count_insert AFTER INSERT ON missions
+    BEGIN
+        INSERT INTO mission_status_counts (day, status, count)
+        VALUES (date(NEW.start_time), NEW.status, 1)
+        ON CONFLICT (day, status) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_missions_count_update AFTER UPDATE OF status, start_time ON missions
+    WHEN OLD.status IS NOT NEW.status OR date(OLD.start_time) IS NOT date(NEW.start_time)
+    BEGIN
+        UPDATE mission_status_counts SET count = count - 1
+        WHERE day = date(OLD.start_time) AND status = OLD.status;
+        INSERT INTO mission_status_counts (day, status, count)
+        VALUES (date(NEW.start_time), NEW.status, 1)
+        ON CONFLICT (day, status) DO UPDATE SET count = count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_missions_count_delete AFTER DELETE ON missions
+    BEGIN
+        UPDATE mission_status_counts SET count = count - 1
+        WHERE day = date(OLD.start_time) AND status = OLD.status;
+    END
+    """,
+)
+
+POSTGRESQL_TRIGGERS = (
+    """
+    CREATE OR REPLACE FUNCTION missions_count_status() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'UPDATE' AND OLD.status = NEW.status
+                AND OLD.start_time::date = NEW.start_time::date THEN
+            RETURN NULL;
+        END IF;
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            UPDATE mission_status_counts SET count = count - 1
+            WHERE day = OLD.start_time::date AND status = OLD.status;
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO mission_status_counts (day, status, count)
+            VALUES (NEW.start_time::date, NEW.status, 1)
+            ON CONFLICT (day, status) DO UPDATE SET count = mission_status_counts.count + 1;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER trg_missions_count_status
+    AFTER INSERT OR DELETE OR UPDATE OF status, start_time ON missions
+    FOR EACH ROW EXECUTE FUNCTION missions_count_status()
+    """,
+)
+
+
+class MissionStatusCount(Base):
+    """Number of missions starting on ``day`` that are currently in ``status``.
+
+    Rows are kept current by triggers on ``missions`` so every write path
+    (ORM flushes, bulk ``UPDATE`` statements, Core inserts, other workers)
+    is counted in the same transaction. Counts that reach zero are kept.
+    """
+
+    __tablename__ = "mission_status_counts"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    status: Mapped[MissionStatus] = mapped_column(
+        Enum(MissionStatus, name="mission_status", native_enum=False, validate_strings=True),
+        primary_key=True,
+    )
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+for _statement in SQLITE_TRIGGERS:
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in POSTGRESQL_TRIGGERS:
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+
+
+__all__ = ["MissionStatusCount"]
@@ -1,13 +1,38 @@
 """Pydantic schema exports."""
 
-from .mission import MissionBase, MissionCreate, MissionRead, MissionUpdate
+from .mission import (
+    MissionBase,
+    MissionBoardItem,
+    MissionChangePage,
+    MissionConflictReport,
+    MissionConflictRequest,
+    MissionCreate,
+    MissionDaySummary,
+    MissionImportError,
+    MissionImportReport,
+    MissionPage,
+    MissionRead,
+    MissionTransitionReport,
+    MissionTransitionRequest,
+    MissionUpdate,
+)
 from .token import AccessToken, RefreshRequest, TokenPair, TokenPayload
 from .user import UserBase, UserCreate, UserLogin, UserRead
 
 __all__ = [
     "MissionBase",
+    "MissionBoardItem",
+    "MissionChangePage",
+    "MissionConflictReport",
+    "MissionConflictRequest",
     "MissionCreate",
+    "MissionDaySummary",
+    "MissionImportError",
+    "MissionImportReport",
+    "MissionPage",
     "MissionRead",
+    "MissionTransitionReport",
+    "MissionTransitionRequest",
     "MissionUpdate",
     "AccessToken",
     "RefreshRequest",
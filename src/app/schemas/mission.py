@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Any, Optional
 import uuid
 
-from pydantic import BaseModel, ConfigDict, ValidationInfo, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
 from app.models import MissionStatus
+from app.models.mission import utc_naive
 
 
 class MissionBase(BaseModel):
@@ -20,6 +21,12 @@ class MissionBase(BaseModel):
     status: MissionStatus = MissionStatus.DRAFT
     notes: Optional[str] = None
 
+    @field_validator("start_time", "end_time")
+    @classmethod
+    def normalise_time(cls, value: datetime) -> datetime:
+        # Stored and compared as naive UTC, like the query filters.
+        return utc_naive(value)
+
     @field_validator("end_time")
     @classmethod
     def validate_interval(cls, end_time: datetime, info: ValidationInfo) -> datetime:
@@ -44,6 +51,19 @@ class MissionUpdate(BaseModel):
     status: Optional[MissionStatus] = None
     notes: Optional[str] = None
 
+    @field_validator("title", "start_time", "end_time")
+    @classmethod
+    def reject_null(cls, value: Any) -> Any:
+        # Omitting a field leaves it unchanged; these columns cannot be cleared.
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
+    @field_validator("start_time", "end_time")
+    @classmethod
+    def normalise_time(cls, value: Optional[datetime]) -> Optional[datetime]:
+        return utc_naive(value) if value is not None else None
+
     @field_validator("end_time")
     @classmethod
     def validate_interval_update(
@@ -56,9 +76,13 @@ class MissionUpdate(BaseModel):
 
 
 class MissionRead(BaseModel):
-    """Serialized mission returned by the API."""
+    """Serialized mission returned by the API.
 
-    id: str
+    ``id`` is rendered as its canonical string by pydantic-core's own UUID
+    serializer, so no Python hook runs per row in either direction.
+    """
+
+    id: uuid.UUID
     title: str
     start_time: datetime
     end_time: datetime
@@ -69,10 +93,91 @@ class MissionRead(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
-    @field_validator("id", mode="before")
-    @classmethod
-    def _stringify_id(cls, raw: uuid.UUID | str) -> str:
-        return str(raw)
+
+class MissionPage(BaseModel):
+    """One page of missions plus the cursor for the next page, if any."""
+
+    items: list[MissionRead]
+    next_cursor: Optional[str] = None
+
+
+class MissionChangePage(BaseModel):
+    """Missions changed after a feed cursor, oldest change first."""
+
+    items: list[MissionRead]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+class MissionImportError(BaseModel):
+    """Validation or database errors for one NDJSON line of an import."""
+
+    line: int
+    errors: list[dict[str, Any]]
+
+
+class MissionImportReport(BaseModel):
+    """Outcome of a bulk mission import."""
+
+    imported: int = 0
+    failed: int = 0
+    errors: list[MissionImportError] = []
+    errors_truncated: bool = False
+
+
+class MissionTransitionRequest(BaseModel):
+    """Bulk request to move missions to a new status."""
+
+    ids: list[uuid.UUID] = Field(min_length=1, max_length=10000)
+    status: MissionStatus
+
+
+class MissionTransitionReport(BaseModel):
+    """Ids grouped by the outcome of a bulk transition."""
+
+    status: MissionStatus
+    updated: list[uuid.UUID]
+    rejected: list[uuid.UUID]
+    not_found: list[uuid.UUID]
+
+
+class MissionDaySummary(BaseModel):
+    """Mission counts per status for one day of start times."""
+
+    day: date
+    counts: dict[MissionStatus, int]
+    total: int
+
+
+class MissionBoardItem(BaseModel):
+    """Compact mission row for board views."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    title: str
+    start_time: datetime
+    end_time: datetime
+    status: MissionStatus
+
+
+class MissionConflictRequest(BaseModel):
+    """Filter selecting the missions to check for schedule conflicts."""
+
+    start_from: Optional[datetime] = None
+    start_to: Optional[datetime] = None
+    status: Optional[list[MissionStatus]] = None
+    max_pairs: int = Field(default=1000, ge=0, le=100000)
+
+
+class MissionConflictReport(BaseModel):
+    """Overlapping missions found among those matching a filter."""
+
+    missions: int
+    pair_count: int
+    pairs: list[tuple[uuid.UUID, uuid.UUID]]
+    pairs_truncated: bool
+    clusters: list[list[uuid.UUID]]
 
 
 __all__ = [
@@ -80,4 +185,14 @@ __all__ = [
     "MissionCreate",
     "MissionUpdate",
     "MissionRead",
+    "MissionPage",
+    "MissionChangePage",
+    "MissionImportError",
+    "MissionImportReport",
+    "MissionTransitionRequest",
+    "MissionTransitionReport",
+    "MissionDaySummary",
+    "MissionBoardItem",
+    "MissionConflictRequest",
+    "MissionConflictReport",
 ]
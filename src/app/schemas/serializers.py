@@ -0,0 +1,44 @@
+"""Pre-built serializers that turn ORM objects into JSON bytes in one pass."""
+
+from __future__ import annotations
+
+from typing import Any, TypeVar
+
+from pydantic import TypeAdapter
+
+from .mission import MissionBoardItem, MissionPage, MissionRead
+from .user import UserRead
+
+T = TypeVar("T")
+
+# Building a TypeAdapter compiles its validator and serializer, so each one
+# is created once at import time and shared by every request.
+USER_READ: TypeAdapter[UserRead] = TypeAdapter(UserRead)
+USER_READ_LIST: TypeAdapter[list[UserRead]] = TypeAdapter(list[UserRead])
+MISSION_READ: TypeAdapter[MissionRead] = TypeAdapter(MissionRead)
+MISSION_READ_LIST: TypeAdapter[list[MissionRead]] = TypeAdapter(list[MissionRead])
+MISSION_PAGE: TypeAdapter[MissionPage] = TypeAdapter(MissionPage)
+MISSION_BOARD: TypeAdapter[list[MissionBoardItem]] = TypeAdapter(list[MissionBoardItem])
+
+
+def dump_json(adapter: TypeAdapter[T], value: Any) -> bytes:
+    """Validate ``value`` once and encode it straight to JSON bytes.
+
+    ``value`` may hold ORM objects, rows or any other objects with matching
+    attributes, nested inside dicts and lists. Instances of the target
+    models are passed through without being validated again, and the
+    encoding happens in pydantic-core without building intermediate dicts.
+    """
+
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+
+__all__ = [
+    "MISSION_BOARD",
+    "MISSION_PAGE",
+    "MISSION_READ",
+    "MISSION_READ_LIST",
+    "USER_READ",
+    "USER_READ_LIST",
+    "dump_json",
+]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class TokenPayload(BaseModel):
@@ -14,6 +14,9 @@ class TokenPayload(BaseModel):
     type: Literal["access", "refresh"]
     exp: int
     iat: int
+    jti: str | None = None
+
+    model_config = ConfigDict(frozen=True)
 
 
 class TokenPair(BaseModel):
@@ -9,16 +9,70 @@ from .jwt import (
     decode_token,
     iter_tokens,
 )
-from .password import hash_password, verify_password
+from .password import (
+    calibrate_bcrypt_rounds,
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
+from .password_service import (
+    PasswordService,
+    PasswordServiceBusyError,
+    get_password_service,
+    shutdown_password_service,
+)
+from .rate_limit import (
+    LoginRateLimiter,
+    SQLiteTokenBucketLimiter,
+    TokenBucketLimiter,
+    get_login_rate_limiter,
+    reset_login_rate_limiter,
+)
+from .rehash import PasswordRehasher, get_password_rehasher, shutdown_password_rehasher
+from .revocation import (
+    BloomFilter,
+    RevocationStore,
+    get_revocation_store,
+    reset_revocation_store,
+    run_revocation_compactor,
+)
+from .token_cache import TokenCache, get_token_cache, reset_token_cache
+from .user_cache import UserCache, UserSnapshot, get_user_cache, reset_user_cache
 
 __all__ = [
     "ALGORITHM",
+    "BloomFilter",
+    "LoginRateLimiter",
+    "PasswordRehasher",
+    "PasswordService",
+    "PasswordServiceBusyError",
     "TokenError",
+    "RevocationStore",
+    "SQLiteTokenBucketLimiter",
+    "TokenBucketLimiter",
+    "TokenCache",
     "TokenExpiredError",
+    "UserCache",
+    "UserSnapshot",
+    "calibrate_bcrypt_rounds",
     "create_access_token",
     "create_refresh_token",
     "decode_token",
+    "get_login_rate_limiter",
+    "get_password_rehasher",
+    "get_password_service",
+    "get_revocation_store",
+    "get_token_cache",
+    "get_user_cache",
     "hash_password",
     "iter_tokens",
+    "password_needs_rehash",
+    "reset_login_rate_limiter",
+    "reset_revocation_store",
+    "reset_token_cache",
+    "reset_user_cache",
+    "run_revocation_compactor",
+    "shutdown_password_rehasher",
+    "shutdown_password_service",
     "verify_password",
 ]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Generator
 
@@ -9,11 +11,17 @@ import jwt
 from jwt import ExpiredSignatureError, InvalidTokenError
 from pydantic import ValidationError
 
+from ..core.metrics import TOKEN_DECODE_SECONDS
 from ..schemas import TokenPayload
 from ..settings import get_settings
+from .token_cache import get_token_cache
 
 ALGORITHM = "HS256"
 
+_DECODE_SECONDS = {
+    outcome: TOKEN_DECODE_SECONDS.labels(outcome) for outcome in ("cached", "verified", "rejected")
+}
+
 
 class TokenError(Exception):
     """Base error for token validation failures."""
@@ -23,7 +31,7 @@ class TokenExpiredError(TokenError):
     """Raised when a token is expired."""
 
 
-def _issue_token(subject: str, token_type: str, ttl_seconds: int) -> str:
+def _issue_token(subject: str, token_type: str, ttl_seconds: int, jti: str | None = None) -> str:
     """Generate a signed JWT for the given subject and lifetime."""
 
     settings = get_settings()
@@ -34,6 +42,8 @@ def _issue_token(subject: str, token_type: str, ttl_seconds: int) -> str:
         "iat": int(now.timestamp()),
         "exp": int((now + timedelta(seconds=ttl_seconds)).timestamp()),
     }
+    if jti is not None:
+        payload["jti"] = jti
     return jwt.encode(payload, settings.auth_secret, algorithm=ALGORITHM)
 
 
@@ -46,17 +56,40 @@ def create_access_token(subject: str | int, ttl_seconds: int | None = None) -> s
 
 
 def create_refresh_token(subject: str | int, ttl_seconds: int | None = None) -> str:
-    """Create a refresh token for the provided subject."""
+    """Create a refresh token for the provided subject.
+
+    Each refresh token carries a unique ``jti`` so it can be rotated and revoked.
+    """
 
     settings = get_settings()
     lifetime = ttl_seconds or settings.auth_refresh_ttl
-    return _issue_token(str(subject), "refresh", lifetime)
+    return _issue_token(str(subject), "refresh", lifetime, jti=uuid.uuid4().hex)
 
 
 def decode_token(token: str) -> TokenPayload:
-    """Decode and validate a token, returning its payload."""
+    """Decode and validate a token, returning its payload.
+
+    Verified payloads are memoised in the process-wide token cache so repeated
+    presentations of the same token skip signature checks and validation.
+    """
+
+    started = time.perf_counter()
+    outcome = "rejected"
+    try:
+        payload, outcome = _decode_token(token)
+    finally:
+        _DECODE_SECONDS[outcome].observe(time.perf_counter() - started)
+    return payload
+
 
+def _decode_token(token: str) -> tuple[TokenPayload, str]:
     settings = get_settings()
+    cache = get_token_cache()
+    cache.bind_secret(settings.auth_secret)
+    cached = cache.get(token)
+    if cached is not None:
+        return cached, "cached"
+
     try:
         payload = jwt.decode(token, settings.auth_secret, algorithms=[ALGORITHM])
     except ExpiredSignatureError as exc:  # pragma: no cover - exercised via integration tests
@@ -65,10 +98,13 @@ def decode_token(token: str) -> TokenPayload:
         raise TokenError("Token is invalid") from exc
 
     try:
-        return TokenPayload(**payload)
+        token_payload = TokenPayload(**payload)
     except ValidationError as exc:
         raise TokenError("Token payload is malformed") from exc
 
+    cache.put(token, token_payload)
+    return token_payload, "verified"
+
 
 def iter_tokens(subject: str | int) -> Generator[str, None, None]:
     """Yield both access and refresh tokens for a subject."""
@@ -2,15 +2,33 @@
 
 from __future__ import annotations
 
+import math
+import time
+from functools import lru_cache
+
 from passlib.context import CryptContext
+from passlib.hash import bcrypt
+
+DEFAULT_BCRYPT_ROUNDS = 12
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 16
+
+_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=DEFAULT_BCRYPT_ROUNDS)
+
 
-_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+@lru_cache(maxsize=8)
+def _context_for(rounds: int) -> CryptContext:
+    """Return a crypt context producing bcrypt hashes with ``rounds`` cost."""
 
+    if rounds == DEFAULT_BCRYPT_ROUNDS:
+        return _pwd_context
+    return _pwd_context.copy(bcrypt__rounds=rounds)
 
-def hash_password(password: str) -> str:
-    """Return a secure password hash."""
 
-    return _pwd_context.hash(password)
+def hash_password(password: str, rounds: int | None = None) -> str:
+    """Return a secure password hash, optionally with an explicit bcrypt cost."""
+
+    return _context_for(rounds or DEFAULT_BCRYPT_ROUNDS).hash(password)
 
 
 def verify_password(password: str, password_hash: str) -> bool:
@@ -19,4 +37,50 @@ def verify_password(password: str, password_hash: str) -> bool:
     return _pwd_context.verify(password, password_hash)
 
 
-__all__ = ["hash_password", "verify_password"]
+def password_needs_rehash(password_hash: str, rounds: int | None = None) -> bool:
+    """Return True when ``password_hash`` is weaker than the ``rounds`` cost.
+
+    Hashes stronger than the current cost are left alone so nodes calibrated
+    to different costs do not keep rewriting each other's hashes.
+    """
+
+    try:
+        current = bcrypt.from_string(password_hash).rounds
+    except ValueError:
+        return True
+    return current < (rounds or DEFAULT_BCRYPT_ROUNDS)
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float,
+    *,
+    min_rounds: int = MIN_BCRYPT_ROUNDS,
+    max_rounds: int = MAX_BCRYPT_ROUNDS,
+    sample_rounds: int = 8,
+    samples: int = 3,
+) -> int:
+    """Pick the bcrypt cost whose hash latency is closest to ``target_ms``.
+
+    Each extra round doubles the work, so a fast sample at ``sample_rounds``
+    is extrapolated rather than hashing at every candidate cost. The result
+    is clamped to ``[min_rounds, max_rounds]``.
+    """
+
+    context = _context_for(sample_rounds)
+    elapsed_ms = math.inf
+    for _ in range(samples):
+        started = time.perf_counter()
+        context.hash("calibration-probe")
+        elapsed_ms = min(elapsed_ms, (time.perf_counter() - started) * 1000)
+
+    rounds = sample_rounds + round(math.log2(max(target_ms, 1e-3) / max(elapsed_ms, 1e-3)))
+    return max(min_rounds, min(max_rounds, rounds))
+
+
+__all__ = [
+    "DEFAULT_BCRYPT_ROUNDS",
+    "calibrate_bcrypt_rounds",
+    "hash_password",
+    "password_needs_rehash",
+    "verify_password",
+]
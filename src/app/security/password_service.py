@@ -0,0 +1,145 @@
+"""Asynchronous password hashing backed by a bounded process pool."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from ..core.metrics import PASSWORD_SECONDS
+from ..settings import get_settings
+from .password import (
+    DEFAULT_BCRYPT_ROUNDS,
+    calibrate_bcrypt_rounds,
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Timed here rather than inside hash_password/verify_password: with a process
+# pool those run in worker processes whose metrics the scrape never sees.
+_HASH_SECONDS = PASSWORD_SECONDS.labels("hash")
+_VERIFY_SECONDS = PASSWORD_SECONDS.labels("verify")
+
+
+class PasswordServiceBusyError(Exception):
+    """Raised when the hashing queue is full and the request must be shed."""
+
+
+class PasswordService:
+    """Run bcrypt work off the event loop with a bounded number of pending jobs.
+
+    ``max_workers`` processes execute the hashing so CPU-bound work is not
+    serialised by the GIL. A value of ``0`` falls back to the event loop's
+    default thread pool, which is convenient for tests and tiny deployments.
+    Once ``max_workers + max_pending`` jobs are in flight, new submissions fail
+    immediately with :class:`PasswordServiceBusyError` instead of queueing.
+    New hashes use ``rounds`` as their bcrypt cost.
+    """
+
+    def __init__(
+        self, max_workers: int, max_pending: int, rounds: int = DEFAULT_BCRYPT_ROUNDS
+    ) -> None:
+        self.rounds = rounds
+        self.max_workers = max(max_workers, 0)
+        self.max_pending = max(max_pending, 0)
+        self.capacity = max(self.max_workers, 1) + self.max_pending
+        self._executor: Executor | None = None
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of submitted jobs that have not completed yet."""
+
+        return self._in_flight
+
+    def _get_executor(self) -> Executor | None:
+        if self._executor is None and self.max_workers > 0:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def _submit(self, func: Callable[..., T], *args: Any) -> T:
+        if self._in_flight >= self.capacity:
+            raise PasswordServiceBusyError("Password hashing capacity exhausted")
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._in_flight -= 1
+
+    async def hash_password(self, password: str) -> str:
+        """Return a secure password hash computed by a worker."""
+
+        with _HASH_SECONDS.time():
+            return await self._submit(hash_password, password, self.rounds)
+
+    async def verify_password(self, password: str, password_hash: str) -> bool:
+        """Validate a clear-text password against a stored hash in a worker."""
+
+        with _VERIFY_SECONDS.time():
+            return await self._submit(verify_password, password, password_hash)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Return True when ``password_hash`` is weaker than the current cost."""
+
+        return password_needs_rehash(password_hash, self.rounds)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes, if any were started."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+_service: PasswordService | None = None
+
+
+def get_password_service() -> PasswordService:
+    """Return the process-wide password service, creating it from settings.
+
+    When ``password_target_ms`` is set the bcrypt cost is calibrated against
+    this machine on creation, which the application triggers at startup.
+    """
+
+    global _service
+    if _service is None:
+        settings = get_settings()
+        rounds = settings.password_bcrypt_rounds
+        if settings.password_target_ms > 0:
+            rounds = calibrate_bcrypt_rounds(settings.password_target_ms)
+            logger.info(
+                "Calibrated bcrypt cost to %d rounds for a %dms target",
+                rounds,
+                settings.password_target_ms,
+            )
+        _service = PasswordService(
+            max_workers=settings.password_pool_size,
+            max_pending=settings.password_queue_limit,
+            rounds=rounds,
+        )
+    return _service
+
+
+def shutdown_password_service() -> None:
+    """Dispose of the process-wide password service."""
+
+    global _service
+    if _service is not None:
+        _service.shutdown()
+        _service = None
+
+
+__all__ = [
+    "PasswordService",
+    "PasswordServiceBusyError",
+    "get_password_service",
+    "shutdown_password_service",
+]
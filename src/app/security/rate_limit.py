@@ -0,0 +1,247 @@
+"""Token-bucket rate limiting for credential endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+
+from ..settings import Settings, get_settings
+
+
+class TokenBucketLimiter:
+    """In-process token buckets keyed by arbitrary strings.
+
+    Buckets hold up to ``burst`` tokens and regain ``per_minute`` tokens per
+    minute. Refill is computed lazily when a key is touched, so idle keys cost
+    nothing. Keys are spread over ``shards`` independently locked dicts to
+    keep contention low. Each shard keeps its buckets in the order they were
+    last touched; once it grows past ``max_keys_per_shard``, buckets that
+    have refilled completely are dropped from the least recently touched
+    end, which is lossless and costs amortised O(1) per hit.
+    """
+
+    def __init__(
+        self,
+        burst: float,
+        per_minute: float,
+        shards: int = 16,
+        max_keys_per_shard: int = 4096,
+    ) -> None:
+        self.burst = float(burst)
+        self.rate = per_minute / 60.0
+        self.max_keys_per_shard = max_keys_per_shard
+        self._shards: list[tuple[threading.Lock, OrderedDict[str, tuple[float, float]]]] = [
+            (threading.Lock(), OrderedDict()) for _ in range(max(shards, 1))
+        ]
+
+    @property
+    def enabled(self) -> bool:
+        """Return False when the limiter is configured to allow everything."""
+
+        return self.burst > 0
+
+    def _refilled(self, tokens: float, updated: float, now: float) -> float:
+        return min(self.burst, tokens + (now - updated) * self.rate)
+
+    def _prune(self, buckets: OrderedDict[str, tuple[float, float]], now: float) -> None:
+        # Stops at the first bucket still refilling, so a shard full of busy
+        # keys costs one check per hit rather than a scan.
+        while buckets:
+            key, (tokens, updated) = next(iter(buckets.items()))
+            if self._refilled(tokens, updated, now) < self.burst:
+                return
+            del buckets[key]
+
+    def hit(self, key: str, now: float | None = None) -> float:
+        """Consume one token for ``key``.
+
+        Returns ``0.0`` when the call is allowed, otherwise the number of
+        seconds until a token becomes available.
+        """
+
+        if not self.enabled:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        lock, buckets = self._shards[zlib.crc32(key.encode("utf-8")) % len(self._shards)]
+        with lock:
+            # Popping and re-adding moves the key to the most recently touched end.
+            tokens, updated = buckets.pop(key, (self.burst, now))
+            tokens = self._refilled(tokens, updated, now)
+            if tokens < 1.0:
+                buckets[key] = (tokens, now)
+                return (1.0 - tokens) / self.rate if self.rate > 0 else float("inf")
+            buckets[key] = (tokens - 1.0, now)
+            if len(buckets) > self.max_keys_per_shard:
+                self._prune(buckets, now)
+            return 0.0
+
+    async def ahit(self, key: str) -> float:
+        """Async variant of :meth:`hit`; in-memory buckets never block."""
+
+        return self.hit(key)
+
+    def reset(self) -> None:
+        """Forget every bucket."""
+
+        for lock, buckets in self._shards:
+            with lock:
+                buckets.clear()
+
+
+class SQLiteTokenBucketLimiter(TokenBucketLimiter):
+    """Token buckets persisted in a SQLite file shared by every worker.
+
+    Each hit runs in one ``BEGIN IMMEDIATE`` transaction, so concurrent
+    workers on the same host see a consistent count. Calls happen in a
+    worker thread when awaited through :meth:`ahit`. A bucket untouched for
+    ``burst / rate`` seconds has refilled completely; such rows are deleted,
+    losslessly, at most once per that period when a new key is added.
+    """
+
+    def __init__(self, burst: float, per_minute: float, path: str, namespace: str) -> None:
+        super().__init__(burst, per_minute, shards=1)
+        self.path = path
+        self.namespace = namespace
+        self._local = threading.local()
+        self._refill_seconds = self.burst / self.rate if self.rate > 0 else float("inf")
+        self._pruned_at = 0.0
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+                "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_rate_limit_buckets_updated ON rate_limit_buckets (updated)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=OFF")
+            self._local.connection = connection
+        return connection
+
+    def hit(self, key: str, now: float | None = None) -> float:
+        if not self.enabled:
+            return 0.0
+        # Wall-clock time because the value is shared across processes.
+        now = time.time() if now is None else now
+        scoped = f"{self.namespace}:{key}"
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT tokens, updated FROM rate_limit_buckets WHERE key = ?", (scoped,)
+            ).fetchone()
+            tokens = self.burst if row is None else self._refilled(row[0], row[1], now)
+            allowed = tokens >= 1.0
+            remaining = tokens - 1.0 if allowed else tokens
+            connection.execute(
+                "INSERT INTO rate_limit_buckets (key, tokens, updated) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated",
+                (scoped, remaining, now),
+            )
+            if row is None:
+                self._prune_rows(connection, now)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        if allowed:
+            return 0.0
+        return (1.0 - tokens) / self.rate if self.rate > 0 else float("inf")
+
+    def _prune_rows(self, connection: sqlite3.Connection, now: float) -> None:
+        # The index on ``updated`` keeps a pass proportional to the rows it deletes.
+        if now - self._pruned_at < self._refill_seconds:
+            return
+        self._pruned_at = now
+        connection.execute(
+            "DELETE FROM rate_limit_buckets WHERE updated <= ? AND key >= ? AND key < ?",
+            (now - self._refill_seconds, f"{self.namespace}:", f"{self.namespace};"),
+        )
+
+    async def ahit(self, key: str) -> float:
+        if not self.enabled:
+            return 0.0
+        return await asyncio.to_thread(self.hit, key)
+
+    def reset(self) -> None:
+        connection = self._connect()
+        connection.execute("DELETE FROM rate_limit_buckets WHERE key LIKE ?", (f"{self.namespace}:%",))
+
+
+class LoginRateLimiter:
+    """Per-email and per-client-IP buckets guarding ``/auth/login``."""
+
+    def __init__(self, by_email: TokenBucketLimiter, by_ip: TokenBucketLimiter) -> None:
+        self.by_email = by_email
+        self.by_ip = by_ip
+        self.rejected = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "LoginRateLimiter":
+        """Build the limiter for the configured backend."""
+
+        limits = {
+            "email": (settings.auth_login_email_burst, settings.auth_login_email_per_minute),
+            "ip": (settings.auth_login_ip_burst, settings.auth_login_ip_per_minute),
+        }
+        if settings.auth_rate_limit_backend == "sqlite":
+            path = settings.auth_rate_limit_sqlite_path
+            return cls(
+                SQLiteTokenBucketLimiter(*limits["email"], path=path, namespace="login-email"),
+                SQLiteTokenBucketLimiter(*limits["ip"], path=path, namespace="login-ip"),
+            )
+        return cls(TokenBucketLimiter(*limits["email"]), TokenBucketLimiter(*limits["ip"]))
+
+    async def check(self, email: str, client_ip: str | None) -> float:
+        """Consume a token from both buckets; return seconds to wait, or ``0.0``.
+
+        The client's bucket is charged first and an exhausted one stops the
+        check there, so a client spraying many emails cannot drain their
+        owners' buckets once it is over its own budget.
+        """
+
+        retry_after = await self.by_ip.ahit(client_ip) if client_ip else 0.0
+        if not retry_after:
+            retry_after = await self.by_email.ahit(email.lower())
+        if retry_after:
+            self.rejected += 1
+        return retry_after
+
+
+_limiter: LoginRateLimiter | None = None
+
+
+def get_login_rate_limiter() -> LoginRateLimiter:
+    """Return the process-wide login limiter configured from settings."""
+
+    global _limiter
+    if _limiter is None:
+        _limiter = LoginRateLimiter.from_settings(get_settings())
+    return _limiter
+
+
+def reset_login_rate_limiter() -> None:
+    """Discard the process-wide limiter so it is rebuilt from current settings."""
+
+    global _limiter
+    _limiter = None
+
+
+__all__ = [
+    "LoginRateLimiter",
+    "SQLiteTokenBucketLimiter",
+    "TokenBucketLimiter",
+    "get_login_rate_limiter",
+    "reset_login_rate_limiter",
+]
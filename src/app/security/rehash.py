@@ -0,0 +1,137 @@
+"""Deferred, batched upgrades of password hashes after successful logins."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Callable
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db import session as session_module
+from ..models import User
+from ..settings import get_settings
+from .password_service import PasswordService, PasswordServiceBusyError, get_password_service
+
+logger = logging.getLogger(__name__)
+
+_users = User.__table__
+_REHASH_STATEMENT = (
+    update(_users)
+    .where(_users.c.id == bindparam("b_id"), _users.c.password_hash == bindparam("b_old"))
+    .values(password_hash=bindparam("b_new"))
+)
+
+
+class PasswordRehasher:
+    """Collect upgraded hashes and write them in batches off the request path.
+
+    :meth:`submit` computes the new hash in the password service and queues
+    it. The queue is written with a single executemany ``UPDATE`` once
+    ``batch_size`` entries are pending or ``flush_interval`` seconds after the
+    first one arrives. Rows whose hash changed in the meantime are left alone.
+    """
+
+    def __init__(
+        self,
+        passwords: PasswordService,
+        batch_size: int,
+        flush_interval: float,
+        session_factory: Callable[[], AsyncSession] | None = None,
+    ) -> None:
+        self.passwords = passwords
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = max(flush_interval, 0)
+        self._session_factory = session_factory
+        self._pending: dict[int, tuple[str, str]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+
+    @property
+    def pending(self) -> int:
+        """Return the number of upgraded hashes waiting to be written."""
+
+        return len(self._pending)
+
+    async def submit(self, user_id: int, password: str, old_hash: str) -> None:
+        """Hash ``password`` at the current cost and queue the write."""
+
+        try:
+            new_hash = await self.passwords.hash_password(password)
+        except PasswordServiceBusyError:
+            logger.info("Skipping hash upgrade for user %s: hashing pool busy", user_id)
+            return
+
+        self._pending[user_id] = (old_hash, new_hash)
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Write every pending hash and return how many rows were updated.
+
+        If the write fails the error is logged and the batch is queued again
+        for the next flush, behind any newer hash for the same user.
+        """
+
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+        params = [
+            {"b_id": user_id, "b_old": old_hash, "b_new": new_hash}
+            for user_id, (old_hash, new_hash) in batch.items()
+        ]
+        factory = self._session_factory or session_module.AsyncSessionLocal
+        try:
+            async with factory() as session:
+                result = await session.execute(_REHASH_STATEMENT, params)
+                await session.commit()
+        except Exception:
+            logger.exception("Failed to write %d upgraded password hashes; keeping them queued", len(batch))
+            self._pending = {**batch, **self._pending}
+            return 0
+        logger.info("Upgraded %d password hashes", result.rowcount)
+        return result.rowcount
+
+    async def close(self) -> None:
+        """Cancel the pending timer and write whatever is still queued."""
+
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+
+
+_rehasher: PasswordRehasher | None = None
+
+
+def get_password_rehasher() -> PasswordRehasher:
+    """Return the process-wide rehasher configured from settings."""
+
+    global _rehasher
+    if _rehasher is None:
+        settings = get_settings()
+        _rehasher = PasswordRehasher(
+            get_password_service(),
+            batch_size=settings.password_rehash_batch_size,
+            flush_interval=settings.password_rehash_flush_interval,
+        )
+    return _rehasher
+
+
+async def shutdown_password_rehasher() -> None:
+    """Flush and dispose of the process-wide rehasher."""
+
+    global _rehasher
+    if _rehasher is not None:
+        rehasher, _rehasher = _rehasher, None
+        await rehasher.close()
+
+
+__all__ = ["PasswordRehasher", "get_password_rehasher", "shutdown_password_rehasher"]
@@ -0,0 +1,166 @@
+"""Refresh token revocation store with an in-memory Bloom filter."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import math
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db import session as session_module
+from ..db.dialects import dialect_insert
+from ..models import RevokedToken
+from ..settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(tz=UTC).replace(tzinfo=None)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings using double hashing.
+
+    Membership tests never return false negatives; false positives occur at
+    roughly ``error_rate`` while fewer than ``capacity`` items are stored.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        capacity = max(capacity, 1)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        return [(first + index * second) % self.size for index in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        """Insert ``item`` into the filter."""
+
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, str):
+            return False
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class RevocationStore:
+    """Authoritative revocations in ``revoked_tokens`` fronted by a Bloom filter.
+
+    A token absent from the filter is definitely not revoked, so the common
+    case needs no query. The filter is rebuilt from the table on first use
+    and after each compaction, and updated as tokens are revoked in-process.
+    Revocations written by other workers are still caught because
+    :meth:`revoke` relies on the table's primary key, not on the filter.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self.negative_lookups = 0
+        self.database_lookups = 0
+
+    async def load(self, db: AsyncSession) -> int:
+        """Rebuild the filter from unexpired table rows and return their count."""
+
+        async with self._load_lock:
+            rebuilt = BloomFilter(self.capacity, self.error_rate)
+            jtis = await db.scalars(
+                select(RevokedToken.jti).where(RevokedToken.expires_at > _utcnow())
+            )
+            for jti in jtis:
+                rebuilt.add(jti)
+            self._filter = rebuilt
+            self._loaded = True
+        return rebuilt.count
+
+    async def is_revoked(self, db: AsyncSession, jti: str) -> bool:
+        """Return True if ``jti`` has been revoked."""
+
+        if not self._loaded:
+            await self.load(db)
+        if jti not in self._filter:
+            self.negative_lookups += 1
+            return False
+        self.database_lookups += 1
+        return await db.get(RevokedToken, jti) is not None
+
+    async def revoke(self, db: AsyncSession, jti: str, expires_at: datetime) -> bool:
+        """Record ``jti`` as revoked; return False if it already was.
+
+        The caller owns the transaction and must commit it.
+        """
+
+        statement = (
+            dialect_insert(db.get_bind().dialect.name, RevokedToken)
+            .values(jti=jti, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[RevokedToken.jti])
+            .returning(RevokedToken.jti)
+        )
+        inserted = (await db.execute(statement)).scalar_one_or_none()
+        self._filter.add(jti)
+        return inserted is not None
+
+    async def compact(self, db: AsyncSession) -> int:
+        """Delete expired revocations, rebuild the filter and return the count."""
+
+        result = await db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= _utcnow()))
+        await db.commit()
+        await self.load(db)
+        return result.rowcount
+
+
+async def run_revocation_compactor(store: RevocationStore, interval: float) -> None:
+    """Compact ``store`` every ``interval`` seconds until cancelled."""
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with session_module.AsyncSessionLocal() as session:
+                removed = await store.compact(session)
+            logger.info("Compacted %d expired token revocations", removed)
+        except Exception:  # pragma: no cover - keep the loop alive on transient errors
+            logger.exception("Token revocation compaction failed")
+
+
+_store: RevocationStore | None = None
+
+
+def get_revocation_store() -> RevocationStore:
+    """Return the process-wide revocation store sized from settings."""
+
+    global _store
+    if _store is None:
+        _store = RevocationStore(get_settings().auth_revocation_filter_capacity)
+    return _store
+
+
+def reset_revocation_store() -> None:
+    """Discard the process-wide store so it is rebuilt on next use."""
+
+    global _store
+    _store = None
+
+
+__all__ = [
+    "BloomFilter",
+    "RevocationStore",
+    "get_revocation_store",
+    "reset_revocation_store",
+    "run_revocation_compactor",
+]
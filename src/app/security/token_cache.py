@@ -0,0 +1,119 @@
+"""Bounded in-process cache of verified token payloads."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from ..schemas import TokenPayload
+from ..settings import get_settings
+
+
+def _digest(value: str) -> bytes:
+    """Return a compact, collision-resistant key for ``value``."""
+
+    return hashlib.sha256(value.encode("utf-8")).digest()
+
+
+class TokenCache:
+    """LRU cache mapping token digests to validated payloads.
+
+    Entries are dropped once the token's ``exp`` claim has passed, when the
+    capacity is exceeded (least recently used first) or when the signing
+    secret changes. Only the SHA-256 digests of tokens and secrets are kept.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(capacity, 0)
+        self._entries: OrderedDict[bytes, TokenPayload] = OrderedDict()
+        self._secret_digest: bytes | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def bind_secret(self, secret: str) -> None:
+        """Invalidate every entry if ``secret`` differs from the cached one."""
+
+        digest = _digest(secret)
+        if digest == self._secret_digest:
+            return
+        with self._lock:
+            if digest != self._secret_digest:
+                self._entries.clear()
+                self._secret_digest = digest
+
+    def get(self, token: str) -> TokenPayload | None:
+        """Return the cached payload for ``token`` if present and unexpired."""
+
+        key = _digest(token)
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None and payload.exp <= time.time():
+                del self._entries[key]
+                self.evictions += 1
+                payload = None
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return payload
+
+    def put(self, token: str, payload: TokenPayload) -> None:
+        """Store a verified payload, evicting the least recently used entry."""
+
+        if self.capacity == 0:
+            return
+        key = _digest(token)
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters alongside the current size."""
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "capacity": self.capacity,
+        }
+
+
+_cache: TokenCache | None = None
+
+
+def get_token_cache() -> TokenCache:
+    """Return the process-wide token cache sized from settings."""
+
+    global _cache
+    if _cache is None:
+        _cache = TokenCache(get_settings().auth_token_cache_size)
+    return _cache
+
+
+def reset_token_cache() -> None:
+    """Discard the process-wide cache so it is rebuilt from current settings."""
+
+    global _cache
+    _cache = None
+
+
+__all__ = ["TokenCache", "get_token_cache", "reset_token_cache"]
@@ -0,0 +1,170 @@
+"""Short-lived cache of authenticated user snapshots."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..models import User
+from ..settings import get_settings
+
+
+@dataclass(frozen=True, slots=True)
+class UserSnapshot:
+    """Detached, immutable view of the user fields needed per request."""
+
+    id: int
+    email: str
+    is_active: bool
+    created_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        """Copy the relevant columns out of an ORM ``User`` instance."""
+
+        return cls(
+            id=user.id,
+            email=user.email,
+            is_active=user.is_active,
+            created_at=user.created_at,
+        )
+
+
+class UserCache:
+    """TTL plus LRU cache of :class:`UserSnapshot` keyed by user id.
+
+    Entries live for at most ``ttl_seconds`` and the least recently used ones
+    are dropped beyond ``capacity``. ORM updates and deletes of ``User`` rows
+    invalidate the matching entry once their transaction commits; bulk Core
+    statements that bypass the ORM must call :meth:`invalidate` themselves or
+    rely on the TTL.
+    """
+
+    def __init__(self, capacity: int, ttl_seconds: float) -> None:
+        self.capacity = max(capacity, 0)
+        self.ttl_seconds = max(ttl_seconds, 0)
+        self._entries: OrderedDict[int, tuple[float, UserSnapshot]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, user_id: int) -> UserSnapshot | None:
+        """Return a fresh snapshot for ``user_id`` or ``None`` on a miss."""
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[user_id]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, snapshot: UserSnapshot) -> None:
+        """Cache ``snapshot`` until the TTL elapses."""
+
+        if self.capacity == 0 or self.ttl_seconds == 0:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[snapshot.id] = (expires_at, snapshot)
+            self._entries.move_to_end(snapshot.id)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """Forget the cached snapshot for ``user_id``, if any."""
+
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict[str, float]:
+        """Return hit/miss counters, the hit rate and the current size."""
+
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "capacity": self.capacity,
+        }
+
+
+_cache: UserCache | None = None
+
+
+def get_user_cache() -> UserCache:
+    """Return the process-wide user cache configured from settings."""
+
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = UserCache(settings.auth_user_cache_size, settings.auth_user_cache_ttl)
+    return _cache
+
+
+def reset_user_cache() -> None:
+    """Discard the process-wide cache so it is rebuilt from current settings."""
+
+    global _cache
+    _cache = None
+
+
+_PENDING_KEY = "user_cache_invalidations"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, _flush_context: Any) -> None:
+    """Remember users flushed as modified or removed until the transaction commits.
+
+    Evicting at flush time would let a concurrent request re-cache the
+    still-committed row before this transaction's change became visible.
+    """
+
+    if _cache is None:
+        return
+    changed = [
+        instance.id
+        for instance in (*session.dirty, *session.deleted)
+        if isinstance(instance, User) and instance.id is not None
+    ]
+    if changed:
+        session.info.setdefault(_PENDING_KEY, set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_users(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending or _cache is None:
+        return
+    for user_id in pending:
+        _cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_changed_users(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+__all__ = ["UserCache", "UserSnapshot", "get_user_cache", "reset_user_cache"]
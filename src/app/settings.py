@@ -8,8 +8,6 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
-from app.core.config import get_app_version
-
 
 class Settings(BaseModel):
     """Runtime configuration values for the FastAPI service."""
@@ -19,8 +17,8 @@ class Settings(BaseModel):
         default="development", description="Execution environment identifier."
     )
     app_version: str = Field(
-        default=get_app_version(),
-        description="Published application version string.",
+        default="",
+        description="Published application version string; read from pyproject.toml at startup when empty.",
     )
     host: str = Field(default="127.0.0.1", description="Default bind host for the ASGI server.")
     port: int = Field(default=8000, description="Default bind port for the ASGI server.")
@@ -28,6 +26,89 @@ class Settings(BaseModel):
         default="sqlite:///./codex.db",
         description="Database connection string compatible with SQLAlchemy.",
     )
+    db_pool_size: int = Field(
+        default=5,
+        description="Connections kept open in the database pool.",
+    )
+    db_max_overflow: int = Field(
+        default=10,
+        description="Extra connections allowed beyond the pool size under load.",
+    )
+    db_pool_timeout: float = Field(
+        default=30.0,
+        description="Seconds to wait for a pooled connection before failing.",
+    )
+    db_pool_recycle: int = Field(
+        default=1800,
+        description="Seconds after which pooled connections are replaced (-1 disables).",
+    )
+    db_pool_pre_ping: bool = Field(
+        default=True,
+        description="Test pooled connections for liveness before handing them out.",
+    )
+    ready_check_interval: float = Field(
+        default=5.0,
+        description="Seconds between background database checks reported by /ready.",
+    )
+    ready_check_timeout: float = Field(
+        default=2.0,
+        description="Seconds a readiness check may wait for a connection and SELECT 1.",
+    )
+    sqlite_tuning: bool = Field(
+        default=False,
+        description="Apply the SQLite performance profile (WAL, mmap, tuned pragmas).",
+    )
+    sqlite_journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY"] = Field(
+        default="WAL",
+        description="SQLite journal_mode used by the performance profile.",
+    )
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(
+        default="NORMAL",
+        description="SQLite synchronous level used by the performance profile.",
+    )
+    sqlite_mmap_size: int = Field(
+        default=268435456,
+        description="Bytes of the SQLite database file to memory-map.",
+    )
+    sqlite_cache_size: int = Field(
+        default=-64000,
+        description="SQLite page cache size (negative values are KiB).",
+    )
+    sqlite_busy_timeout: int = Field(
+        default=5000,
+        description="Milliseconds SQLite waits on a locked database before failing.",
+    )
+    sqlite_temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = Field(
+        default="MEMORY",
+        description="Where SQLite keeps temporary tables and indices.",
+    )
+    mission_interval_index: bool = Field(
+        default=False,
+        description=(
+            "Answer mission overlap queries from an in-memory interval index; it only sees this "
+            "process's writes, so enable it for single-worker deployments only."
+        ),
+    )
+    mission_import_batch_size: int = Field(
+        default=1000,
+        description="Mission rows validated and inserted per batch during NDJSON imports.",
+    )
+    mission_snapshot: bool = Field(
+        default=True,
+        description="Serve mission board reads from an in-memory columnar snapshot.",
+    )
+    mission_snapshot_max_age: float = Field(
+        default=5.0,
+        description="Seconds a mission snapshot is served before it is refreshed.",
+    )
+    mission_changes_poll_interval: float = Field(
+        default=1.0,
+        description="Seconds between change feed polls when no local commit wakes it.",
+    )
+    mission_changes_queue_size: int = Field(
+        default=64,
+        description="Change batches buffered per stream subscriber before it is dropped.",
+    )
     auth_secret: str = Field(
         default="change-me",
         description="Secret key used to sign authentication tokens.",
@@ -40,6 +121,83 @@ class Settings(BaseModel):
         default=604800,
         description="Lifetime for refresh tokens in seconds.",
     )
+    auth_login_email_burst: int = Field(
+        default=10,
+        description="Login attempts allowed back-to-back for one email (0 disables).",
+    )
+    auth_login_email_per_minute: float = Field(
+        default=5.0,
+        description="Login attempts regained per minute for one email.",
+    )
+    auth_login_ip_burst: int = Field(
+        default=50,
+        description="Login attempts allowed back-to-back from one client IP (0 disables).",
+    )
+    auth_login_ip_per_minute: float = Field(
+        default=30.0,
+        description="Login attempts regained per minute for one client IP.",
+    )
+    auth_rate_limit_backend: Literal["memory", "sqlite"] = Field(
+        default="memory",
+        description="Keep login buckets per process or in a SQLite file shared by workers.",
+    )
+    auth_rate_limit_sqlite_path: str = Field(
+        default="./rate_limit.db",
+        description="SQLite file holding shared login buckets.",
+    )
+    auth_revocation_filter_capacity: int = Field(
+        default=100000,
+        description="Expected revoked refresh tokens sized into the Bloom filter.",
+    )
+    auth_revocation_compact_interval: int = Field(
+        default=3600,
+        description="Seconds between purges of expired revocations (0 disables).",
+    )
+    auth_token_cache_size: int = Field(
+        default=4096,
+        description="Verified tokens kept in memory to skip repeated decoding (0 disables).",
+    )
+    auth_user_cache_size: int = Field(
+        default=1024,
+        description="Authenticated user snapshots kept in memory (0 disables).",
+    )
+    auth_user_cache_ttl: int = Field(
+        default=60,
+        description="Seconds a cached user snapshot stays valid.",
+    )
+    password_bcrypt_rounds: int = Field(
+        default=12,
+        description="bcrypt cost for new hashes when no latency target is set.",
+    )
+    password_target_ms: int = Field(
+        default=0,
+        description="Calibrate the bcrypt cost at startup to this hash latency (0 disables).",
+    )
+    password_rehash_batch_size: int = Field(
+        default=32,
+        description="Upgraded password hashes written per batched UPDATE.",
+    )
+    password_rehash_flush_interval: float = Field(
+        default=2.0,
+        description="Seconds a partial batch of upgraded hashes waits before being written.",
+    )
+    password_pool_size: int = Field(
+        default=2,
+        description="Worker processes used for bcrypt hashing (0 uses the threadpool).",
+    )
+    password_queue_limit: int = Field(
+        default=32,
+        description="Hashing jobs allowed to wait for a worker before requests get a 503.",
+    )
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Interpret common truthy/falsy spellings of an environment variable."""
+
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
 @lru_cache(maxsize=1)
@@ -55,6 +213,74 @@ def get_settings() -> Settings:
         database_url=os.getenv(
             "DATABASE_URL", Settings.model_fields["database_url"].default
         ),
+        db_pool_size=int(os.getenv("DB_POOL_SIZE", Settings.model_fields["db_pool_size"].default)),
+        db_max_overflow=int(
+            os.getenv("DB_MAX_OVERFLOW", Settings.model_fields["db_max_overflow"].default)
+        ),
+        db_pool_timeout=float(
+            os.getenv("DB_POOL_TIMEOUT", Settings.model_fields["db_pool_timeout"].default)
+        ),
+        db_pool_recycle=int(
+            os.getenv("DB_POOL_RECYCLE", Settings.model_fields["db_pool_recycle"].default)
+        ),
+        db_pool_pre_ping=_env_bool(
+            "DB_POOL_PRE_PING", Settings.model_fields["db_pool_pre_ping"].default
+        ),
+        ready_check_interval=float(
+            os.getenv("READY_CHECK_INTERVAL", Settings.model_fields["ready_check_interval"].default)
+        ),
+        ready_check_timeout=float(
+            os.getenv("READY_CHECK_TIMEOUT", Settings.model_fields["ready_check_timeout"].default)
+        ),
+        sqlite_tuning=_env_bool("SQLITE_TUNING", Settings.model_fields["sqlite_tuning"].default),
+        sqlite_journal_mode=os.getenv(
+            "SQLITE_JOURNAL_MODE", Settings.model_fields["sqlite_journal_mode"].default
+        ).upper(),
+        sqlite_synchronous=os.getenv(
+            "SQLITE_SYNCHRONOUS", Settings.model_fields["sqlite_synchronous"].default
+        ).upper(),
+        sqlite_mmap_size=int(
+            os.getenv("SQLITE_MMAP_SIZE", Settings.model_fields["sqlite_mmap_size"].default)
+        ),
+        sqlite_cache_size=int(
+            os.getenv("SQLITE_CACHE_SIZE", Settings.model_fields["sqlite_cache_size"].default)
+        ),
+        sqlite_busy_timeout=int(
+            os.getenv("SQLITE_BUSY_TIMEOUT", Settings.model_fields["sqlite_busy_timeout"].default)
+        ),
+        sqlite_temp_store=os.getenv(
+            "SQLITE_TEMP_STORE", Settings.model_fields["sqlite_temp_store"].default
+        ).upper(),
+        mission_interval_index=_env_bool(
+            "MISSION_INTERVAL_INDEX", Settings.model_fields["mission_interval_index"].default
+        ),
+        mission_import_batch_size=int(
+            os.getenv(
+                "MISSION_IMPORT_BATCH_SIZE",
+                Settings.model_fields["mission_import_batch_size"].default,
+            )
+        ),
+        mission_snapshot=_env_bool(
+            "MISSION_SNAPSHOT", Settings.model_fields["mission_snapshot"].default
+        ),
+        mission_snapshot_max_age=float(
+            os.getenv(
+                "MISSION_SNAPSHOT_MAX_AGE",
+                Settings.model_fields["mission_snapshot_max_age"].default,
+            )
+        ),
+        mission_changes_poll_interval=float(
+            os.getenv(
+                "MISSION_CHANGES_POLL_INTERVAL",
+                Settings.model_fields["mission_changes_poll_interval"].default,
+            )
+        ),
+        mission_changes_queue_size=int(
+            os.getenv(
+                "MISSION_CHANGES_QUEUE_SIZE",
+                Settings.model_fields["mission_changes_queue_size"].default,
+            )
+        ),
         auth_secret=os.getenv("AUTH_SECRET", Settings.model_fields["auth_secret"].default),
         auth_access_ttl=int(
             os.getenv("AUTH_ACCESS_TTL", Settings.model_fields["auth_access_ttl"].default)
@@ -62,6 +288,85 @@ def get_settings() -> Settings:
         auth_refresh_ttl=int(
             os.getenv("AUTH_REFRESH_TTL", Settings.model_fields["auth_refresh_ttl"].default)
         ),
+        auth_login_email_burst=int(
+            os.getenv(
+                "AUTH_LOGIN_EMAIL_BURST", Settings.model_fields["auth_login_email_burst"].default
+            )
+        ),
+        auth_login_email_per_minute=float(
+            os.getenv(
+                "AUTH_LOGIN_EMAIL_PER_MINUTE",
+                Settings.model_fields["auth_login_email_per_minute"].default,
+            )
+        ),
+        auth_login_ip_burst=int(
+            os.getenv("AUTH_LOGIN_IP_BURST", Settings.model_fields["auth_login_ip_burst"].default)
+        ),
+        auth_login_ip_per_minute=float(
+            os.getenv(
+                "AUTH_LOGIN_IP_PER_MINUTE", Settings.model_fields["auth_login_ip_per_minute"].default
+            )
+        ),
+        auth_rate_limit_backend=os.getenv(
+            "AUTH_RATE_LIMIT_BACKEND", Settings.model_fields["auth_rate_limit_backend"].default
+        ),
+        auth_rate_limit_sqlite_path=os.getenv(
+            "AUTH_RATE_LIMIT_SQLITE_PATH",
+            Settings.model_fields["auth_rate_limit_sqlite_path"].default,
+        ),
+        auth_revocation_filter_capacity=int(
+            os.getenv(
+                "AUTH_REVOCATION_FILTER_CAPACITY",
+                Settings.model_fields["auth_revocation_filter_capacity"].default,
+            )
+        ),
+        auth_revocation_compact_interval=int(
+            os.getenv(
+                "AUTH_REVOCATION_COMPACT_INTERVAL",
+                Settings.model_fields["auth_revocation_compact_interval"].default,
+            )
+        ),
+        auth_token_cache_size=int(
+            os.getenv(
+                "AUTH_TOKEN_CACHE_SIZE", Settings.model_fields["auth_token_cache_size"].default
+            )
+        ),
+        auth_user_cache_size=int(
+            os.getenv(
+                "AUTH_USER_CACHE_SIZE", Settings.model_fields["auth_user_cache_size"].default
+            )
+        ),
+        auth_user_cache_ttl=int(
+            os.getenv("AUTH_USER_CACHE_TTL", Settings.model_fields["auth_user_cache_ttl"].default)
+        ),
+        password_bcrypt_rounds=int(
+            os.getenv(
+                "PASSWORD_BCRYPT_ROUNDS", Settings.model_fields["password_bcrypt_rounds"].default
+            )
+        ),
+        password_target_ms=int(
+            os.getenv("PASSWORD_TARGET_MS", Settings.model_fields["password_target_ms"].default)
+        ),
+        password_rehash_batch_size=int(
+            os.getenv(
+                "PASSWORD_REHASH_BATCH_SIZE",
+                Settings.model_fields["password_rehash_batch_size"].default,
+            )
+        ),
+        password_rehash_flush_interval=float(
+            os.getenv(
+                "PASSWORD_REHASH_FLUSH_INTERVAL",
+                Settings.model_fields["password_rehash_flush_interval"].default,
+            )
+        ),
+        password_pool_size=int(
+            os.getenv("PASSWORD_POOL_SIZE", Settings.model_fields["password_pool_size"].default)
+        ),
+        password_queue_limit=int(
+            os.getenv(
+                "PASSWORD_QUEUE_LIMIT", Settings.model_fields["password_queue_limit"].default
+            )
+        ),
     )
 
 
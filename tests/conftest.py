@@ -2,42 +2,75 @@
 
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.readiness import reset_readiness_probe
+from app.db.session import async_database_url, get_async_db, get_db
 from app.main import create_app
+from app.missions import (
+    MissionIntervalIndex,
+    get_mission_interval_index,
+    reset_mission_change_feed,
+    reset_mission_interval_index,
+    reset_mission_snapshot,
+)
+from app.models import User
+from app.security import (
+    create_access_token,
+    reset_login_rate_limiter,
+    reset_revocation_store,
+    reset_token_cache,
+    reset_user_cache,
+)
 from app.settings import get_settings
 
-TEST_DATABASE_URL = "sqlite://"
-
 
 @pytest.fixture()
-def client(monkeypatch: pytest.MonkeyPatch) -> Generator[TestClient, None, None]:
-    """Return an application client backed by an in-memory database."""
+def client(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> Generator[TestClient, None, None]:
+    """Return an application client backed by a throwaway SQLite database.
+
+    A file-backed database lets the sync and asyncio engines share state.
+    """
 
+    database_url = f"sqlite:///{tmp_path / 'test.db'}"
     monkeypatch.setenv("AUTH_SECRET", "test-secret")
     monkeypatch.setenv("AUTH_ACCESS_TTL", "900")
     monkeypatch.setenv("AUTH_REFRESH_TTL", "3600")
-    monkeypatch.setenv("DATABASE_URL", TEST_DATABASE_URL)
+    monkeypatch.setenv("DATABASE_URL", database_url)
     get_settings.cache_clear()
+    reset_token_cache()
+    reset_user_cache()
+    reset_revocation_store()
+    reset_login_rate_limiter()
+    reset_mission_interval_index()
+    reset_mission_snapshot()
+    reset_mission_change_feed()
+    reset_readiness_probe()
 
     engine = create_engine(
-        TEST_DATABASE_URL,
+        database_url,
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
         future=True,
     )
+    async_engine = create_async_engine(async_database_url(database_url))
     TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    TestingAsyncSessionLocal = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
 
     app = create_app()
     app.state._sessionmaker = TestingSessionLocal
+    app.state._async_sessionmaker = TestingAsyncSessionLocal
 
     Base.metadata.create_all(bind=engine)
 
@@ -48,17 +81,44 @@ def client(monkeypatch: pytest.MonkeyPatch) -> Generator[TestClient, None, None]
         finally:
             db.close()
 
+    async def _override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_async_db] = _override_get_async_db
 
     with TestClient(app) as test_client:
         yield test_client
+        test_client.portal.call(async_engine.dispose)
 
     app.dependency_overrides.clear()
-    if hasattr(app.state, "_sessionmaker"):
-        delattr(app.state, "_sessionmaker")
+    for attribute in ("_sessionmaker", "_async_sessionmaker"):
+        if hasattr(app.state, attribute):
+            delattr(app.state, attribute)
     Base.metadata.drop_all(bind=engine)
     engine.dispose()
     get_settings.cache_clear()
+    reset_token_cache()
+    reset_user_cache()
+    reset_revocation_store()
+    reset_login_rate_limiter()
+    reset_mission_interval_index()
+    reset_mission_snapshot()
+    reset_mission_change_feed()
+    reset_readiness_probe()
+
+
+@pytest.fixture()
+def interval_index(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> MissionIntervalIndex:
+    """Turn on the interval index, which is off by default, for ``client``."""
+
+    monkeypatch.setenv("MISSION_INTERVAL_INDEX", "true")
+    get_settings.cache_clear()
+    reset_mission_interval_index()
+    index = get_mission_interval_index()
+    assert index is not None
+    return index
 
 
 @pytest.fixture()
@@ -73,3 +133,11 @@ def db_session(client: TestClient) -> Generator[Session, None, None]:
         session.close()
 
 
+@pytest.fixture()
+def auth_headers(db_session: Session) -> dict[str, str]:
+    """Return a bearer header for an active user stored without a real bcrypt hash."""
+
+    user = User(email="operator@example.com", password_hash="!unusable", is_active=True)
+    db_session.add(user)
+    db_session.commit()
+    return {"Authorization": f"Bearer {create_access_token(user.id)}"}
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
+import httpx
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.db.dialects import dialect_insert
 from app.security import create_access_token, create_refresh_token, decode_token
 from app.models import User
 
@@ -39,6 +43,31 @@ def test_signup_conflict_on_duplicate_email(client: TestClient) -> None:
     assert response.json()["detail"] == "Email is already registered"
 
 
+def test_concurrent_signups_for_same_email_never_error(client: TestClient) -> None:
+    async def burst() -> list[int]:
+        transport = httpx.ASGITransport(app=client.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+            responses = await asyncio.gather(
+                *(
+                    async_client.post(
+                        "/auth/signup", json={"email": "race@example.com", "password": "SuperSecret1!"}
+                    )
+                    for _ in range(12)
+                )
+            )
+        return [response.status_code for response in responses]
+
+    statuses = client.portal.call(burst)
+
+    assert statuses.count(201) == 1
+    assert statuses.count(409) == 11
+
+
+def test_signup_rejects_unsupported_dialect() -> None:
+    with pytest.raises(NotImplementedError):
+        dialect_insert("mssql", User)
+
+
 def test_login_returns_tokens(client: TestClient) -> None:
     signup_user(client)
     tokens, status_code = login_user(client, "user@example.com", "SuperSecret1!")
@@ -0,0 +1,86 @@
+"""Tests for connection pool configuration and metrics."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, make_url, text
+
+from app.db.pool import (
+    Histogram,
+    TimedAsyncAdaptedQueuePool,
+    TimedQueuePool,
+    pool_options,
+    pool_status,
+)
+from app.main import create_app
+from app.settings import Settings, get_settings
+
+
+def test_histogram_reports_cumulative_buckets() -> None:
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"0.1": 1, "1.0": 3, "+Inf": 4}
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(4.05)
+
+
+def test_pool_options_respect_dialect() -> None:
+    settings = Settings(db_pool_size=3, db_max_overflow=1, db_pool_timeout=2, db_pool_pre_ping=False)
+
+    assert pool_options(make_url("sqlite://"), settings) == {"pool_pre_ping": False}
+
+    options = pool_options(make_url("postgresql://db/codex"), settings)
+    assert options["poolclass"] is TimedQueuePool
+    assert options["pool_size"] == 3
+    assert options["max_overflow"] == 1
+    assert options["pool_timeout"] == 2
+    assert options["pool_recycle"] == 1800
+
+    async_options = pool_options(make_url("sqlite+aiosqlite:///x.db"), settings, asyncio=True)
+    assert async_options["poolclass"] is TimedAsyncAdaptedQueuePool
+
+
+def test_pool_status_tracks_checkouts_and_timeouts(tmp_path: Path) -> None:
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    settings = Settings(database_url=url, db_pool_size=1, db_max_overflow=0, db_pool_timeout=0.01)
+    engine = create_engine(url, **pool_options(make_url(url), settings))
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            status = pool_status(engine)
+            assert status["pool"] == "TimedQueuePool"
+            assert status["checked_out"] == 1
+            assert status["overflow"] == 0
+
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        engine.dispose()
+        status = pool_status(engine)
+        assert status["checked_out"] == 0
+        assert status["timeouts"] == 1
+        assert status["checkout_wait_seconds"]["count"] == 2
+    finally:
+        engine.dispose()
+
+
+def test_pool_endpoint_reports_both_engines(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'pool.db'}")
+    get_settings.cache_clear()
+    try:
+        # The lifespan disposes the engines so later tests do not reuse them.
+        with TestClient(create_app()) as client:
+            response = client.get("/health/pool")
+    finally:
+        get_settings.cache_clear()
+
+    assert response.status_code == 200
+    body = response.json()
+    assert set(body) == {"sync", "async"}
+    assert "pool" in body["sync"]
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from app.db import session as session_module
-from app.db.session import get_db, session_scope
+from app.db.session import (
+    async_database_url,
+    async_session_scope,
+    get_async_db,
+    get_db,
+    session_scope,
+)
 
 
 def test_get_db_yields_and_closes_session(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -43,3 +50,56 @@ def test_session_scope_rolls_back_on_error(monkeypatch: pytest.MonkeyPatch) -> N
 
     mock_session.rollback.assert_called_once()
     mock_session.close.assert_called_once()
+
+
+class _AsyncSessionStub:
+    def __init__(self) -> None:
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+        self.close = AsyncMock()
+
+
+def test_get_async_db_yields_and_closes_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    stub = _AsyncSessionStub()
+    monkeypatch.setattr(session_module, "AsyncSessionLocal", lambda: stub)
+
+    async def scenario() -> None:
+        generator = get_async_db()
+        assert await generator.__anext__() is stub
+        await generator.aclose()
+
+    asyncio.run(scenario())
+    stub.close.assert_awaited_once()
+
+
+def test_async_session_scope_commits_and_rolls_back(monkeypatch: pytest.MonkeyPatch) -> None:
+    stub = _AsyncSessionStub()
+    monkeypatch.setattr(session_module, "AsyncSessionLocal", lambda: stub)
+
+    async def scenario() -> None:
+        async with async_session_scope() as scoped_session:
+            assert scoped_session is stub
+        stub.commit.assert_awaited_once()
+
+        with pytest.raises(RuntimeError):
+            async with async_session_scope():
+                raise RuntimeError("boom")
+        stub.rollback.assert_awaited_once()
+
+    asyncio.run(scenario())
+    assert stub.close.await_count == 2
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("sqlite:///./codex.db", "sqlite+aiosqlite:///./codex.db"),
+        ("sqlite://", "sqlite+aiosqlite://"),
+        ("postgresql://app:pw@db/codex", "postgresql+asyncpg://app:pw@db/codex"),
+        ("postgresql+psycopg2://app@db/codex", "postgresql+asyncpg://app@db/codex"),
+        ("postgresql+asyncpg://app@db/codex", "postgresql+asyncpg://app@db/codex"),
+        ("mysql+pymysql://app@db/codex", "mysql+pymysql://app@db/codex"),
+    ],
+)
+def test_async_database_url_selects_async_driver(url: str, expected: str) -> None:
+    assert async_database_url(url) == expected
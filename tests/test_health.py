@@ -1,10 +1,26 @@
 """Tests for the health endpoint."""
 
 from fastapi.testclient import TestClient
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.main import create_app
 
 
+class StampHeaders:
+    """Pure ASGI middleware appending a header to the start message's own list."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async def stamp(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"].append((b"x-stamp", b"1"))
+            await send(message)
+
+        await self.app(scope, receive, stamp)
+
+
 def test_health_ok() -> None:
     """The /health endpoint returns a simple ok payload."""
 
@@ -12,3 +28,38 @@ def test_health_ok() -> None:
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_health_answers_conditional_requests() -> None:
+    """/health carries an ETag and answers a matching If-None-Match with 304."""
+
+    client = TestClient(create_app())
+    first = client.get("/health")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+
+    revalidated = client.get("/health", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+    for header in (f'"other", W/{etag}', "*"):
+        assert client.get("/health", headers={"If-None-Match": header}).status_code == 304
+    assert client.get("/health", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_cached_responses_are_not_shared_between_requests() -> None:
+    """Headers appended while sending one response do not leak into the next."""
+
+    app = create_app()
+    app.add_middleware(StampHeaders)
+    client = TestClient(app)
+
+    for _ in range(2):
+        response = client.get("/health")
+        assert response.headers.get_list("x-stamp") == ["1"]
+        etag = response.headers["etag"]
+    for _ in range(2):
+        revalidated = client.get("/health", headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.headers.get_list("x-stamp") == ["1"]
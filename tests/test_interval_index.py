@@ -0,0 +1,282 @@
+"""Tests for the in-memory mission interval index."""
+
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.missions import MissionIntervalIndex, get_mission_interval_index
+from app.missions.interval_index import _StaticIntervals, time_key
+from app.models import Mission
+
+BASE = datetime(2026, 3, 1)
+
+
+def brute_force(intervals: list[tuple[int, int, uuid.UUID]], low: int, high: int) -> list[int]:
+    return sorted(position for position, (start, end, _) in enumerate(intervals) if start < high and end > low)
+
+
+def test_static_intervals_match_brute_force() -> None:
+    rng = random.Random(7)
+    intervals = []
+    for _ in range(2000):
+        start = rng.randrange(0, 10_000)
+        intervals.append((start, start + rng.choice([1, 5, 50, 500, 5000]), uuid.uuid4()))
+    static = _StaticIntervals(list(intervals))
+    ordered = list(zip(static.starts, static.ends, static.ids))
+
+    for _ in range(300):
+        low = rng.randrange(-100, 10_500)
+        high = low + rng.randrange(1, 800)
+        found = list(static.overlapping(low, high))
+        assert len(found) == len(set(found))
+        assert sorted(found) == brute_force(ordered, low, high)
+
+
+def test_overlay_changes_and_rebuild() -> None:
+    index = MissionIntervalIndex(rebuild_threshold=3)
+    index._loaded = True
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    index.add(first, BASE, BASE + timedelta(hours=2))
+    index.add(second, BASE + timedelta(hours=3), BASE + timedelta(hours=4))
+    assert [mission_id for _, mission_id in index.overlapping(BASE, BASE + timedelta(hours=5))] == [
+        first,
+        second,
+    ]
+
+    index.add(first, BASE + timedelta(days=1), BASE + timedelta(days=1, hours=1))
+    index.discard(second)
+    with index._build_lock:
+        # The change that crosses the threshold returns while the rebuild waits.
+        index.add(third, BASE - timedelta(hours=1), BASE + timedelta(minutes=30))
+        rebuilder = index._rebuilder
+        assert rebuilder is not None and index.rebuilds == 0
+        assert index.overlapping(BASE, BASE + timedelta(hours=5)) == [(BASE - timedelta(hours=1), third)]
+    rebuilder.join(5)
+    assert index.rebuilds == 1
+    assert index._overlay == [] and index._rebuilder is None
+    assert len(index) == 2
+    assert index.overlapping(BASE, BASE + timedelta(hours=5)) == [(BASE - timedelta(hours=1), third)]
+
+    index.discard(third)
+    assert index.overlapping(BASE, BASE + timedelta(hours=5)) == []
+    assert index.overlapping(BASE + timedelta(days=1), BASE + timedelta(days=2)) == [
+        (BASE + timedelta(days=1), first)
+    ]
+
+
+def test_sorted_overlay_matches_brute_force() -> None:
+    rng = random.Random(11)
+    hour = timedelta(hours=1)
+    spans: dict[uuid.UUID, tuple[int, int]] = {}
+    for _ in range(200):
+        start = rng.randrange(0, 500)
+        spans[uuid.uuid4()] = (start, start + rng.randrange(1, 30))
+    index = MissionIntervalIndex(rebuild_threshold=10_000)
+    index._install([(time_key(BASE + start * hour), time_key(BASE + end * hour), key) for key, (start, end) in spans.items()])
+
+    ids = list(spans)
+    for _ in range(400):
+        mission_id = rng.choice(ids) if rng.random() < 0.6 else uuid.uuid4()
+        if rng.random() < 0.2:
+            index.discard(mission_id)
+            spans.pop(mission_id, None)
+        else:
+            start = rng.randrange(0, 500)
+            spans[mission_id] = (start, start + rng.randrange(1, 30))
+            index.add(mission_id, BASE + start * hour, BASE + spans[mission_id][1] * hour)
+            ids.append(mission_id)
+
+    assert index.rebuilds == 0
+    assert index._overlay == sorted(index._overlay)
+    for _ in range(100):
+        low = rng.randrange(-10, 520)
+        high = low + rng.randrange(1, 60)
+        expected = sorted((start, key) for key, (start, end) in spans.items() if start < high and end > low)
+        found = index.overlapping(BASE + low * hour, BASE + high * hour)
+        assert found == [(BASE + start * hour, key) for start, key in expected]
+
+
+def test_changes_during_a_build_are_replayed() -> None:
+    index = MissionIntervalIndex()
+    mission_id = uuid.uuid4()
+    index._replay = []  # what load() does before reading the table
+
+    index.add(mission_id, BASE, BASE + timedelta(hours=1))
+    assert not index.loaded
+    index._install([])
+
+    assert index.overlapping(BASE, BASE + timedelta(minutes=1)) == [(BASE, mission_id)]
+
+
+def test_time_key_normalises_aware_datetimes() -> None:
+    aware = datetime.fromisoformat("2026-03-01T02:00:00+02:00")
+    assert time_key(aware) == time_key(BASE)
+
+
+def test_index_follows_committed_orm_changes(
+    client: TestClient, db_session: Session, interval_index: MissionIntervalIndex
+) -> None:
+    window = (BASE, BASE + timedelta(hours=1))
+    kept = Mission(title="Kept", start_time=BASE, end_time=BASE + timedelta(hours=2))
+    db_session.add(kept)
+    db_session.commit()
+    assert interval_index.query(db_session, *window) == [(BASE, kept.id)]
+
+    moved = Mission(title="Moved", start_time=BASE, end_time=BASE + timedelta(minutes=30))
+    db_session.add(moved)
+    db_session.commit()
+    assert {mission_id for _, mission_id in interval_index.overlapping(*window)} == {kept.id, moved.id}
+
+    moved.start_time = BASE + timedelta(days=2)
+    moved.end_time = BASE + timedelta(days=3)
+    kept.title = "Renamed"
+    db_session.commit()
+    assert interval_index.overlapping(*window) == [(BASE, kept.id)]
+
+    db_session.delete(kept)
+    db_session.flush()
+    db_session.rollback()
+    assert interval_index.overlapping(*window) == [(BASE, kept.id)]
+
+    db_session.delete(db_session.get(Mission, kept.id))
+    db_session.commit()
+    assert interval_index.overlapping(*window) == []
+
+
+@pytest.mark.usefixtures("interval_index")
+@pytest.mark.parametrize("use_index", [True, False])
+def test_list_missions_overlapping_window(
+    client: TestClient,
+    db_session: Session,
+    auth_headers: dict[str, str],
+    use_index: bool,
+) -> None:
+    if not use_index:
+        client.app.dependency_overrides[get_mission_interval_index] = lambda: None
+    spans = [(0, 2), (1, 3), (4, 5), (-2, 10), (6, 7), (2, 4)]
+    for number, (start, end) in enumerate(spans):
+        db_session.add(
+            Mission(
+                title=f"M{number}",
+                start_time=BASE + timedelta(hours=start),
+                end_time=BASE + timedelta(hours=end),
+                status="CANCELED" if number == 5 else "DRAFT",
+            )
+        )
+    db_session.commit()
+    window = f"{(BASE + timedelta(hours=2)).isoformat()}/{(BASE + timedelta(hours=5)).isoformat()}"
+
+    titles: list[str] = []
+    cursor = None
+    while True:
+        params = {"overlaps": window, "limit": 1, "status": "DRAFT"}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/missions", params=params, headers=auth_headers).json()
+        titles.extend(item["title"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert titles == ["M3", "M1", "M2"]
+
+    bounded = client.get(
+        "/missions",
+        params={"overlaps": window, "start_from": BASE.isoformat(), "start_to": (BASE + timedelta(hours=3)).isoformat()},
+        headers=auth_headers,
+    )
+    assert [item["title"] for item in bounded.json()["items"]] == ["M1", "M5"]
+
+
+@pytest.mark.usefixtures("interval_index")
+@pytest.mark.parametrize("use_index", [True, False])
+def test_list_missions_accepts_offset_times(
+    client: TestClient,
+    db_session: Session,
+    auth_headers: dict[str, str],
+    use_index: bool,
+) -> None:
+    if not use_index:
+        client.app.dependency_overrides[get_mission_interval_index] = lambda: None
+    for hour in range(4):
+        db_session.add(
+            Mission(
+                title=f"M{hour}",
+                start_time=BASE + timedelta(hours=hour),
+                end_time=BASE + timedelta(hours=hour, minutes=30),
+            )
+        )
+    db_session.commit()
+
+    # 02:00+02:00 is midnight UTC, i.e. BASE.
+    params = {
+        "overlaps": "2026-03-01T02:00:00+02:00/2026-03-01T05:00:00+02:00",
+        "start_from": "2026-03-01T03:00:00+02:00",
+        "limit": 1,
+    }
+    first = client.get("/missions", params=params, headers=auth_headers)
+    assert first.status_code == 200
+    assert [item["title"] for item in first.json()["items"]] == ["M1"]
+
+    rest = client.get(
+        "/missions",
+        params={**params, "limit": 10, "cursor": first.json()["next_cursor"], "start_to": "2026-03-01T02:30:00Z"},
+        headers=auth_headers,
+    )
+    assert rest.status_code == 200
+    assert [item["title"] for item in rest.json()["items"]] == ["M2"]
+
+
+@pytest.mark.usefixtures("interval_index")
+@pytest.mark.parametrize("use_index", [True, False])
+def test_created_offset_times_agree_with_window_filters(
+    client: TestClient,
+    db_session: Session,
+    auth_headers: dict[str, str],
+    use_index: bool,
+) -> None:
+    if not use_index:
+        client.app.dependency_overrides[get_mission_interval_index] = lambda: None
+    created = client.post(
+        "/missions",
+        json={"title": "East", "start_time": "2026-03-01T10:00:00+02:00", "end_time": "2026-03-01T11:00:00+02:00"},
+        headers=auth_headers,
+    )
+    assert created.status_code == 201
+    assert created.json()["start_time"] == "2026-03-01T08:00:00"
+
+    def titles(**params: str) -> list[str]:
+        page = client.get("/missions", params=params, headers=auth_headers).json()
+        return [item["title"] for item in page["items"]]
+
+    assert titles(overlaps="2026-03-01T08:30:00Z/2026-03-01T08:45:00Z") == ["East"]
+    assert titles(overlaps="2026-03-01T09:30:00+01:00/2026-03-01T09:45:00+01:00") == ["East"]
+    assert titles(start_from="2026-03-01T09:30:00Z") == []
+    assert titles(start_from="2026-03-01T07:30:00Z", start_to="2026-03-01T08:30:00Z") == ["East"]
+
+
+@pytest.mark.parametrize("window", ["2026-03-01", "2026-03-02T00:00/2026-03-01T00:00", "a/b"])
+def test_invalid_overlap_window(client: TestClient, auth_headers: dict[str, str], window: str) -> None:
+    response = client.get("/missions", params={"overlaps": window}, headers=auth_headers)
+
+    assert response.status_code == 422
+
+
+def test_index_is_off_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.missions import reset_mission_interval_index
+    from app.settings import get_settings
+
+    monkeypatch.delenv("MISSION_INTERVAL_INDEX", raising=False)
+    get_settings.cache_clear()
+    reset_mission_interval_index()
+    try:
+        assert get_mission_interval_index() is None
+    finally:
+        get_settings.cache_clear()
@@ -0,0 +1,195 @@
+"""Tests for the metrics registry, its instrumentation and ``/metrics``."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, text
+
+from app.api import RequestMetricsMiddleware
+from app.core.metrics import (
+    DB_QUERY_ERRORS,
+    DB_QUERY_SECONDS,
+    HTTP_REQUEST_SECONDS,
+    PASSWORD_SECONDS,
+    TOKEN_DECODE_SECONDS,
+    Histogram,
+    MetricsRegistry,
+    ShardedCounter,
+    ShardedHistogram,
+)
+from app.db.timing import statement_operation, time_queries
+from app.security import PasswordService, TokenError, create_access_token, decode_token
+
+
+def count(family, *labels: str) -> int:  # noqa: ANN001
+    return family.labels(*labels).snapshot()["count"]
+
+
+def test_sharded_histogram_merges_thread_shards() -> None:
+    sharded = ShardedHistogram((0.1, 1.0))
+    locked = Histogram((0.1, 1.0))
+    values = [0.05, 0.1, 0.5, 2.0]
+
+    def record() -> None:
+        for value in values:
+            sharded.observe(value)
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for value in values * 4:
+        locked.observe(value)
+
+    assert sharded.snapshot() == locked.snapshot()
+    assert sharded.snapshot()["buckets"] == {"0.1": 8, "1.0": 12, "+Inf": 16}
+
+
+def test_sharded_counter_and_timer() -> None:
+    counter = ShardedCounter()
+
+    def record() -> None:
+        for _ in range(1000):
+            counter.inc()
+
+    threads = [threading.Thread(target=record) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.inc(0.5)
+    assert counter.value == 3000.5
+
+    histogram = ShardedHistogram()
+    with histogram.time():
+        pass
+    assert histogram.snapshot()["count"] == 1
+
+
+def test_registry_renders_prometheus_text() -> None:
+    registry = MetricsRegistry()
+    requests = registry.histogram("demo_seconds", "Demo latency.", ("path",), (0.5,))
+    errors = registry.counter("demo_errors_total", "Demo errors.")
+    requests.labels('/a"b\\c\n').observe(0.25)
+    errors.labels().inc(2)
+
+    assert registry.histogram("demo_seconds", "Demo latency.", ("path",)) is requests
+    with pytest.raises(ValueError):
+        registry.counter("demo_seconds", "Clash.", ("path",))
+    with pytest.raises(ValueError):
+        requests.labels("a", "b")
+
+    assert registry.render() == "\n".join(
+        [
+            "# HELP demo_errors_total Demo errors.",
+            "# TYPE demo_errors_total counter",
+            "demo_errors_total 2",
+            "# HELP demo_seconds Demo latency.",
+            "# TYPE demo_seconds histogram",
+            'demo_seconds_bucket{path="/a\\"b\\\\c\\n",le="0.5"} 1',
+            'demo_seconds_bucket{path="/a\\"b\\\\c\\n",le="+Inf"} 1',
+            'demo_seconds_sum{path="/a\\"b\\\\c\\n"} 0.25',
+            'demo_seconds_count{path="/a\\"b\\\\c\\n"} 1',
+        ]
+    ) + "\n"
+
+
+def test_statement_operation_labels() -> None:
+    assert statement_operation("SELECT 1") == "select"
+    assert statement_operation("\n  (select 1) UNION (select 2)") == "select"
+    assert statement_operation("INSERT INTO t VALUES (1)") == "insert"
+    assert statement_operation("VACUUM") == "other"
+    assert statement_operation("") == "other"
+
+
+def test_time_queries_records_statements_and_errors(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'timed.db'}")
+    time_queries(engine, "test")
+    selects = count(DB_QUERY_SECONDS, "test", "select")
+    errors = DB_QUERY_ERRORS.labels("test", "select").value
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+            with pytest.raises(exc.OperationalError):
+                connection.execute(text("SELECT * FROM missing"))
+            connection.execute(text("SELECT 3"))
+            assert not connection.info["codex_query_started"]
+    finally:
+        engine.dispose()
+
+    assert count(DB_QUERY_SECONDS, "test", "select") == selects + 3
+    assert DB_QUERY_ERRORS.labels("test", "select").value == errors + 1
+
+
+def test_middleware_labels_by_route_template() -> None:
+    application = FastAPI()
+    application.add_middleware(RequestMetricsMiddleware)
+
+    @application.get("/things/{thing_id}")
+    async def read_thing(thing_id: int) -> dict[str, int]:
+        return {"id": thing_id}
+
+    @application.get("/boom")
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    before = {
+        "ok": count(HTTP_REQUEST_SECONDS, "GET", "/things/{thing_id}", "200"),
+        "invalid": count(HTTP_REQUEST_SECONDS, "GET", "/things/{thing_id}", "422"),
+        "error": count(HTTP_REQUEST_SECONDS, "GET", "/boom", "500"),
+        "missing": count(HTTP_REQUEST_SECONDS, "GET", "<unmatched>", "404"),
+    }
+    client = TestClient(application, raise_server_exceptions=False)
+    for path in ("/things/1", "/things/2", "/things/x", "/boom", "/nowhere"):
+        client.get(path)
+
+    assert count(HTTP_REQUEST_SECONDS, "GET", "/things/{thing_id}", "200") == before["ok"] + 2
+    assert count(HTTP_REQUEST_SECONDS, "GET", "/things/{thing_id}", "422") == before["invalid"] + 1
+    assert count(HTTP_REQUEST_SECONDS, "GET", "/boom", "500") == before["error"] + 1
+    assert count(HTTP_REQUEST_SECONDS, "GET", "<unmatched>", "404") == before["missing"] + 1
+
+
+def test_password_and_token_timers(client: TestClient) -> None:
+    hashes = count(PASSWORD_SECONDS, "hash")
+    verifies = count(PASSWORD_SECONDS, "verify")
+    decodes = {outcome: count(TOKEN_DECODE_SECONDS, outcome) for outcome in ("cached", "verified", "rejected")}
+
+    service = PasswordService(max_workers=0, max_pending=1, rounds=4)
+    hashed = asyncio.run(service.hash_password("s3cretpass"))
+    assert asyncio.run(service.verify_password("s3cretpass", hashed))
+
+    token = create_access_token("user-1")
+    decode_token(token)
+    decode_token(token)
+    with pytest.raises(TokenError):
+        decode_token("not-a-token")
+
+    assert count(PASSWORD_SECONDS, "hash") == hashes + 1
+    assert count(PASSWORD_SECONDS, "verify") == verifies + 1
+    assert count(TOKEN_DECODE_SECONDS, "verified") == decodes["verified"] + 1
+    assert count(TOKEN_DECODE_SECONDS, "cached") == decodes["cached"] + 1
+    assert count(TOKEN_DECODE_SECONDS, "rejected") == decodes["rejected"] + 1
+
+
+def test_metrics_endpoint_exposes_request_timings(client: TestClient) -> None:
+    client.get("/health")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
+    lines = response.text.splitlines()
+    assert "# TYPE codex_http_request_duration_seconds histogram" in lines
+    assert any(
+        line.startswith('codex_http_request_duration_seconds_count{method="GET",route="/health",status="200"}')
+        for line in lines
+    )
+    assert "# TYPE codex_db_query_duration_seconds histogram" in lines
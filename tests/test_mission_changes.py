@@ -0,0 +1,328 @@
+"""Tests for the mission change feed, long-polling and Server-Sent Events."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.api.pagination import encode_cursor
+from app.missions import (
+    ChangePosition,
+    MissionChangeFeed,
+    changes_statement,
+    get_mission_change_feed,
+    read_changes,
+)
+from app.missions.changes import MissionChange, Subscription
+from app.models import Mission
+from app.models.mission import utcnow
+
+BASE = datetime(2026, 6, 1, 8, 0)
+ORIGIN = encode_cursor(datetime(2000, 1, 1).isoformat(), "0" * 32)
+
+
+def add(engine: Engine, title: str, updated_at: datetime | None = None) -> Mission:
+    with Session(engine, expire_on_commit=False) as session:
+        mission = Mission(
+            title=title, start_time=BASE, end_time=BASE + timedelta(hours=1), updated_at=updated_at
+        )
+        session.add(mission)
+        session.commit()
+        return mission
+
+
+def later(delay: float, action: Callable[[], object]) -> threading.Thread:
+    def run() -> None:
+        time.sleep(delay)
+        action()
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_changes_page_through_cursor(
+    client: TestClient, db_session: Session, auth_headers: dict[str, str]
+) -> None:
+    engine = db_session.get_bind()
+    first, second, third = (add(engine, title) for title in ("one", "two", "three"))
+
+    page = client.get("/missions/changes", params={"limit": 2}, headers=auth_headers).json()
+    assert [item["id"] for item in page["items"]] == [str(first.id), str(second.id)]
+    assert page["has_more"] is True
+
+    with Session(engine) as session:
+        session.get(Mission, first.id).title = "one, renamed"
+        session.commit()
+    page = client.get(
+        "/missions/changes", params={"since": page["next_cursor"]}, headers=auth_headers
+    ).json()
+    assert [item["title"] for item in page["items"]] == ["three", "one, renamed"]
+    assert page["has_more"] is False
+
+    empty = client.get(
+        "/missions/changes", params={"since": page["next_cursor"]}, headers=auth_headers
+    ).json()
+    assert empty == {"items": [], "next_cursor": page["next_cursor"], "has_more": False}
+    assert str(third.id) in json.dumps(page)
+
+
+def test_late_commit_with_an_earlier_timestamp_is_delivered_once(
+    client: TestClient, db_session: Session, auth_headers: dict[str, str]
+) -> None:
+    engine = db_session.get_bind()
+    early = add(engine, "early")
+    page = client.get("/missions/changes", params={"since": ORIGIN}, headers=auth_headers).json()
+    assert [item["title"] for item in page["items"]] == ["early"]
+
+    # Stamped before "early" but committed after it was delivered.
+    add(engine, "late", updated_at=early.updated_at - timedelta(milliseconds=500))
+    page = client.get(
+        "/missions/changes", params={"since": page["next_cursor"]}, headers=auth_headers
+    ).json()
+    assert [item["title"] for item in page["items"]] == ["late"]
+
+    page = client.get(
+        "/missions/changes", params={"since": page["next_cursor"]}, headers=auth_headers
+    ).json()
+    assert page["items"] == []
+
+
+def test_read_changes_skips_seen_keys_and_trails_the_clock(db_session: Session) -> None:
+    engine = db_session.get_bind()
+    skew = timedelta(seconds=2)
+    first = add(engine, "first", updated_at=BASE)
+    second = add(engine, "second", updated_at=BASE + timedelta(seconds=1))
+
+    with Session(engine) as session:
+        missions, position, more = read_changes(session, None, 1, skew, now=BASE + timedelta(seconds=1))
+        assert [mission.id for mission in missions] == [first.id] and more
+        # Paging through a backlog resumes right after the last change returned.
+        assert position == ChangePosition((BASE, first.id))
+
+        missions, position, more = read_changes(session, position, 10, skew, now=BASE + timedelta(seconds=1))
+        assert [mission.id for mission in missions] == [second.id] and not more
+        assert position == ChangePosition((BASE, first.id), frozenset({(BASE + timedelta(seconds=1), second.id)}))
+
+        late = add(engine, "late", updated_at=BASE + timedelta(milliseconds=500))
+        missions, position, _ = read_changes(session, position, 10, skew, now=BASE + timedelta(seconds=10))
+        assert [mission.id for mission in missions] == [late.id]
+        # Once the clock has moved past the window the floor catches up.
+        assert position == ChangePosition((BASE + timedelta(seconds=8), uuid.UUID(int=0)))
+
+
+def test_cursor_stays_small_through_a_burst_sharing_one_timestamp(
+    client: TestClient, db_session: Session, auth_headers: dict[str, str]
+) -> None:
+    engine = db_session.get_bind()
+    stamp = utcnow()
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "title": f"bulk {index}",
+            "start_time": BASE,
+            "end_time": BASE + timedelta(hours=1),
+            "status": "DRAFT",
+            "created_at": stamp,
+            "updated_at": stamp,
+        }
+        for index in range(10_050)
+    ]
+    with engine.begin() as connection:
+        connection.execute(insert(Mission), rows)
+
+    received: list[str] = []
+    cursor = ORIGIN
+    while True:
+        page = client.get(
+            "/missions/changes", params={"since": cursor, "limit": 500}, headers=auth_headers
+        ).json()
+        received.extend(item["id"] for item in page["items"])
+        assert len(page["next_cursor"]) < 16_000
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            break
+
+    assert sorted(received) == sorted(str(row["id"]) for row in rows)
+    again = client.get("/missions/changes", params={"since": cursor}, headers=auth_headers).json()
+    assert again["items"] == []
+
+
+def test_changes_rejects_bad_cursor(client: TestClient, auth_headers: dict[str, str]) -> None:
+    response = client.get("/missions/changes", params={"since": "nope"}, headers=auth_headers)
+
+    assert response.status_code == 400
+
+
+def test_changes_query_uses_updated_at_index(client: TestClient, db_session: Session) -> None:
+    statement = changes_statement((BASE, uuid.uuid4()), 10)
+    compiled = statement.compile(db_session.get_bind(), compile_kwargs={"literal_binds": True})
+    plan = db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+
+    assert any("ix_missions_updated_at" in row[-1] for row in plan)
+
+
+def test_long_poll_returns_when_a_change_is_committed(
+    client: TestClient, db_session: Session, auth_headers: dict[str, str]
+) -> None:
+    engine = db_session.get_bind()
+    add(engine, "before")
+    cursor = client.get("/missions/changes", headers=auth_headers).json()["next_cursor"]
+
+    writer = later(0.3, lambda: add(engine, "after"))
+    started = time.perf_counter()
+    page = client.get(
+        "/missions/changes", params={"since": cursor, "wait": 10}, headers=auth_headers
+    ).json()
+    writer.join()
+
+    assert time.perf_counter() - started < 5
+    assert [item["title"] for item in page["items"]] == ["after"]
+    assert len(get_mission_change_feed()) == 0
+
+
+def test_waiting_long_polls_hold_no_pooled_connections(
+    client: TestClient, db_session: Session, auth_headers: dict[str, str]
+) -> None:
+    engine = db_session.get_bind()
+    db_session.close()
+    client.get("/missions/changes", headers=auth_headers)  # warm the user cache
+    waiters = engine.pool.size() + engine.pool._max_overflow + 1
+    pages: list[dict] = []
+
+    def poll() -> None:
+        pages.append(
+            client.get(
+                "/missions/changes", params={"since": ORIGIN, "wait": 10}, headers=auth_headers
+            ).json()
+        )
+
+    threads = [threading.Thread(target=poll) for _ in range(waiters)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while len(get_mission_change_feed()) < waiters or engine.pool.checkedout():
+        assert time.monotonic() < deadline, "long-polls did not park without a connection"
+        time.sleep(0.01)
+
+    started = time.perf_counter()
+    assert client.get("/missions", headers=auth_headers).status_code == 200
+    assert time.perf_counter() - started < 2
+    add(engine, "wake")
+    for thread in threads:
+        thread.join()
+
+    assert [[item["title"] for item in page["items"]] for page in pages] == [["wake"]] * waiters
+
+
+def test_long_poll_times_out_empty(client: TestClient, auth_headers: dict[str, str]) -> None:
+    page = client.get(
+        "/missions/changes", params={"since": ORIGIN, "wait": 0.2}, headers=auth_headers
+    ).json()
+
+    assert page == {"items": [], "next_cursor": ORIGIN, "has_more": False}
+
+
+def test_stream_replays_then_pushes_live_changes(
+    client: TestClient, db_session: Session, auth_headers: dict[str, str]
+) -> None:
+    engine = db_session.get_bind()
+    missed = add(engine, "missed")
+    feed = get_mission_change_feed()
+
+    def write_then_close() -> None:
+        time.sleep(0.3)
+        add(engine, "live")
+        time.sleep(0.5)
+        assert feed._loop is not None
+        asyncio.run_coroutine_threadsafe(feed.close(), feed._loop).result(5)
+
+    closer = later(0, write_then_close)
+    response = client.get(
+        "/missions/changes/stream", headers={**auth_headers, "Last-Event-ID": ORIGIN}
+    )
+    closer.join()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block.split("\n") for block in response.text.strip().split("\n\n")]
+    assert [json.loads(lines[2].removeprefix("data: "))["title"] for lines in events] == [
+        "missed",
+        "live",
+    ]
+    assert events[0][0] == "id: " + encode_cursor(missed.updated_at.isoformat(), missed.id.hex)
+    assert events[0][1] == "event: mission"
+
+
+async def next_change(events: AsyncIterator[MissionChange | None]) -> MissionChange:
+    while True:
+        change = await anext(events)
+        if change is not None:
+            return change
+
+
+def test_feed_follow_heartbeats_and_drops_slow_subscribers(
+    client: TestClient, db_session: Session
+) -> None:
+    engine = db_session.get_bind()
+
+    async def scenario() -> None:
+        feed = MissionChangeFeed(poll_interval=0.05, queue_size=1)
+        events = feed.follow(engine, None, heartbeat=0.05)
+        assert await anext(events) is None
+
+        async with feed.subscribe(engine) as slow:
+            assert len(feed) == 2
+            await asyncio.to_thread(add, engine, "first")
+            change = await next_change(events)
+            assert isinstance(change, MissionChange) and change.key[1] == change.id
+            await asyncio.to_thread(add, engine, "second")
+            while len(feed) == 2:
+                await asyncio.sleep(0.01)
+            assert slow.queue.get_nowait()[0].id == change.id
+            assert slow.queue.get_nowait() is None
+
+        await feed.close()
+        remaining = [json.loads(item.data)["title"] async for item in events if item is not None]
+        assert remaining == ["second"]
+
+    asyncio.run(scenario())
+
+
+def test_feed_delivers_late_commits_once(client: TestClient, db_session: Session) -> None:
+    engine = db_session.get_bind()
+
+    async def scenario() -> None:
+        feed = MissionChangeFeed(poll_interval=0.05)
+        events = feed.follow(engine, None, heartbeat=0.05)
+        assert await anext(events) is None
+
+        early = await asyncio.to_thread(add, engine, "early")
+        assert json.loads((await next_change(events)).data)["title"] == "early"
+        stamp = early.updated_at - timedelta(milliseconds=500)
+        await asyncio.to_thread(add, engine, "late", stamp)
+        assert json.loads((await next_change(events)).data)["title"] == "late"
+
+        await asyncio.sleep(0.2)
+        await feed.close()
+        assert [item async for item in events if item is not None] == []
+
+    asyncio.run(scenario())
+
+
+def test_subscription_offer_reserves_room_for_the_end_marker() -> None:
+    subscription = Subscription(queue_size=1)
+
+    assert subscription._offer([]) is True
+    assert subscription._offer([]) is False
+    assert subscription.queue.full()
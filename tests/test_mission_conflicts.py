@@ -0,0 +1,126 @@
+"""Tests for sort-and-sweep mission conflict detection."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+from itertools import combinations
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.missions import conflicts as conflicts_module
+from app.missions import detect_conflicts
+from app.models import Mission, MissionStatus
+
+BASE = datetime(2026, 9, 1, 8, 0)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(conflicts_module, "np", None)
+    return request.param
+
+
+def brute_force(starts: list[int], ends: list[int]) -> set[tuple[int, int]]:
+    return {
+        (first, second)
+        for first, second in combinations(range(len(starts)), 2)
+        if starts[first] < ends[second] and starts[second] < ends[first]
+    }
+
+
+def test_matches_pairwise_comparison(backend: str) -> None:
+    generator = random.Random(17)
+    starts = [generator.randrange(0, 500) for _ in range(300)]
+    ends = [start + generator.randrange(1, 20) for start in starts]
+
+    report = detect_conflicts(starts, ends, max_pairs=100_000)
+
+    expected = brute_force(starts, ends)
+    assert set(report.pairs) == expected
+    assert report.pair_count == len(expected) == len(report.pairs)
+    assert not report.truncated
+    clustered = [position for cluster in report.clusters for position in cluster]
+    assert len(clustered) == len(set(clustered))
+    for first, second in expected:
+        assert any(first in cluster and second in cluster for cluster in report.clusters)
+
+
+def test_touching_intervals_do_not_conflict(backend: str) -> None:
+    report = detect_conflicts([0, 10, 20], [10, 20, 30])
+
+    assert report.pair_count == 0
+    assert report.pairs == []
+    assert report.clusters == []
+
+
+def test_chained_overlaps_form_one_cluster(backend: str) -> None:
+    report = detect_conflicts([0, 5, 9, 40, 45], [6, 10, 12, 50, 46])
+
+    assert sorted(report.pairs) == [(0, 1), (1, 2), (3, 4)]
+    assert report.clusters == [[0, 1, 2], [3, 4]]
+
+
+def test_pairs_are_truncated_but_counted(backend: str) -> None:
+    report = detect_conflicts([0] * 6, [5] * 6, max_pairs=4)
+
+    assert report.pair_count == 15
+    assert len(report.pairs) == 4
+    assert len(set(report.pairs)) == 4
+    assert report.truncated
+    assert report.clusters == [[0, 1, 2, 3, 4, 5]]
+
+
+def test_empty_input(backend: str) -> None:
+    report = detect_conflicts([], [])
+
+    assert (report.pair_count, report.pairs, report.clusters) == (0, [], [])
+
+
+def add(db_session: Session, offset: int, hours: int, status: MissionStatus = MissionStatus.DRAFT) -> Mission:
+    start = BASE + timedelta(hours=offset)
+    mission = Mission(title="Crew", start_time=start, end_time=start + timedelta(hours=hours), status=status)
+    db_session.add(mission)
+    db_session.commit()
+    return mission
+
+
+def test_conflicts_endpoint_applies_filter(
+    client: TestClient, db_session: Session, auth_headers: dict[str, str], backend: str
+) -> None:
+    first = add(db_session, 0, 3)
+    second = add(db_session, 2, 2)
+    third = add(db_session, 3, 1)
+    add(db_session, 10, 1)
+    cancelled = add(db_session, 0, 12, MissionStatus.CANCELED)
+
+    response = client.post(
+        "/missions:conflicts",
+        json={"status": ["DRAFT"], "max_pairs": 1},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["missions"] == 4
+    assert body["pair_count"] == 2
+    assert body["pairs_truncated"] is True
+    assert body["pairs"] == [[str(first.id), str(second.id)]]
+    assert body["clusters"] == [[str(first.id), str(second.id), str(third.id)]]
+    assert str(cancelled.id) not in response.text
+
+    response = client.post(
+        "/missions:conflicts",
+        json={"start_from": (BASE + timedelta(hours=1)).isoformat()},
+        headers=auth_headers,
+    )
+    assert response.json()["pairs"] == [[str(second.id), str(third.id)]]
+
+
+def test_conflicts_endpoint_requires_authentication(client: TestClient) -> None:
+    assert client.post("/missions:conflicts", json={}).status_code == 401
@@ -0,0 +1,93 @@
+"""Tests for the streaming mission export."""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.missions import EXPORT_COLUMNS, iter_mission_export
+from app.models import Mission, MissionStatus
+from app.schemas import MissionRead
+
+BASE = datetime(2026, 7, 1, 6, 0)
+
+
+@pytest.fixture()
+def missions(db_session: Session) -> list[Mission]:
+    rows = [
+        Mission(
+            title=f'Export "{number}", ok',
+            start_time=BASE + timedelta(hours=number),
+            end_time=BASE + timedelta(hours=number, minutes=20),
+            status=MissionStatus.PLANNED if number % 2 else MissionStatus.DRAFT,
+            notes="line one\nline two" if number == 0 else None,
+        )
+        for number in range(5)
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    return rows
+
+
+def test_ndjson_rows_match_mission_read(
+    client: TestClient, missions: list[Mission], auth_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        "/missions/export", headers={**auth_headers, "Accept-Encoding": "identity"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "content-encoding" not in response.headers
+    exported = [json.loads(line) for line in response.text.splitlines()]
+    expected = [MissionRead.model_validate(mission).model_dump(mode="json") for mission in missions]
+    assert exported == expected
+
+
+def test_csv_export_with_filters(
+    client: TestClient, missions: list[Mission], auth_headers: dict[str, str]
+) -> None:
+    response = client.get(
+        "/missions/export",
+        params={"format": "csv", "status": "DRAFT", "start_from": (BASE + timedelta(hours=1)).isoformat()},
+        headers=auth_headers,
+    )
+
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="missions.csv"'
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert tuple(rows[0]) == EXPORT_COLUMNS
+    assert [row[1] for row in rows[1:]] == ['Export "2", ok', 'Export "4", ok']
+
+
+def test_gzip_is_applied_when_accepted(
+    client: TestClient, missions: list[Mission], auth_headers: dict[str, str]
+) -> None:
+    with client.stream(
+        "GET", "/missions/export", headers={**auth_headers, "Accept-Encoding": "gzip"}
+    ) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        raw = b"".join(response.iter_raw())
+
+    lines = gzip.decompress(raw).decode().splitlines()
+    assert len(lines) == 5
+
+    refused = client.get("/missions/export", headers={**auth_headers, "Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in refused.headers
+
+
+def test_export_reads_in_partitions(client: TestClient, missions: list[Mission], db_session: Session) -> None:
+    chunks = list(iter_mission_export(db_session.get_bind(), batch_size=2))
+
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]
+
+
+def test_export_requires_authentication(client: TestClient) -> None:
+    assert client.get("/missions/export").status_code == 401
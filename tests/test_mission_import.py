@@ -0,0 +1,142 @@
+"""Tests for the streaming NDJSON mission import."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.missions import MissionIntervalIndex, iter_ndjson_lines
+from app.missions import importer as importer_module
+from app.models import Mission
+
+BASE = datetime(2026, 5, 1, 9, 0)
+
+
+def row(index: int, **overrides: object) -> bytes:
+    payload: dict[str, object] = {
+        "title": f"Imported {index}",
+        "start_time": (BASE + timedelta(hours=index)).isoformat(),
+        "end_time": (BASE + timedelta(hours=index, minutes=30)).isoformat(),
+    }
+    payload.update(overrides)
+    return json.dumps(payload).encode() + b"\n"
+
+
+async def collect(chunks: list[bytes], max_line_bytes: int = 64) -> list[tuple[int, bytes | None]]:
+    async def stream() -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+
+    return [item async for item in iter_ndjson_lines(stream(), max_line_bytes)]
+
+
+def test_lines_are_split_across_chunk_boundaries() -> None:
+    lines = asyncio.run(collect([b'{"a":', b'1}\n\n  \n{"b"', b":2}\n" + b"x" * 100, b"\n{}"]))
+
+    assert lines == [(1, b'{"a":1}'), (4, b'{"b":2}'), (5, None), (6, b"{}")]
+    assert asyncio.run(collect([b"y" * 100])) == [(1, None)]
+
+
+def test_import_stores_offset_times_as_utc(
+    client: TestClient,
+    db_session: Session,
+    auth_headers: dict[str, str],
+    interval_index: MissionIntervalIndex,
+) -> None:
+    assert interval_index.query(db_session, BASE, BASE + timedelta(days=1)) == []
+    line = row(0, start_time="2026-05-01T11:00:00+02:00", end_time="2026-05-01T05:30:00-04:00")
+
+    response = client.post(
+        "/missions:import", content=line, headers={**auth_headers, "Content-Type": "application/x-ndjson"}
+    )
+
+    assert response.json()["imported"] == 1
+    mission = db_session.scalars(select(Mission)).one()
+    assert (mission.start_time, mission.end_time) == (BASE, BASE + timedelta(minutes=30))
+    assert interval_index.overlapping(BASE, BASE + timedelta(minutes=1)) == [(BASE, mission.id)]
+
+
+def test_import_reports_bad_rows_and_keeps_good_ones(
+    client: TestClient,
+    db_session: Session,
+    auth_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("MISSION_IMPORT_BATCH_SIZE", "2")
+    from app.settings import get_settings
+
+    get_settings.cache_clear()
+
+    def body() -> Iterator[bytes]:
+        yield row(0) + row(1)
+        yield b"not json\n"
+        yield row(2, end_time=BASE.isoformat())
+        yield row(3) + b"\n" + row(4, status="PLANNED")
+
+    response = client.post(
+        "/missions:import",
+        content=body(),
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["imported"] == 4
+    assert report["failed"] == 2
+    assert [error["line"] for error in report["errors"]] == [3, 4]
+    assert report["errors"][1]["errors"][0]["loc"] == ["end_time"]
+    assert not report["errors_truncated"]
+
+    titles = db_session.scalars(select(Mission.title).order_by(Mission.start_time)).all()
+    assert titles == ["Imported 0", "Imported 1", "Imported 3", "Imported 4"]
+
+
+def test_rejected_batch_falls_back_to_single_rows(
+    client: TestClient,
+    db_session: Session,
+    auth_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+    interval_index: MissionIntervalIndex,
+) -> None:
+    # SQLite does not enforce VARCHAR lengths, so let the database reject a
+    # row through the time-range check constraint instead.
+    original = importer_module.MissionImporter._row
+
+    def sneak_past_validation(self, line: bytes) -> dict[str, object]:  # noqa: ANN001
+        values = original(self, line)
+        if values["title"] == "Imported 1":
+            values["end_time"] = values["start_time"]
+        return values
+
+    monkeypatch.setattr(importer_module.MissionImporter, "_row", sneak_past_validation)
+    interval_index.load(db_session)
+
+    response = client.post("/missions:import", content=row(0) + row(1) + row(2), headers=auth_headers)
+
+    report = response.json()
+    assert report["imported"] == 2
+    assert report["failed"] == 1
+    assert report["errors"][0]["line"] == 2
+    assert "CHECK constraint failed" in report["errors"][0]["errors"][0]["msg"]
+    assert db_session.scalar(select(func.count()).select_from(Mission)) == 2
+    assert len(interval_index.overlapping(BASE, BASE + timedelta(days=1))) == 2
+
+
+def test_error_reports_are_capped(
+    client: TestClient, auth_headers: dict[str, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(importer_module, "MAX_REPORTED_ERRORS", 2)
+
+    response = client.post("/missions:import", content=b"{}\n" * 5, headers=auth_headers)
+
+    report = response.json()
+    assert report["failed"] == 5
+    assert len(report["errors"]) == 2
+    assert report["errors_truncated"]
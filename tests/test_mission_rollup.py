@@ -0,0 +1,123 @@
+"""Tests for the trigger-maintained mission status rollup."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.missions import rebuild_status_counts, status_summary
+from app.missions import rollup as rollup_module
+from app.models import Mission, MissionStatus, MissionStatusCount
+
+DAY_ONE = datetime(2026, 8, 1, 9, 0)
+DAY_TWO = DAY_ONE + timedelta(days=1)
+
+
+def add(db_session: Session, start: datetime, status: MissionStatus = MissionStatus.DRAFT) -> Mission:
+    mission = Mission(title="Counted", start_time=start, end_time=start + timedelta(hours=1), status=status)
+    db_session.add(mission)
+    db_session.commit()
+    return mission
+
+
+def grouped(db_session: Session) -> dict[tuple[date, MissionStatus], int]:
+    day = func.date(Mission.start_time)
+    return {
+        (date.fromisoformat(str(row_day)), status): count
+        for row_day, status, count in db_session.execute(
+            select(day, Mission.status, func.count()).group_by(day, Mission.status)
+        )
+    }
+
+
+def rollup(db_session: Session) -> dict[tuple[date, MissionStatus], int]:
+    return {
+        (row.day, row.status): row.count
+        for row in db_session.scalars(select(MissionStatusCount))
+        if row.count
+    }
+
+
+def test_counts_follow_every_write_path(client: TestClient, db_session: Session) -> None:
+    first = add(db_session, DAY_ONE)
+    second = add(db_session, DAY_ONE + timedelta(hours=3))
+    third = add(db_session, DAY_TWO, MissionStatus.PLANNED)
+    assert rollup(db_session) == {
+        (DAY_ONE.date(), MissionStatus.DRAFT): 2,
+        (DAY_TWO.date(), MissionStatus.PLANNED): 1,
+    }
+
+    first.transition_to(MissionStatus.PLANNED)
+    second.title = "Renamed only"
+    db_session.commit()
+    Mission.bulk_transition(db_session, [first.id, third.id], MissionStatus.CONFIRMED)
+    db_session.commit()
+    second.start_time = DAY_TWO
+    second.end_time = DAY_TWO + timedelta(hours=1)
+    db_session.commit()
+    db_session.delete(third)
+    db_session.commit()
+
+    assert rollup(db_session) == grouped(db_session) == {
+        (DAY_ONE.date(), MissionStatus.CONFIRMED): 1,
+        (DAY_TWO.date(), MissionStatus.DRAFT): 1,
+    }
+
+    db_session.execute(update(Mission).where(Mission.id == first.id).values(status=MissionStatus.CANCELED))
+    db_session.rollback()
+    assert rollup(db_session)[(DAY_ONE.date(), MissionStatus.CONFIRMED)] == 1
+
+
+def test_rebuild_repairs_drift(client: TestClient, db_session: Session) -> None:
+    add(db_session, DAY_ONE)
+    add(db_session, DAY_TWO, MissionStatus.DONE)
+    db_session.execute(update(MissionStatusCount).values(count=42))
+    db_session.add(MissionStatusCount(day=date(2020, 1, 1), status=MissionStatus.DRAFT, count=3))
+    db_session.commit()
+
+    assert rebuild_status_counts(db_session) == 2
+    db_session.commit()
+
+    assert rollup(db_session) == grouped(db_session)
+    assert status_summary(db_session, start=DAY_TWO.date()) == [
+        (DAY_TWO.date(), {MissionStatus.DONE: 1})
+    ]
+
+
+def test_rebuild_command(
+    client: TestClient, db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    add(db_session, DAY_ONE)
+    db_session.execute(update(MissionStatusCount).values(count=0))
+    db_session.commit()
+
+    @contextmanager
+    def scope() -> Iterator[Session]:
+        yield db_session
+        db_session.commit()
+
+    monkeypatch.setattr(rollup_module, "session_scope", scope)
+    rollup_module.main([])
+
+    assert rollup(db_session) == {(DAY_ONE.date(), MissionStatus.DRAFT): 1}
+
+
+def test_summary_endpoint(client: TestClient, db_session: Session, auth_headers: dict[str, str]) -> None:
+    add(db_session, DAY_ONE)
+    add(db_session, DAY_ONE, MissionStatus.PLANNED)
+    add(db_session, DAY_TWO, MissionStatus.PLANNED)
+
+    response = client.get(
+        "/missions/summary", params={"end": DAY_TWO.date().isoformat()}, headers=auth_headers
+    )
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"day": "2026-08-01", "counts": {"DRAFT": 1, "PLANNED": 1}, "total": 2}
+    ]
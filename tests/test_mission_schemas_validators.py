@@ -67,6 +67,6 @@ def test_read_schema_from_attributes_mapping():
     o.updated_at = now
 
     mr = MissionRead.model_validate(o, from_attributes=True)
-    assert mr.id == o.id
+    assert str(mr.id) == o.id
     assert mr.title == o.title
     assert mr.status == MissionStatus.CONFIRMED
@@ -0,0 +1,159 @@
+"""Tests for the full-text mission search index and endpoint."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, text, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.missions import rebuild_search_index, search_missions, search_statement, search_terms
+from app.missions import search as search_module
+from app.models import Mission
+
+START = datetime(2026, 9, 1, 9, 0)
+
+
+def add(db_session: Session, title: str, notes: str | None = None) -> Mission:
+    mission = Mission(title=title, notes=notes, start_time=START, end_time=START + timedelta(hours=1))
+    db_session.add(mission)
+    db_session.commit()
+    return mission
+
+
+def titles(db_session: Session, query: str) -> list[str]:
+    return [mission.title for mission, _ in search_missions(db_session, query, limit=50)]
+
+
+def test_search_terms_keep_only_words() -> None:
+    assert search_terms('Fuel "check" OR -NEAR(x)*') == ["fuel", "check", "or", "near", "x"]
+    assert search_terms("__ -- !!") == []
+    assert len(search_terms("a " * 100)) == search_module.MAX_SEARCH_TERMS
+
+
+def test_index_follows_inserts_updates_and_deletes(client: TestClient, db_session: Session) -> None:
+    survey = add(db_session, "Harbour survey", "Check the crane")
+    add(db_session, "Crane inspection")
+    assert titles(db_session, "crane") == ["Crane inspection", "Harbour survey"]
+
+    survey.notes = "Nothing to lift"
+    db_session.commit()
+    assert titles(db_session, "crane") == ["Crane inspection"]
+
+    db_session.execute(update(Mission).where(Mission.id == survey.id).values(title="Crane survey"))
+    db_session.commit()
+    assert sorted(titles(db_session, "crane")) == ["Crane inspection", "Crane survey"]
+
+    db_session.execute(delete(Mission).where(Mission.title == "Crane inspection"))
+    db_session.commit()
+    assert titles(db_session, "crane") == ["Crane survey"]
+    assert db_session.scalar(text("SELECT count(*) FROM mission_search_docs")) == 1
+
+
+def test_ranking_prefix_and_accents(client: TestClient, db_session: Session) -> None:
+    add(db_session, "Routine patrol", "Look for the beacon")
+    add(db_session, "Beacon repair")
+    add(db_session, "Café déjà vu")
+
+    assert titles(db_session, "beacon") == ["Beacon repair", "Routine patrol"]
+    assert titles(db_session, "beac") == ["Beacon repair", "Routine patrol"]
+    assert titles(db_session, "beacon repair") == ["Beacon repair"]
+    assert titles(db_session, "cafe deja") == ["Café déjà vu"]
+    assert titles(db_session, "...") == []
+
+
+def test_search_query_uses_the_fts_index(client: TestClient, db_session: Session) -> None:
+    statement = search_statement("sqlite", ["crane"], limit=10)
+    compiled = statement.compile(db_session.get_bind(), compile_kwargs={"literal_binds": True})
+    plan = " ".join(row[-1] for row in db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+
+    assert "VIRTUAL TABLE INDEX" in plan
+    assert "SEARCH missions USING INDEX" in plan
+
+
+def test_other_dialects_fall_back_to_substring_matching() -> None:
+    sql = str(search_statement("mysql", ["crane"], limit=5))
+
+    assert "lower(missions.title) LIKE lower(" in sql
+    assert "missions_fts" not in sql
+
+
+def test_postgresql_rank_is_an_exact_numeric_in_order_and_cursor() -> None:
+    after = (-0.060793, uuid.uuid4())
+    compiled = search_statement("postgresql", ["crane"], after=after, limit=5).compile(
+        dialect=postgresql.dialect()
+    )
+    sql = str(compiled)
+
+    assert "round(CAST(-ts_rank(missions.search_vector" in sql
+    assert "AS NUMERIC)" in sql
+    assert "ORDER BY round(CAST(-ts_rank(" in sql
+    scores = [value for value in compiled.params.values() if isinstance(value, Decimal)]
+    assert scores and all(score == Decimal("-0.060793") for score in scores)
+
+
+def test_rebuild_repairs_drift(client: TestClient, db_session: Session) -> None:
+    add(db_session, "Survey north ridge")
+    add(db_session, "Survey south ridge")
+    db_session.execute(text("DELETE FROM missions_fts"))
+    db_session.commit()
+    assert titles(db_session, "ridge") == []
+
+    assert rebuild_search_index(db_session) == 2
+    db_session.commit()
+    assert len(titles(db_session, "ridge")) == 2
+
+
+def test_rebuild_command(
+    client: TestClient, db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    add(db_session, "Lost in the index")
+    db_session.execute(text("DELETE FROM mission_search_docs"))
+    db_session.commit()
+
+    @contextmanager
+    def scope() -> Iterator[Session]:
+        yield db_session
+        db_session.commit()
+
+    monkeypatch.setattr(search_module, "session_scope", scope)
+    search_module.main([])
+
+    assert titles(db_session, "lost") == ["Lost in the index"]
+
+
+def test_search_endpoint_pages_through_ranked_results(
+    client: TestClient, db_session: Session, auth_headers: dict[str, str]
+) -> None:
+    for number in range(4):
+        add(db_session, f"Survey {number}", "Fire drill")
+    add(db_session, "Drill practice")
+    for number in range(10):
+        add(db_session, f"Unrelated {number}")
+
+    seen: list[str] = []
+    params: dict[str, str | int] = {"q": "drill", "limit": 2}
+    while True:
+        page = client.get("/missions/search", params=params, headers=auth_headers).json()
+        seen.extend(item["title"] for item in page["items"])
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+
+    assert seen[0] == "Drill practice"
+    assert sorted(seen[1:]) == [f"Survey {number}" for number in range(4)]
+
+
+def test_search_endpoint_validates_input(client: TestClient, auth_headers: dict[str, str]) -> None:
+    assert client.get("/missions/search", params={"q": "?!"}, headers=auth_headers).status_code == 422
+    assert client.get("/missions/search", params={"q": ""}, headers=auth_headers).status_code == 422
+    response = client.get("/missions/search", params={"q": "x", "cursor": "bad"}, headers=auth_headers)
+    assert response.status_code == 400
+    assert client.get("/missions/search", params={"q": "x"}).status_code == 401
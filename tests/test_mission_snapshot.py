@@ -0,0 +1,164 @@
+"""Tests for the columnar mission snapshot."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, event, update
+from sqlalchemy.orm import Session
+
+from app.missions import MissionSnapshot, get_mission_snapshot, reset_mission_snapshot
+from app.models import Mission, MissionStatus
+from app.models.mission import utcnow
+from app.settings import get_settings
+
+BASE = datetime(2026, 5, 4, 9, 0)
+
+
+def add(
+    db_session: Session, offset: int, title: str = "Survey", status: MissionStatus = MissionStatus.DRAFT
+) -> Mission:
+    start = BASE + timedelta(hours=offset)
+    mission = Mission(title=title, start_time=start, end_time=start + timedelta(hours=1), status=status)
+    db_session.add(mission)
+    db_session.commit()
+    return mission
+
+
+def ids(rows: list) -> list:  # noqa: ANN001
+    return [row.id for row in rows]
+
+
+def test_select_filters_and_orders_without_database(client: TestClient, db_session: Session) -> None:
+    late = add(db_session, 5, "Ünïcode title")
+    tied = sorted([add(db_session, 2).id, add(db_session, 2).id])
+    early = add(db_session, 0, status=MissionStatus.PLANNED).id
+    late_row = (late.id, "Ünïcode title", late.start_time, late.end_time, MissionStatus.DRAFT)
+    snapshot = MissionSnapshot()
+    assert snapshot.load(db_session) == 4
+    db_session.close()
+
+    assert ids(snapshot.select()) == [early, *tied, late_row[0]]
+    assert ids(snapshot.select(limit=2)) == [early, tied[0]]
+    window = snapshot.select(start_from=BASE + timedelta(hours=1), start_to=BASE + timedelta(hours=5))
+    assert ids(window) == tied
+    assert ids(snapshot.select(statuses=[MissionStatus.PLANNED])) == [early]
+    assert snapshot.select(limit=0) == []
+    assert snapshot.select(start_from=BASE + timedelta(hours=5)) == [late_row]
+    assert len(snapshot) == 4
+    assert snapshot.nbytes > 0
+
+
+def test_refresh_applies_changes_since_watermark(client: TestClient, db_session: Session) -> None:
+    first = add(db_session, 0)
+    second = add(db_session, 1)
+    snapshot = MissionSnapshot()
+    snapshot.load(db_session)
+    assert snapshot.refresh(db_session) == 0
+
+    first.title = "Renamed"
+    first.start_time, first.end_time = BASE + timedelta(hours=3), BASE + timedelta(hours=4)
+    db_session.commit()
+    Mission.bulk_transition(db_session, [second.id], MissionStatus.PLANNED)
+    db_session.commit()
+    third = add(db_session, 2)
+
+    assert snapshot.refresh(db_session) == 3
+    assert snapshot.reloads == 1
+    assert [(row.id, row.title, row.status) for row in snapshot.select()] == [
+        (second.id, "Survey", MissionStatus.PLANNED),
+        (third.id, "Survey", MissionStatus.DRAFT),
+        (first.id, "Renamed", MissionStatus.DRAFT),
+    ]
+
+
+def test_refresh_reloads_after_deletes(client: TestClient, db_session: Session) -> None:
+    first = add(db_session, 0)
+    second = add(db_session, 1)
+    snapshot = MissionSnapshot()
+    snapshot.load(db_session)
+
+    db_session.execute(delete(Mission).where(Mission.id == first.id))
+    db_session.commit()
+    statements: list[str] = []
+
+    def listener(_conn, _cursor, statement: str, *_args) -> None:  # noqa: ANN001
+        statements.append(statement)
+
+    event.listen(db_session.get_bind(), "before_cursor_execute", listener)
+    try:
+        snapshot.refresh(db_session)
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", listener)
+
+    assert snapshot.reloads == 2
+    assert not any("count(*)" in statement.lower() for statement in statements)
+    assert ids(snapshot.select()) == [second.id]
+
+
+def test_refresh_reloads_when_titles_waste_space(client: TestClient, db_session: Session) -> None:
+    mission = add(db_session, 0, "A")
+    snapshot = MissionSnapshot()
+    snapshot.load(db_session)
+
+    for title in ("B", "C"):
+        db_session.execute(
+            update(Mission)
+            .where(Mission.id == mission.id)
+            .values(title=title, updated_at=utcnow())
+        )
+        db_session.commit()
+        snapshot.refresh(db_session)
+
+    assert snapshot.reloads == 2
+    assert snapshot.select()[0].title == "C"
+
+
+def test_board_endpoint_serves_snapshot(
+    client: TestClient, db_session: Session, auth_headers: dict[str, str]
+) -> None:
+    first = add(db_session, 0)
+    add(db_session, 1, status=MissionStatus.CANCELED)
+
+    response = client.get("/missions/board", params={"status": "DRAFT"}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {
+            "id": str(first.id),
+            "title": "Survey",
+            "start_time": first.start_time.isoformat(),
+            "end_time": first.end_time.isoformat(),
+            "status": "DRAFT",
+        }
+    ]
+    snapshot = get_mission_snapshot()
+    assert snapshot is not None and snapshot.loaded
+
+    # Within max_age the snapshot is served as is.
+    add(db_session, 2)
+    assert len(client.get("/missions/board", headers=auth_headers).json()) == 2
+    snapshot.max_age = 0
+    assert len(client.get("/missions/board", headers=auth_headers).json()) == 3
+
+
+def test_board_endpoint_without_snapshot(
+    client: TestClient,
+    db_session: Session,
+    auth_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("MISSION_SNAPSHOT", "false")
+    get_settings.cache_clear()
+    reset_mission_snapshot()
+    first = add(db_session, 3)
+    second = add(db_session, 0)
+
+    response = client.get(
+        "/missions/board", params={"start_from": BASE.isoformat(), "limit": 5}, headers=auth_headers
+    )
+
+    assert get_mission_snapshot() is None
+    assert [item["id"] for item in response.json()] == [str(second.id), str(first.id)]
@@ -0,0 +1,107 @@
+"""Tests for set-based bulk mission transitions."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.models import Mission, MissionStatus
+
+BASE = datetime(2026, 6, 1, 8, 0)
+
+
+def seed(db_session: Session, *statuses: MissionStatus) -> list[Mission]:
+    missions = [
+        Mission(
+            title=f"T{number}",
+            start_time=BASE + timedelta(hours=number),
+            end_time=BASE + timedelta(hours=number, minutes=30),
+            status=status,
+            updated_at=BASE,
+        )
+        for number, status in enumerate(statuses)
+    ]
+    db_session.add_all(missions)
+    db_session.commit()
+    return missions
+
+
+def test_allowed_predecessors_reverse_the_transition_table() -> None:
+    assert Mission.allowed_predecessors(MissionStatus.CANCELED) == {
+        MissionStatus.DRAFT,
+        MissionStatus.PLANNED,
+        MissionStatus.CONFIRMED,
+    }
+    assert Mission.allowed_predecessors(MissionStatus.DONE) == {MissionStatus.IN_PROGRESS}
+    assert Mission.allowed_predecessors(MissionStatus.DRAFT) == set()
+
+
+def test_bulk_transition_issues_one_update_per_batch(client: TestClient, db_session: Session) -> None:
+    missions = seed(
+        db_session,
+        MissionStatus.DRAFT,
+        MissionStatus.PLANNED,
+        MissionStatus.DONE,
+        MissionStatus.CONFIRMED,
+        MissionStatus.CANCELED,
+    )
+    missing = uuid.uuid4()
+    ids = [mission.id for mission in missions] + [missing, missions[0].id]
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        statements.append(statement.split()[0])
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = Mission.bulk_transition(db_session, ids, MissionStatus.CANCELED, batch_size=4)
+        db_session.commit()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert result.updated == [missions[0].id, missions[1].id, missions[3].id]
+    assert result.rejected == [missions[2].id, missions[4].id]
+    assert result.not_found == [missing]
+    assert statements == ["UPDATE", "UPDATE", "SELECT"]
+
+    db_session.expire_all()
+    assert missions[0].status is MissionStatus.CANCELED
+    assert missions[0].updated_at > BASE
+    assert missions[2].status is MissionStatus.DONE
+    assert missions[2].updated_at == BASE
+
+
+def test_bulk_transition_to_unreachable_status(client: TestClient, db_session: Session) -> None:
+    (mission,) = seed(db_session, MissionStatus.PLANNED)
+
+    result = Mission.bulk_transition(db_session, [mission.id], MissionStatus.DRAFT)
+
+    assert result.updated == []
+    assert result.rejected == [mission.id]
+
+
+def test_transition_endpoint(client: TestClient, db_session: Session, auth_headers: dict[str, str]) -> None:
+    draft, started = seed(db_session, MissionStatus.DRAFT, MissionStatus.IN_PROGRESS)
+    missing = uuid.uuid4()
+
+    response = client.post(
+        "/missions:transition",
+        json={"ids": [str(draft.id), str(started.id), str(missing)], "status": "CONFIRMED"},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "status": "CONFIRMED",
+        "updated": [str(draft.id)],
+        "rejected": [str(started.id)],
+        "not_found": [str(missing)],
+    }
+    assert client.post(
+        "/missions:transition", json={"ids": [], "status": "DONE"}, headers=auth_headers
+    ).status_code == 422
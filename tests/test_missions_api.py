@@ -0,0 +1,200 @@
+"""Tests for the mission CRUD API and its keyset pagination."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.api.pagination import encode_cursor
+from app.models import Mission, MissionStatus
+
+BASE = datetime(2026, 1, 1, 8, 0)
+
+
+def seed_missions(db_session: Session, count: int, *, same_start: int = 1) -> list[Mission]:
+    missions = [
+        Mission(
+            title=f"Mission {index}",
+            start_time=BASE + timedelta(hours=index // same_start),
+            end_time=BASE + timedelta(hours=index // same_start, minutes=45),
+            status=MissionStatus.PLANNED if index % 2 else MissionStatus.DRAFT,
+        )
+        for index in range(count)
+    ]
+    db_session.add_all(missions)
+    db_session.commit()
+    return missions
+
+
+def mission_payload(**overrides: Any) -> dict[str, Any]:
+    payload = {
+        "title": "Survey",
+        "start_time": BASE.isoformat(),
+        "end_time": (BASE + timedelta(hours=2)).isoformat(),
+    }
+    payload.update(overrides)
+    return payload
+
+
+def test_missions_require_authentication(client: TestClient) -> None:
+    assert client.get("/missions").status_code == 401
+
+
+def test_mission_crud_round_trip(client: TestClient, auth_headers: dict[str, str]) -> None:
+    created = client.post("/missions", json=mission_payload(notes="north"), headers=auth_headers)
+    assert created.status_code == 201
+    mission = created.json()
+    assert mission["status"] == "DRAFT"
+
+    url = f"/missions/{mission['id']}"
+    assert client.get(url, headers=auth_headers).json()["notes"] == "north"
+
+    updated = client.patch(url, json={"title": "Survey 2", "status": "PLANNED"}, headers=auth_headers)
+    assert updated.status_code == 200
+    assert updated.json()["title"] == "Survey 2"
+    assert updated.json()["status"] == "PLANNED"
+
+    assert client.delete(url, headers=auth_headers).status_code == 204
+    assert client.get(url, headers=auth_headers).status_code == 404
+    assert client.delete(url, headers=auth_headers).status_code == 404
+
+
+def test_mission_update_enforces_rules(client: TestClient, auth_headers: dict[str, str]) -> None:
+    mission = client.post("/missions", json=mission_payload(), headers=auth_headers).json()
+    url = f"/missions/{mission['id']}"
+
+    invalid_transition = client.patch(url, json={"status": "DONE"}, headers=auth_headers)
+    assert invalid_transition.status_code == 409
+
+    inverted = client.patch(
+        url, json={"end_time": (BASE - timedelta(hours=1)).isoformat()}, headers=auth_headers
+    )
+    assert inverted.status_code == 422
+
+    unchanged = client.patch(url, json={"status": "DRAFT"}, headers=auth_headers)
+    assert unchanged.status_code == 200
+
+
+def test_mission_update_accepts_offset_times(client: TestClient, auth_headers: dict[str, str]) -> None:
+    mission = client.post("/missions", json=mission_payload(), headers=auth_headers).json()
+    url = f"/missions/{mission['id']}"
+
+    # 14:00+02:00 is 12:00 UTC, four hours after BASE.
+    east = client.patch(url, json={"end_time": "2026-01-01T14:00:00+02:00"}, headers=auth_headers)
+    assert east.status_code == 200
+    assert east.json()["end_time"] == (BASE + timedelta(hours=4)).isoformat()
+
+    # 08:00+01:00 is 07:00 UTC, before the mission starts.
+    before_start = client.patch(url, json={"end_time": "2026-01-01T08:00:00+01:00"}, headers=auth_headers)
+    assert before_start.status_code == 422
+
+
+@pytest.mark.parametrize("field", ["title", "start_time", "end_time"])
+def test_mission_update_rejects_null_required_fields(
+    client: TestClient, auth_headers: dict[str, str], field: str
+) -> None:
+    mission = client.post("/missions", json=mission_payload(), headers=auth_headers).json()
+    url = f"/missions/{mission['id']}"
+
+    response = client.patch(url, json={field: None}, headers=auth_headers)
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", field]
+    assert client.get(url, headers=auth_headers).json() == mission
+    cleared = client.patch(url, json={"notes": None}, headers=auth_headers)
+    assert cleared.status_code == 200 and cleared.json()["notes"] is None
+
+
+def test_keyset_pages_cover_every_row_once(
+    client: TestClient, db_session: Session, auth_headers: dict[str, str]
+) -> None:
+    # Several missions share a start time so the id tie-breaker is exercised.
+    missions = seed_missions(db_session, 23, same_start=3)
+    expected = [str(m.id) for m in sorted(missions, key=lambda m: (m.start_time, m.id.hex))]
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        params: dict[str, Any] = {"limit": 5}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/missions", params=params, headers=auth_headers).json()
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == expected
+
+
+def test_list_filters_by_window_and_status(
+    client: TestClient, db_session: Session, auth_headers: dict[str, str]
+) -> None:
+    seed_missions(db_session, 10)
+
+    response = client.get(
+        "/missions",
+        params={
+            "start_from": (BASE + timedelta(hours=2)).isoformat(),
+            "start_to": (BASE + timedelta(hours=8)).isoformat(),
+            "status": "PLANNED",
+        },
+        headers=auth_headers,
+    )
+
+    titles = [item["title"] for item in response.json()["items"]]
+    assert titles == ["Mission 3", "Mission 5", "Mission 7"]
+    assert response.json()["next_cursor"] is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not-base64!!", encode_cursor("only-one"), encode_cursor("yesterday", "x"), "bnVsbA"],
+)
+def test_invalid_cursor_is_rejected(
+    client: TestClient, auth_headers: dict[str, str], cursor: str
+) -> None:
+    response = client.get("/missions", params={"cursor": cursor}, headers=auth_headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_list_query_uses_time_range_index(
+    client: TestClient, db_session: Session, auth_headers: dict[str, str]
+) -> None:
+    seed_missions(db_session, 5)
+    engine = db_session.get_bind()
+    captured: list[tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if statement.lstrip().upper().startswith("SELECT") and "FROM missions" in statement:
+            captured.append((statement, parameters))
+
+    cursor = encode_cursor(BASE.isoformat(), uuid.UUID(int=0).hex)
+    # The dependency override opens sessions on this same engine.
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        client.get(
+            "/missions",
+            params={"cursor": cursor, "start_from": BASE.isoformat(), "limit": 2},
+            headers=auth_headers,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    statement, parameters = captured[-1]
+    with engine.connect() as connection:
+        plan = " ".join(
+            row[-1]
+            for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        )
+
+    assert "USING INDEX ix_missions_time_range (start_time>?)" in plan
+    assert "SCAN missions" not in plan
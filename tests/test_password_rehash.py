@@ -0,0 +1,176 @@
+"""Tests for bcrypt cost calibration and deferred hash upgrades."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models import User
+from app.security import (
+    PasswordRehasher,
+    PasswordService,
+    calibrate_bcrypt_rounds,
+    get_password_rehasher,
+    get_password_service,
+    hash_password,
+    password_needs_rehash,
+    shutdown_password_service,
+)
+from app.security import password as password_module
+from app.security import password_service as password_service_module
+from app.settings import get_settings
+
+
+def _rounds(password_hash: str) -> int:
+    return int(password_hash.split("$")[2])
+
+
+def test_hash_password_honours_explicit_rounds() -> None:
+    hashed = hash_password("s3cretpass", rounds=10)
+
+    assert _rounds(hashed) == 10
+    assert password_needs_rehash(hashed, 12)
+    assert not password_needs_rehash(hashed, 10)
+    assert not password_needs_rehash(hash_password("s3cretpass", rounds=11), 10)
+    assert password_needs_rehash("not-a-bcrypt-hash", 10)
+
+
+def test_calibration_extrapolates_and_clamps(monkeypatch: pytest.MonkeyPatch) -> None:
+    ticks = itertools.cycle([0.0, 0.010])
+    monkeypatch.setattr(password_module.time, "perf_counter", lambda: next(ticks))
+
+    assert calibrate_bcrypt_rounds(160, samples=3) == 12
+    assert calibrate_bcrypt_rounds(0.001, samples=1) == password_module.MIN_BCRYPT_ROUNDS
+    assert calibrate_bcrypt_rounds(10**9, samples=1) == password_module.MAX_BCRYPT_ROUNDS
+
+
+def test_service_calibrates_when_target_is_set(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PASSWORD_TARGET_MS", "250")
+    monkeypatch.setattr(password_service_module, "calibrate_bcrypt_rounds", lambda target: 13)
+    get_settings.cache_clear()
+    shutdown_password_service()
+
+    assert get_password_service().rounds == 13
+
+    shutdown_password_service()
+    get_settings.cache_clear()
+
+
+def test_login_upgrades_weak_hash_after_response(client: TestClient, db_session: Session) -> None:
+    db_session.add(
+        User(email="legacy@example.com", password_hash=hash_password("SuperSecret1!", rounds=10))
+    )
+    db_session.commit()
+    client.app.dependency_overrides[get_password_rehasher] = lambda: PasswordRehasher(
+        get_password_service(),
+        batch_size=1,
+        flush_interval=0,
+        session_factory=client.app.state._async_sessionmaker,
+    )
+
+    response = client.post(
+        "/auth/login", json={"email": "legacy@example.com", "password": "SuperSecret1!"}
+    )
+
+    assert response.status_code == 200
+    db_session.expire_all()
+    user = db_session.scalar(select(User).where(User.email == "legacy@example.com"))
+    assert _rounds(user.password_hash) == get_password_service().rounds
+
+
+def test_rehasher_batches_and_skips_changed_rows(tmp_path: Path) -> None:
+    url = f"sqlite:///{tmp_path / 'rehash.db'}"
+    sync_engine = create_engine(url)
+    Base.metadata.create_all(sync_engine)
+    with Session(sync_engine) as session:
+        session.add_all(
+            [
+                User(id=1, email="a@example.com", password_hash="old-a"),
+                User(id=2, email="b@example.com", password_hash="old-b"),
+                User(id=3, email="c@example.com", password_hash="changed"),
+            ]
+        )
+        session.commit()
+
+    async def scenario() -> None:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'rehash.db'}")
+        service = PasswordService(max_workers=0, max_pending=4, rounds=10)
+        rehasher = PasswordRehasher(
+            service, batch_size=10, flush_interval=0.1, session_factory=async_sessionmaker(engine)
+        )
+        try:
+            await rehasher.submit(1, "pw-a", "old-a")
+            await rehasher.submit(2, "pw-b", "old-b")
+            assert rehasher.pending == 2
+            await asyncio.sleep(0.3)
+            assert rehasher.pending == 0
+
+            await rehasher.submit(3, "pw-c", "stale")
+            await rehasher.close()
+            assert await rehasher.flush() == 0
+        finally:
+            await engine.dispose()
+
+    asyncio.run(scenario())
+
+    with Session(sync_engine) as session:
+        hashes = dict(session.execute(select(User.id, User.password_hash)).all())
+    sync_engine.dispose()
+    assert _rounds(hashes[1]) == 10 and _rounds(hashes[2]) == 10
+    assert hashes[3] == "changed"
+
+
+def test_rehasher_skips_when_pool_is_busy() -> None:
+    service = PasswordService(max_workers=0, max_pending=0)
+    service._in_flight = service.capacity
+    rehasher = PasswordRehasher(service, batch_size=1, flush_interval=0)
+
+    asyncio.run(rehasher.submit(1, "pw", "old"))
+
+    assert rehasher.pending == 0
+
+
+
+def test_rehasher_keeps_batch_when_write_fails(caplog: pytest.LogCaptureFixture) -> None:
+    service = PasswordService(max_workers=0, max_pending=4, rounds=10)
+    calls: list[dict[int, str]] = []
+
+    class FailingSession:
+        async def __aenter__(self) -> FailingSession:
+            return self
+
+        async def __aexit__(self, *exc_info: object) -> None:
+            return None
+
+        async def execute(self, statement: object, params: list[dict[str, object]]) -> None:
+            calls.append({row["b_id"]: row["b_new"] for row in params})
+            # A login for user 1 lands while the write is in flight.
+            rehasher._pending[1] = ("old-a", "newer-a")
+            raise RuntimeError("database is down")
+
+    rehasher = PasswordRehasher(service, batch_size=10, flush_interval=0, session_factory=FailingSession)
+
+    async def scenario() -> None:
+        await rehasher.submit(1, "pw-a", "old-a")
+        await rehasher.submit(2, "pw-b", "old-b")
+        await asyncio.sleep(0.05)
+
+    with caplog.at_level("ERROR", logger="app.security.rehash"):
+        asyncio.run(scenario())
+
+    assert calls
+    assert "upgraded password hashes; keeping them queued" in caplog.text
+    assert rehasher.pending == 2
+    assert rehasher._pending[1] == ("old-a", "newer-a")
+    assert rehasher._pending[2][1] == calls[-1][2]
+
+    assert asyncio.run(rehasher.flush()) == 0
+    assert calls[-1] == {1: "newer-a", 2: rehasher._pending[2][1]}
@@ -0,0 +1,96 @@
+"""Tests for the asynchronous password hashing service."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.security import (
+    PasswordService,
+    PasswordServiceBusyError,
+    get_password_service,
+    shutdown_password_service,
+)
+from app.settings import get_settings
+
+
+def test_process_pool_hash_and_verify() -> None:
+    service = PasswordService(max_workers=1, max_pending=4)
+    try:
+        hashed = asyncio.run(service.hash_password("s3cretpass"))
+
+        assert hashed != "s3cretpass"
+        assert asyncio.run(service.verify_password("s3cretpass", hashed))
+        assert not asyncio.run(service.verify_password("wrong", hashed))
+        assert service.in_flight == 0
+    finally:
+        service.shutdown()
+
+
+def test_thread_mode_sheds_when_capacity_exhausted() -> None:
+    service = PasswordService(max_workers=0, max_pending=0)
+    release = threading.Event()
+
+    async def scenario() -> None:
+        blocked = asyncio.create_task(service._submit(release.wait))
+        await asyncio.sleep(0)
+        assert service.in_flight == 1
+
+        with pytest.raises(PasswordServiceBusyError):
+            await service.hash_password("s3cretpass")
+
+        release.set()
+        assert await blocked is True
+
+    asyncio.run(scenario())
+    assert service.in_flight == 0
+    service.shutdown()
+
+
+def test_get_password_service_uses_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PASSWORD_POOL_SIZE", "3")
+    monkeypatch.setenv("PASSWORD_QUEUE_LIMIT", "5")
+    get_settings.cache_clear()
+    shutdown_password_service()
+
+    service = get_password_service()
+    assert get_password_service() is service
+    assert service.max_workers == 3
+    assert service.capacity == 8
+
+    shutdown_password_service()
+    assert get_password_service() is not service
+
+    shutdown_password_service()
+    get_settings.cache_clear()
+
+
+class _SaturatedService(PasswordService):
+    def __init__(self) -> None:
+        super().__init__(max_workers=0, max_pending=0)
+
+    async def _submit(self, func, *args):  # type: ignore[override]
+        raise PasswordServiceBusyError("saturated")
+
+
+def test_auth_routes_shed_with_503(client: TestClient) -> None:
+    client.app.dependency_overrides[get_password_service] = _SaturatedService
+
+    signup = client.post("/auth/signup", json={"email": "busy@example.com", "password": "SuperSecret1!"})
+    assert signup.status_code == 503
+    assert signup.headers["Retry-After"] == "1"
+
+    del client.app.dependency_overrides[get_password_service]
+    assert (
+        client.post(
+            "/auth/signup", json={"email": "busy@example.com", "password": "SuperSecret1!"}
+        ).status_code
+        == 201
+    )
+
+    client.app.dependency_overrides[get_password_service] = _SaturatedService
+    login = client.post("/auth/login", json={"email": "busy@example.com", "password": "SuperSecret1!"})
+    assert login.status_code == 503
@@ -0,0 +1,190 @@
+"""Tests for login rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.security import (
+    LoginRateLimiter,
+    SQLiteTokenBucketLimiter,
+    TokenBucketLimiter,
+    get_login_rate_limiter,
+)
+from app.settings import Settings, get_settings
+
+
+def test_bucket_refills_lazily() -> None:
+    limiter = TokenBucketLimiter(burst=2, per_minute=60)
+
+    assert limiter.hit("k", now=0.0) == 0.0
+    assert limiter.hit("k", now=0.0) == 0.0
+    assert limiter.hit("k", now=0.0) == pytest.approx(1.0)
+    assert limiter.hit("k", now=0.5) == pytest.approx(0.5)
+    assert limiter.hit("k", now=1.5) == 0.0
+    assert limiter.hit("other", now=1.5) == 0.0
+
+
+def test_disabled_and_non_refilling_buckets() -> None:
+    assert TokenBucketLimiter(burst=0, per_minute=1).hit("k") == 0.0
+
+    frozen = TokenBucketLimiter(burst=1, per_minute=0)
+    assert frozen.hit("k", now=0.0) == 0.0
+    assert frozen.hit("k", now=10.0) == float("inf")
+
+
+def test_full_buckets_are_pruned_when_shard_grows() -> None:
+    limiter = TokenBucketLimiter(burst=1, per_minute=60, shards=1, max_keys_per_shard=2)
+    limiter.hit("a", now=0.0)
+    limiter.hit("b", now=0.0)
+    limiter.hit("c", now=100.0)
+
+    buckets = limiter._shards[0][1]
+    assert set(buckets) == {"c"}
+
+    limiter.reset()
+    assert not buckets
+
+
+def test_pruning_a_shard_of_busy_keys_stays_cheap() -> None:
+    limiter = TokenBucketLimiter(burst=2, per_minute=60, shards=1, max_keys_per_shard=10)
+    checks = 0
+    refilled = limiter._refilled
+
+    def counting(tokens: float, updated: float, now: float) -> float:
+        nonlocal checks
+        checks += 1
+        return refilled(tokens, updated, now)
+
+    limiter._refilled = counting  # type: ignore[method-assign]
+    for index in range(1000):
+        limiter.hit(f"key-{index}", now=index / 1000)
+
+    # One check for the hit itself and one for the oldest bucket, not a rescan.
+    assert checks <= 2 * 1000
+    assert len(limiter._shards[0][1]) == 1000
+
+    limiter.hit("key-0", now=5.0)
+    buckets = limiter._shards[0][1]
+    assert list(buckets) == ["key-0"]
+
+
+def test_login_limiter_checks_the_client_before_the_email() -> None:
+    limiter = LoginRateLimiter(
+        by_email=TokenBucketLimiter(burst=1, per_minute=60),
+        by_ip=TokenBucketLimiter(burst=1, per_minute=60),
+    )
+
+    assert asyncio.run(limiter.check("first@example.com", "10.0.0.1")) == 0.0
+    assert asyncio.run(limiter.check("victim@example.com", "10.0.0.1")) > 0
+    assert asyncio.run(limiter.check("victim@example.com", "10.0.0.2")) == 0.0
+    assert limiter.rejected == 1
+
+
+def test_sqlite_buckets_are_shared_between_instances(tmp_path: Path) -> None:
+    path = str(tmp_path / "limits" / "rate.db")
+    first = SQLiteTokenBucketLimiter(burst=2, per_minute=60, path=path, namespace="login-email")
+    second = SQLiteTokenBucketLimiter(burst=2, per_minute=60, path=path, namespace="login-email")
+    other = SQLiteTokenBucketLimiter(burst=2, per_minute=60, path=path, namespace="login-ip")
+
+    assert first.hit("k", now=0.0) == 0.0
+    assert second.hit("k", now=0.0) == 0.0
+    assert first.hit("k", now=0.0) == pytest.approx(1.0)
+    assert other.hit("k", now=0.0) == 0.0
+    assert asyncio.run(second.ahit("fresh")) == 0.0
+
+    first.reset()
+    assert second.hit("k", now=0.0) == 0.0
+    assert SQLiteTokenBucketLimiter(0, 1, path=path, namespace="x").hit("k") == 0.0
+    assert asyncio.run(SQLiteTokenBucketLimiter(0, 1, path=path, namespace="x").ahit("k")) == 0.0
+
+    frozen = SQLiteTokenBucketLimiter(burst=1, per_minute=0, path=path, namespace="frozen")
+    frozen.hit("k", now=0.0)
+    assert frozen.hit("k", now=5.0) == float("inf")
+
+
+def test_sqlite_refilled_rows_are_pruned(tmp_path: Path) -> None:
+    path = str(tmp_path / "rate.db")
+    limiter = SQLiteTokenBucketLimiter(burst=2, per_minute=60, path=path, namespace="login-ip")
+    other = SQLiteTokenBucketLimiter(burst=2, per_minute=60, path=path, namespace="login-email")
+    other.hit("kept", now=0.0)
+    for index in range(100):
+        limiter.hit(f"spray-{index}", now=1.0 + index / 100)
+
+    def keys() -> set[str]:
+        rows = limiter._connect().execute("SELECT key FROM rate_limit_buckets").fetchall()
+        return {key for (key,) in rows}
+
+    assert len(keys()) == 101
+    # Buckets last touched two seconds (burst / rate) ago have refilled.
+    limiter.hit("late", now=3.5)
+    assert keys() == {"login-email:kept", "login-ip:late"} | {f"login-ip:spray-{index}" for index in range(51, 100)}
+    limiter.hit("later", now=3.6)
+    assert len(keys()) == 52  # the next pass waits for another refill period
+
+
+def test_login_limiter_backend_follows_settings(tmp_path: Path) -> None:
+    memory = LoginRateLimiter.from_settings(Settings())
+    assert type(memory.by_email) is TokenBucketLimiter
+
+    shared = LoginRateLimiter.from_settings(
+        Settings(auth_rate_limit_backend="sqlite", auth_rate_limit_sqlite_path=str(tmp_path / "r.db"))
+    )
+    assert isinstance(shared.by_ip, SQLiteTokenBucketLimiter)
+
+
+def _limit(monkeypatch: pytest.MonkeyPatch, **env: str) -> None:
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    get_settings.cache_clear()
+
+
+def test_login_is_throttled_per_email_before_password_check(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert (
+        client.post(
+            "/auth/signup", json={"email": "victim@example.com", "password": "SuperSecret1!"}
+        ).status_code
+        == 201
+    )
+    _limit(monkeypatch, AUTH_LOGIN_EMAIL_BURST="2", AUTH_LOGIN_EMAIL_PER_MINUTE="1")
+    attempt = {"email": "Victim@example.com", "password": "WrongPassword"}
+
+    assert client.post("/auth/login", json=attempt).status_code == 401
+    assert client.post("/auth/login", json=attempt).status_code == 401
+    throttled = client.post("/auth/login", json={**attempt, "password": "SuperSecret1!"})
+
+    assert throttled.status_code == 429
+    assert throttled.json()["detail"] == "Too many login attempts"
+    assert int(throttled.headers["Retry-After"]) >= 59
+    assert get_login_rate_limiter().rejected == 1
+
+
+def test_non_refilling_bucket_sends_a_finite_retry_after(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _limit(monkeypatch, AUTH_LOGIN_EMAIL_BURST="1", AUTH_LOGIN_EMAIL_PER_MINUTE="0")
+    attempt = {"email": "frozen@example.com", "password": "WrongPassword"}
+
+    assert client.post("/auth/login", json=attempt).status_code == 401
+    throttled = client.post("/auth/login", json=attempt)
+
+    assert throttled.status_code == 429
+    assert throttled.headers["Retry-After"] == "60"
+
+
+def test_login_is_throttled_per_client_ip(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    _limit(monkeypatch, AUTH_LOGIN_IP_BURST="2", AUTH_LOGIN_IP_PER_MINUTE="60")
+
+    statuses = [
+        client.post(
+            "/auth/login", json={"email": f"spray{index}@example.com", "password": "guess"}
+        ).status_code
+        for index in range(3)
+    ]
+
+    assert statuses == [401, 401, 429]
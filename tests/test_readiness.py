@@ -0,0 +1,112 @@
+"""Tests for the background database readiness probe and ``/ready``."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.readiness import ReadinessProbe, get_readiness_probe, reset_readiness_probe
+
+
+def wait_until_checked(client: TestClient) -> dict:
+    deadline = time.monotonic() + 5
+    while get_readiness_probe().result is None:
+        assert time.monotonic() < deadline, "readiness probe never ran"
+        time.sleep(0.01)
+    return client.get("/ready").json()
+
+
+def test_ready_reports_the_background_check(client: TestClient) -> None:
+    payload = wait_until_checked(client)
+
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-store"
+    assert payload["status"] == "ready"
+    assert payload["latency_ms"] >= 0
+    assert payload["pool"]["pool"] == "TimedAsyncAdaptedQueuePool"
+    assert payload["pool"]["checked_out"] == 0
+
+
+def test_ready_is_unavailable_until_the_first_check() -> None:
+    reset_readiness_probe()
+    probe = get_readiness_probe()
+
+    status_code, body = probe.status()
+
+    assert status_code == 503
+    assert json.loads(body) == {"status": "starting"}
+    reset_readiness_probe()
+
+
+def test_probe_records_failures_and_recovers(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        probe = ReadinessProbe(interval=1.0, timeout=1.0)
+        broken = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'x.db'}")
+        healthy = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'ok.db'}")
+        try:
+            result = await probe.check(broken)
+            assert result["status"] == "unavailable"
+            assert result["error"] == "OperationalError"
+            assert probe.status()[0] == 503
+
+            result = await probe.check(healthy)
+            assert result["status"] == "ready" and "error" not in result
+            assert probe.status() == (200, json.dumps(result, separators=(",", ":")).encode())
+        finally:
+            await broken.dispose()
+            await healthy.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_probe_times_out_and_goes_stale(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    async def scenario() -> None:
+        probe = ReadinessProbe(interval=0.01, timeout=0.05)
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'busy.db'}", pool_size=1, max_overflow=0
+        )
+        try:
+            async with engine.connect():
+                result = await probe.check(engine)
+            assert result["error"] == "no answer within 0.05s"
+            assert result["pool"]["checked_out"] == 1
+
+            await probe.check(engine)
+            assert probe.status()[0] == 200
+            await asyncio.sleep(probe.stale_after * 2)
+            status_code, body = probe.status()
+            assert status_code == 503 and json.loads(body)["status"] == "stale"
+            assert probe.status()[1] is body
+        finally:
+            await engine.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_probe_loop_starts_once_and_stops(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        probe = ReadinessProbe(interval=0.01, timeout=1.0)
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'loop.db'}")
+        try:
+            probe.start(engine)
+            task = probe._task
+            probe.start(engine)
+            assert probe._task is task
+            await asyncio.sleep(0.05)
+            first = probe.result
+            await asyncio.sleep(0.05)
+            assert probe.result is not first
+            await probe.stop()
+            assert task.cancelled() and probe._task is None
+            await probe.stop()
+        finally:
+            await engine.dispose()
+
+    asyncio.run(scenario())
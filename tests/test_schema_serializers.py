@@ -0,0 +1,62 @@
+"""Tests for the pre-built TypeAdapter serializers and the routes using them."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models import Mission
+from app.schemas import MissionPage, MissionRead
+from app.schemas.serializers import MISSION_PAGE, MISSION_READ, MISSION_READ_LIST, dump_json
+
+START = datetime(2026, 3, 1, 9, 0)
+
+
+def add(db_session: Session, title: str) -> Mission:
+    mission = Mission(title=title, notes="Ünïcode", start_time=START, end_time=START + timedelta(hours=1))
+    db_session.add(mission)
+    db_session.commit()
+    return mission
+
+
+def test_dump_json_matches_the_model_encoding(client: TestClient, db_session: Session) -> None:
+    missions = [add(db_session, "First"), add(db_session, "Second")]
+
+    body = dump_json(MISSION_READ_LIST, missions)
+
+    assert body == b"[" + b",".join(
+        MissionRead.model_validate(mission).model_dump_json().encode("utf-8") for mission in missions
+    ) + b"]"
+    assert json.loads(body)[0]["id"] == str(missions[0].id)
+
+
+def test_dump_json_reuses_validated_models(client: TestClient, db_session: Session) -> None:
+    mission = add(db_session, "Only")
+    item = MissionRead.model_validate(mission)
+
+    page = MISSION_PAGE.validate_python({"items": [item], "next_cursor": "c"}, from_attributes=True)
+
+    assert page.items[0] is item
+    assert dump_json(MISSION_PAGE, page) == MissionPage(items=[item], next_cursor="c").model_dump_json().encode()
+
+
+def test_routes_return_encoded_bytes(
+    client: TestClient, db_session: Session, auth_headers: dict[str, str]
+) -> None:
+    mission = add(db_session, "Routed")
+
+    response = client.get(f"/missions/{mission.id}", headers=auth_headers)
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == dump_json(MISSION_READ, mission)
+
+    me = client.get("/auth/me", headers=auth_headers)
+    assert me.headers["content-type"] == "application/json"
+    assert me.json()["email"] == "operator@example.com"
+
+    schema = client.get("/openapi.json").json()["paths"]["/missions/{mission_id}"]["get"]
+    assert schema["responses"]["200"]["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/MissionRead"
+    }
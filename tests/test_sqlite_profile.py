@@ -0,0 +1,71 @@
+"""Tests for the opt-in SQLite performance profile."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from app.db import session as session_module
+from app.db.sqlite import sqlite_pragmas
+from app.settings import Settings, get_settings
+
+
+@pytest.fixture()
+def tuned_settings(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'tuned.db'}")
+    monkeypatch.setenv("SQLITE_TUNING", "true")
+    monkeypatch.setenv("SQLITE_SYNCHRONOUS", "normal")
+    monkeypatch.setenv("SQLITE_BUSY_TIMEOUT", "1234")
+    get_settings.cache_clear()
+    yield get_settings()
+    get_settings.cache_clear()
+
+
+def test_sqlite_pragmas_follow_settings() -> None:
+    pragmas = sqlite_pragmas(Settings(sqlite_journal_mode="DELETE", sqlite_mmap_size=0))
+
+    assert "PRAGMA journal_mode=DELETE" in pragmas
+    assert "PRAGMA mmap_size=0" in pragmas
+    assert "PRAGMA temp_store=MEMORY" in pragmas
+
+
+def test_sync_engine_applies_profile(tuned_settings: Settings) -> None:
+    engine = session_module._create_engine()
+    try:
+        with engine.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+            assert connection.execute(text("PRAGMA temp_store")).scalar() == 2
+    finally:
+        engine.dispose()
+
+
+def test_async_engine_applies_profile(tuned_settings: Settings) -> None:
+    async def scenario() -> tuple[str, int]:
+        engine = session_module._create_async_engine()
+        try:
+            async with engine.connect() as connection:
+                journal = (await connection.execute(text("PRAGMA journal_mode"))).scalar()
+                cache = (await connection.execute(text("PRAGMA cache_size"))).scalar()
+                return journal, cache
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(scenario()) == ("wal", tuned_settings.sqlite_cache_size)
+
+
+def test_profile_is_opt_in(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'plain.db'}")
+    monkeypatch.delenv("SQLITE_TUNING", raising=False)
+    get_settings.cache_clear()
+    engine = session_module._create_engine()
+    try:
+        with engine.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+    finally:
+        engine.dispose()
+        get_settings.cache_clear()
@@ -0,0 +1,91 @@
+"""Tests for lazy application start-up: imports, engines and version resolution."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app
+import app.main
+from app.core.config import get_app_version
+from app.db import session as session_module
+from app.main import create_app
+from app.settings import get_settings
+
+
+def run_python(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def test_importing_models_skips_the_web_stack() -> None:
+    loaded = run_python(
+        "import sys, app.models; "
+        "print(sorted(name for name in ('fastapi', 'numpy', 'app.main') if name in sys.modules))"
+    )
+
+    assert loaded == "[]"
+
+
+def test_importing_the_app_builds_nothing() -> None:
+    state = run_python(
+        "import sys, app.main; from app.db import session; "
+        "print(session._engine is None, session._async_engine is None, "
+        "'app' in vars(app.main), 'numpy' in sys.modules)"
+    )
+
+    assert state == "True True False False"
+
+
+def test_app_attribute_is_built_once() -> None:
+    application = app.main.app
+
+    assert application is app.main.app
+    assert app.app is application
+    assert app.create_app is create_app
+    with pytest.raises(AttributeError):
+        app.main.missing  # noqa: B018
+    with pytest.raises(AttributeError):
+        app.missing  # noqa: B018
+
+
+def test_lifespan_resolves_version_and_engines(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'startup.db'}")
+    monkeypatch.delenv("APP_VERSION", raising=False)
+    get_settings.cache_clear()
+    try:
+        application = create_app()
+        with TestClient(application):
+            assert application.version == get_app_version()
+            assert session_module._engine is session_module.get_engine()
+            assert session_module._async_engine is session_module.get_async_engine()
+        assert session_module._engine is None and session_module._async_engine is None
+
+        monkeypatch.setenv("APP_VERSION", "9.8.7")
+        get_settings.cache_clear()
+        application = create_app()
+        with TestClient(application):
+            assert application.version == "9.8.7"
+    finally:
+        get_settings.cache_clear()
+
+
+def test_session_factories_build_engines_on_first_use(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'lazy.db'}")
+    get_settings.cache_clear()
+    try:
+        with session_module.SessionLocal() as session:
+            assert session.get_bind() is session_module.get_engine()
+        session_module.AsyncSessionLocal()
+        assert session_module._async_engine is not None
+    finally:
+        asyncio.run(session_module.dispose_engines())
+        get_settings.cache_clear()
@@ -0,0 +1,102 @@
+"""Tests for the verified-token cache."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from app.schemas import TokenPayload
+from app.security import (
+    TokenCache,
+    TokenError,
+    TokenExpiredError,
+    create_access_token,
+    decode_token,
+    get_token_cache,
+    reset_token_cache,
+)
+from app.settings import get_settings
+
+
+@pytest.fixture()
+def fresh_cache(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("AUTH_SECRET", "cache-secret")
+    monkeypatch.setenv("AUTH_TOKEN_CACHE_SIZE", "2")
+    get_settings.cache_clear()
+    reset_token_cache()
+    yield get_token_cache()
+    reset_token_cache()
+    get_settings.cache_clear()
+
+
+def _payload(exp: int) -> TokenPayload:
+    return TokenPayload(sub="1", type="access", exp=exp, iat=exp - 60)
+
+
+def test_decode_token_hits_cache_on_reuse(fresh_cache: TokenCache) -> None:
+    token = create_access_token("7")
+
+    first = decode_token(token)
+    second = decode_token(token)
+
+    assert first is second
+    assert fresh_cache.stats()["hits"] == 1
+    assert fresh_cache.stats()["misses"] == 1
+
+
+def test_secret_rotation_invalidates_cache(
+    fresh_cache: TokenCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    token = create_access_token("7")
+    decode_token(token)
+    assert len(fresh_cache) == 1
+
+    monkeypatch.setenv("AUTH_SECRET", "rotated-secret")
+    get_settings.cache_clear()
+
+    with pytest.raises(TokenError):
+        decode_token(token)
+    assert len(fresh_cache) == 0
+
+
+def test_expired_entries_are_evicted(fresh_cache: TokenCache) -> None:
+    fresh_cache.put("stale", _payload(int(time.time()) - 1))
+
+    assert fresh_cache.get("stale") is None
+    assert fresh_cache.stats()["evictions"] == 1
+    assert len(fresh_cache) == 0
+
+
+def test_lru_capacity_is_enforced(fresh_cache: TokenCache) -> None:
+    exp = int(time.time()) + 60
+    fresh_cache.put("a", _payload(exp))
+    fresh_cache.put("b", _payload(exp))
+    assert fresh_cache.get("a") is not None
+    fresh_cache.put("c", _payload(exp))
+
+    assert fresh_cache.get("b") is None
+    assert fresh_cache.get("a") is not None
+    assert fresh_cache.get("c") is not None
+    assert fresh_cache.stats()["size"] == 2
+
+    fresh_cache.clear()
+    assert fresh_cache.stats() == {
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "size": 0,
+        "capacity": 2,
+    }
+
+
+def test_zero_capacity_disables_caching() -> None:
+    cache = TokenCache(0)
+    cache.put("token", _payload(int(time.time()) + 60))
+    assert cache.get("token") is None
+
+
+def test_expired_token_is_not_served_from_cache(fresh_cache: TokenCache) -> None:
+    with pytest.raises(TokenExpiredError):
+        decode_token(create_access_token("7", ttl_seconds=-1))
+    assert len(fresh_cache) == 0
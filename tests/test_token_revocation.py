@@ -0,0 +1,146 @@
+"""Tests for refresh token rotation and revocation."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+import jwt
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db import session as session_module
+from app.models import RevokedToken, User
+from app.security import (
+    BloomFilter,
+    decode_token,
+    get_revocation_store,
+    run_revocation_compactor,
+)
+
+
+def _login(client: TestClient, email: str = "rotate@example.com") -> dict[str, str]:
+    credentials = {"email": email, "password": "SuperSecret1!"}
+    assert client.post("/auth/signup", json=credentials).status_code == 201
+    response = client.post("/auth/login", json=credentials)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _refresh(client: TestClient, token: str):
+    return client.post("/auth/refresh", json={"refresh_token": token})
+
+
+def test_refresh_rotates_and_rejects_reuse(client: TestClient) -> None:
+    tokens = _login(client)
+
+    rotated = _refresh(client, tokens["refresh_token"])
+    assert rotated.status_code == 200
+    new_refresh = rotated.json()["refresh_token"]
+    assert decode_token(new_refresh).jti != decode_token(tokens["refresh_token"]).jti
+
+    reused = _refresh(client, tokens["refresh_token"])
+    assert reused.status_code == 401
+    assert reused.json()["detail"] == "Refresh token revoked"
+
+    assert _refresh(client, new_refresh).status_code == 200
+    store = get_revocation_store()
+    assert store.negative_lookups == 2
+    assert store.database_lookups == 1
+
+
+def test_logout_revokes_refresh_token(client: TestClient) -> None:
+    tokens = _login(client)
+
+    response = client.post("/auth/logout", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 204
+
+    assert _refresh(client, tokens["refresh_token"]).json()["detail"] == "Refresh token revoked"
+
+
+def test_refresh_requires_active_user(client: TestClient, db_session: Session) -> None:
+    tokens = _login(client)
+    user = db_session.scalar(select(User).where(User.email == "rotate@example.com"))
+    user.is_active = False
+    db_session.commit()
+
+    response = _refresh(client, tokens["refresh_token"])
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "User not found or inactive"
+
+
+def test_refresh_requires_jti(client: TestClient) -> None:
+    now = int(datetime.now().timestamp())
+    token = jwt.encode(
+        {"sub": "1", "type": "refresh", "iat": now, "exp": now + 60}, "test-secret", algorithm="HS256"
+    )
+
+    response = _refresh(client, token)
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid refresh token"
+
+
+def test_revocation_from_another_worker_is_enforced(client: TestClient, db_session: Session) -> None:
+    tokens = _login(client)
+    assert _refresh(client, _login(client, "other@example.com")["refresh_token"]).status_code == 200
+
+    jti = decode_token(tokens["refresh_token"]).jti
+    db_session.add(RevokedToken(jti=jti, expires_at=datetime.utcnow() + timedelta(hours=1)))
+    db_session.commit()
+
+    response = _refresh(client, tokens["refresh_token"])
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Refresh token revoked"
+
+
+def test_bloom_filter_has_no_false_negatives() -> None:
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    members = [f"jti-{index}" for index in range(1000)]
+    for member in members:
+        bloom.add(member)
+
+    assert all(member in bloom for member in members)
+    false_positives = sum(f"other-{index}" in bloom for index in range(10000))
+    assert false_positives < 300
+    assert 42 not in bloom
+
+
+def test_compaction_drops_expired_rows(client: TestClient, db_session: Session) -> None:
+    now = datetime.utcnow()
+    db_session.add_all(
+        [
+            RevokedToken(jti="expired", expires_at=now - timedelta(seconds=1)),
+            RevokedToken(jti="live", expires_at=now + timedelta(hours=1)),
+        ]
+    )
+    db_session.commit()
+    store = get_revocation_store()
+
+    async def compact() -> int:
+        async with client.app.state._async_sessionmaker() as session:
+            return await store.compact(session)
+
+    assert client.portal.call(compact) == 1
+    assert db_session.scalars(select(RevokedToken.jti)).all() == ["live"]
+
+
+def test_compactor_loop_runs_until_cancelled(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(session_module, "AsyncSessionLocal", client.app.state._async_sessionmaker)
+    store = get_revocation_store()
+
+    async def run_briefly() -> None:
+        task = asyncio.create_task(run_revocation_compactor(store, 0.01))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    client.portal.call(run_briefly)
+    assert store._loaded
@@ -0,0 +1,101 @@
+"""Tests for the authenticated-user snapshot cache."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models import User
+from app.security import UserCache, UserSnapshot, get_user_cache
+from app.security import user_cache as user_cache_module
+
+
+def _snapshot(user_id: int, active: bool = True) -> UserSnapshot:
+    return UserSnapshot(
+        id=user_id,
+        email=f"user{user_id}@example.com",
+        is_active=active,
+        created_at=datetime(2024, 1, 1),
+    )
+
+
+def _auth_headers(client: TestClient) -> dict[str, str]:
+    credentials = {"email": "cached@example.com", "password": "SuperSecret1!"}
+    assert client.post("/auth/signup", json=credentials).status_code == 201
+    tokens = client.post("/auth/login", json=credentials).json()
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
+
+
+def test_me_is_served_from_cache(client: TestClient) -> None:
+    headers = _auth_headers(client)
+
+    assert client.get("/auth/me", headers=headers).status_code == 200
+    response = client.get("/auth/me", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["email"] == "cached@example.com"
+    stats = get_user_cache().stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_orm_update_invalidates_cached_user(client: TestClient, db_session: Session) -> None:
+    headers = _auth_headers(client)
+    assert client.get("/auth/me", headers=headers).status_code == 200
+    assert len(get_user_cache()) == 1
+
+    user = db_session.get(User, 1)
+    assert user is not None
+    user.is_active = False
+    db_session.flush()
+    db_session.rollback()
+    assert len(get_user_cache()) == 1
+    db_session.commit()
+    assert len(get_user_cache()) == 1
+
+    user = db_session.get(User, 1)
+    assert user is not None
+    user.is_active = False
+    db_session.flush()
+    # Other connections still read the committed row, so the entry stays valid.
+    assert len(get_user_cache()) == 1
+    db_session.commit()
+
+    assert len(get_user_cache()) == 0
+    response = client.get("/auth/me", headers=headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "User not found or inactive"
+
+
+def test_entries_expire_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(user_cache_module.time, "monotonic", lambda: clock[0])
+    cache = UserCache(capacity=4, ttl_seconds=10)
+    cache.put(_snapshot(1))
+
+    assert cache.get(1) is not None
+    clock[0] += 10
+    assert cache.get(1) is None
+    assert len(cache) == 0
+
+
+def test_lru_capacity_and_disabled_cache() -> None:
+    cache = UserCache(capacity=2, ttl_seconds=60)
+    cache.put(_snapshot(1))
+    cache.put(_snapshot(2))
+    assert cache.get(1) is not None
+    cache.put(_snapshot(3))
+
+    assert cache.get(2) is None
+    assert cache.get(1) is not None
+
+    cache.clear()
+    assert cache.stats()["hit_rate"] == 0.0
+
+    disabled = UserCache(capacity=0, ttl_seconds=60)
+    disabled.put(_snapshot(1))
+    assert disabled.get(1) is None
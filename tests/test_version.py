@@ -1,13 +1,17 @@
 """Tests for the version endpoint and helpers."""
 
+import os
 import re
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 
-from app.core.config import APP_VERSION, get_app_version
+from app.api.routes import version as version_module
+from app.core import config as config_module
+from app.core.config import APP_VERSION, cached_app_version, get_app_version, reset_app_version_cache
 from app.main import create_app
+from app.settings import get_settings
 
 
 def test_version_present() -> None:
@@ -63,3 +67,64 @@ def test_get_app_version_invalid_toml(tmp_path: Path) -> None:
     pyproject = tmp_path / "pyproject.toml"
     pyproject.write_text("invalid = ['unterminated'", encoding="utf-8")
     assert get_app_version(pyproject) == APP_VERSION
+
+
+def test_version_answers_conditional_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    """/version is served with an ETag and revalidated with an empty 304."""
+
+    monkeypatch.setenv("APP_VERSION", "7.1.0")
+    get_settings.cache_clear()
+    try:
+        client = TestClient(create_app())
+        first = client.get("/version")
+        assert first.json() == {"version": "7.1.0"}
+        assert first.headers["cache-control"] == "public, max-age=60"
+
+        revalidated = client.get("/version", headers={"If-None-Match": first.headers["etag"]})
+        assert revalidated.status_code == 304
+
+        monkeypatch.setenv("APP_VERSION", "7.2.0")
+        get_settings.cache_clear()
+        changed = client.get("/version", headers={"If-None-Match": first.headers["etag"]})
+        assert changed.status_code == 200
+        assert changed.json() == {"version": "7.2.0"}
+        assert changed.headers["etag"] != first.headers["etag"]
+    finally:
+        get_settings.cache_clear()
+
+
+def test_cached_version_rereads_only_when_the_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The pyproject is parsed once, then again only after its mtime changes."""
+
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text("[project]\nversion='1.0.0'\n", encoding="utf-8")
+    parsed: list[Path] = []
+    original = config_module.get_app_version
+
+    def counting(path: Path | None = None) -> str:
+        parsed.append(path)
+        return original(path)
+
+    monkeypatch.setattr(config_module, "get_app_version", counting)
+    monkeypatch.setattr(config_module, "VERSION_CHECK_INTERVAL", 0.0)
+    reset_app_version_cache(pyproject)
+    try:
+        assert cached_app_version() == "1.0.0"
+        assert cached_app_version() == "1.0.0"
+        assert len(parsed) == 1
+
+        pyproject.write_text("[project]\nversion='1.1.0'\n", encoding="utf-8")
+        stat = pyproject.stat()
+        os.utime(pyproject, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert cached_app_version() == "1.1.0"
+        assert len(parsed) == 2
+
+        monkeypatch.setattr(config_module, "VERSION_CHECK_INTERVAL", 3600.0)
+        pyproject.write_text("[project]\nversion='9.9.9'\n", encoding="utf-8")
+        os.utime(pyproject, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+        assert cached_app_version() == "1.1.0"
+    finally:
+        reset_app_version_cache()
+        version_module._payload = None
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Compare server CPU spent on a credential-stuffing burst with and without login throttling."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Replay wrong-password logins against one account and measure CPU time."
+    )
+    parser.add_argument("--attempts", type=int, default=200, help="Failed logins issued per run.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients.")
+    parser.add_argument("--limiter", choices=("off", "on"), help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+async def run_attack(attempts: int, concurrency: int) -> dict[str, object]:
+    import httpx
+
+    from app.main import create_app
+
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses: Counter[int] = Counter()
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post(
+            "/auth/signup", json={"email": "victim@example.com", "password": "BenchSecret1!"}
+        )
+
+        async def one(index: int) -> None:
+            payload = {"email": "victim@example.com", "password": f"guess-{index}"}
+            async with semaphore:
+                response = await client.post("/auth/login", json=payload)
+            statuses[response.status_code] += 1
+
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        await asyncio.gather(*(one(index) for index in range(attempts)))
+        elapsed = time.perf_counter() - started
+        cpu = time.process_time() - cpu_started
+    return {"elapsed": elapsed, "cpu": cpu, "statuses": {str(k): v for k, v in statuses.items()}}
+
+
+def run_single(attempts: int, concurrency: int) -> None:
+    from app.db import Base, get_engine
+    from app.security import shutdown_password_service
+
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    try:
+        results = asyncio.run(run_attack(attempts, concurrency))
+    finally:
+        shutdown_password_service()
+    print(json.dumps(results))
+
+
+def main() -> None:
+    args = parse_args()
+    if args.limiter:
+        run_single(args.attempts, args.concurrency)
+        return
+
+    print(f"attempts={args.attempts} concurrency={args.concurrency}")
+    for limiter in ("off", "on"):
+        workdir = Path(tempfile.mkdtemp(prefix="codex-bench-"))
+        env = dict(
+            os.environ,
+            DATABASE_URL=f"sqlite:///{workdir / 'bench.db'}",
+            # Hash in-process so process_time() accounts for every bcrypt call.
+            PASSWORD_POOL_SIZE="0",
+            PASSWORD_QUEUE_LIMIT=str(args.attempts),
+            AUTH_LOGIN_EMAIL_BURST="10" if limiter == "on" else "0",
+            AUTH_LOGIN_IP_BURST="0",
+        )
+        completed = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--limiter",
+                limiter,
+                "--attempts",
+                str(args.attempts),
+                "--concurrency",
+                str(args.concurrency),
+            ],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        results = json.loads(completed.stdout.strip().splitlines()[-1])
+        print(
+            f"limiter={limiter:<3} cpu={results['cpu']:6.2f}s wall={results['elapsed']:6.2f}s "
+            f"statuses={results['statuses']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
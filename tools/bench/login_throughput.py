@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Measure /auth/login throughput for different password pool sizes."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark concurrent logins against an in-process application."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4],
+        help="Password pool sizes to benchmark (0 uses the threadpool).",
+    )
+    parser.add_argument("--requests", type=int, default=64, help="Logins issued per run.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent clients.")
+    return parser.parse_args()
+
+
+async def run_logins(total: int, concurrency: int) -> float:
+    import httpx
+
+    from app.main import create_app
+
+    app = create_app()
+    credentials = {"email": "bench@example.com", "password": "BenchSecret1!"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post("/auth/signup", json=credentials)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one() -> None:
+            async with semaphore:
+                response = await client.post("/auth/login", json=credentials)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    args = parse_args()
+    workdir = Path(tempfile.mkdtemp(prefix="codex-bench-"))
+    os.environ["DATABASE_URL"] = f"sqlite:///{workdir / 'bench.db'}"
+    os.environ["PASSWORD_QUEUE_LIMIT"] = str(args.requests)
+    os.environ["AUTH_LOGIN_EMAIL_BURST"] = "0"
+    os.environ["AUTH_LOGIN_IP_BURST"] = "0"
+
+    from app.db import Base, get_engine
+    from app.security import shutdown_password_service
+    from app.settings import get_settings
+
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    print(f"cpu_count={os.cpu_count()} requests={args.requests} concurrency={args.concurrency}")
+    for workers in args.workers:
+        os.environ["PASSWORD_POOL_SIZE"] = str(workers)
+        get_settings.cache_clear()
+        shutdown_password_service()
+        try:
+            elapsed = asyncio.run(run_logins(args.requests, args.concurrency))
+        finally:
+            shutdown_password_service()
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        print(f"workers={workers:<3} {args.requests / elapsed:8.1f} logins/s ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Compare recording latencies into a locked histogram versus per-thread shards."""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time concurrent histogram observations, as request and query timers make them."
+    )
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16], help="Recording threads.")
+    parser.add_argument("--observations", type=int, default=200_000, help="Observations per thread.")
+    return parser.parse_args()
+
+
+def run(observe, threads: int, observations: int) -> float:  # noqa: ANN001
+    values = [(index % 1000) / 10_000 for index in range(observations)]
+    barrier = threading.Barrier(threads + 1)
+
+    def record() -> None:
+        barrier.wait()
+        for value in values:
+            observe(value)
+
+    workers = [threading.Thread(target=record) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    args = parse_args()
+    from app.core.metrics import Histogram, ShardedHistogram
+
+    for threads in args.threads:
+        total = threads * args.observations
+        print(f"threads={threads} observations={total}")
+        for label, histogram in (("locked", Histogram()), ("sharded", ShardedHistogram())):
+            seconds = run(histogram.observe, threads, args.observations)
+            assert histogram.snapshot()["count"] == total
+            print(f"  {label:<8} {seconds * 1000:8.1f}ms  {seconds / total * 1e9:6.0f}ns/observation")
+
+
+if __name__ == "__main__":
+    main()
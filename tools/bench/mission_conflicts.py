@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Compare mission conflict detection: NumPy sweep, pure-Python sweep, pairwise scan."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time detect_conflicts over synthetic schedules of increasing size."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="Interval counts."
+    )
+    parser.add_argument(
+        "--pairwise-limit",
+        type=int,
+        default=10_000,
+        help="Largest size for which the O(n^2) pairwise scan is also timed.",
+    )
+    parser.add_argument("--max-pairs", type=int, default=10_000, help="Pairs listed per run.")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the schedule.")
+    return parser.parse_args()
+
+
+def schedule(count: int, rng: random.Random) -> tuple[list[int], list[int]]:
+    # Microsecond keys; mostly a few hours long with a rare multi-day tail.
+    # The span grows with the count so about two missions run at once on
+    # average, as on a busy calendar, whatever the size.
+    hour = 3_600_000_000
+    span = count * 2 * hour
+    starts = [rng.randrange(span) for _ in range(count)]
+    ends = [
+        start + (rng.choice([1, 2, 4, 8]) if rng.random() < 0.995 else rng.randrange(24, 72)) * hour
+        for start in starts
+    ]
+    return starts, ends
+
+
+def pairwise(starts: list[int], ends: list[int]) -> int:
+    found = 0
+    for first in range(len(starts)):
+        start, end = starts[first], ends[first]
+        for second in range(first + 1, len(starts)):
+            if start < ends[second] and starts[second] < end:
+                found += 1
+    return found
+
+
+def timed(label: str, run) -> object:  # noqa: ANN001
+    began = time.perf_counter()
+    result = run()
+    print(f"  {label:<9} {time.perf_counter() - began:9.3f}s")
+    return result
+
+
+def main() -> None:
+    args = parse_args()
+    import numpy as np
+
+    from app.missions import conflicts
+
+    rng = random.Random(args.seed)
+    for size in args.sizes:
+        starts, ends = schedule(size, rng)
+        start_array = np.asarray(starts, dtype=np.int64)
+        end_array = np.asarray(ends, dtype=np.int64)
+        print(f"{size} intervals")
+        vectorised = timed(
+            "numpy", lambda: conflicts._detect_numpy(start_array, end_array, args.max_pairs)
+        )
+        swept = timed("python", lambda: conflicts._detect_python(starts, ends, args.max_pairs))
+        assert vectorised.pair_count == swept.pair_count
+        assert len(vectorised.clusters) == len(swept.clusters)
+        if size <= args.pairwise_limit:
+            assert timed("pairwise", lambda: pairwise(starts, ends)) == vectorised.pair_count
+        print(f"  pairs={vectorised.pair_count} clusters={len(vectorised.clusters)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Show that streaming mission exports keep peak memory flat as the table grows."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BASE = datetime(2026, 1, 1)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Export missions through the streaming path and report peak RSS per table size."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 500_000], help="Mission counts."
+    )
+    parser.add_argument("--format", choices=("ndjson", "csv"), default="ndjson")
+    parser.add_argument("--gzip", action="store_true", help="Compress the export on the fly.")
+    parser.add_argument("--run", metavar="DB", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def seed(database_url: str, count: int) -> None:
+    from sqlalchemy import create_engine
+
+    from app.db import Base
+    from app.models import Mission
+
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        for offset in range(0, count, 50_000):
+            connection.execute(
+                Mission.__table__.insert(),
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "title": f"Mission {number}",
+                        "start_time": BASE + timedelta(minutes=number),
+                        "end_time": BASE + timedelta(minutes=number + 45),
+                        "status": "PLANNED",
+                        "notes": "x" * 200,
+                        "created_at": BASE,
+                        "updated_at": BASE,
+                    }
+                    for number in range(offset, min(offset + 50_000, count))
+                ],
+            )
+    engine.dispose()
+
+
+def run_export(database_url: str, fmt: str, gzip: bool) -> None:
+    from sqlalchemy import create_engine
+
+    from app.missions import iter_mission_export
+
+    engine = create_engine(database_url)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    size = sum(len(chunk) for chunk in iter_mission_export(engine, fmt=fmt, gzip=gzip))
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"bytes": size, "elapsed": elapsed, "rss_growth_kb": peak - baseline}))
+
+
+def main() -> None:
+    args = parse_args()
+    if args.run:
+        run_export(args.run, args.format, args.gzip)
+        return
+
+    for size in args.sizes:
+        workdir = Path(tempfile.mkdtemp(prefix="codex-bench-"))
+        database_url = f"sqlite:///{workdir / 'bench.db'}"
+        seed(database_url, size)
+        command = [sys.executable, __file__, "--run", database_url, "--format", args.format]
+        if args.gzip:
+            command.append("--gzip")
+        completed = subprocess.run(command, capture_output=True, text=True, check=True, env=os.environ)
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        print(
+            f"missions={size:<8} {result['bytes'] / 1e6:8.1f}MB in {result['elapsed']:6.2f}s "
+            f"({size / result['elapsed']:9.0f} rows/s) peak RSS growth={result['rss_growth_kb'] / 1024:6.1f}MiB"
+        )
+        (workdir / "bench.db").unlink()
+
+
+if __name__ == "__main__":
+    main()
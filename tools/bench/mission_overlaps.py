@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Compare mission overlap queries through the interval index and through SQL."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BASE = datetime(2026, 1, 1)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time overlap queries against the in-memory index and ix_missions_time_range."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100_000, 1_000_000], help="Mission counts to load."
+    )
+    parser.add_argument("--queries", type=int, default=200, help="Overlap windows queried per size.")
+    parser.add_argument("--window-hours", type=float, default=4.0, help="Width of each query window.")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for missions and windows.")
+    return parser.parse_args()
+
+
+def seed(engine, count: int, rng: random.Random) -> None:  # noqa: ANN001
+    from app.models import Mission
+
+    # Missions spread over a year, mostly a few hours long with a tail of
+    # multi-day ones, which is what defeats a start_time-only range scan.
+    span_minutes = 365 * 24 * 60
+    table = Mission.__table__
+    now = datetime(2026, 1, 1)
+    with engine.begin() as connection:
+        for offset in range(0, count, 50_000):
+            rows = []
+            for _ in range(min(50_000, count - offset)):
+                start = BASE + timedelta(minutes=rng.randrange(span_minutes))
+                hours = rng.choice([1, 2, 4, 8]) if rng.random() < 0.98 else rng.randrange(24, 24 * 30)
+                rows.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "title": "bench",
+                        "start_time": start,
+                        "end_time": start + timedelta(hours=hours),
+                        "status": "DRAFT",
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+            connection.execute(table.insert(), rows)
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def report(label: str, samples: list[float], matches: int) -> None:
+    print(
+        f"  {label:<6} mean={statistics.fmean(samples) * 1000:8.3f}ms "
+        f"p95={percentile(samples, 0.95) * 1000:8.3f}ms matches/query={matches / len(samples):.1f}"
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    from sqlalchemy import create_engine, select
+    from sqlalchemy.orm import Session
+
+    from app.db import Base
+    from app.missions import MissionIntervalIndex
+    from app.models import Mission
+
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        workdir = Path(tempfile.mkdtemp(prefix="codex-bench-"))
+        engine = create_engine(f"sqlite:///{workdir / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        started = time.perf_counter()
+        seed(engine, size, rng)
+        print(f"missions={size} seeded in {time.perf_counter() - started:.1f}s")
+
+        width = timedelta(hours=args.window_hours)
+        windows = [
+            (start, start + width)
+            for start in (BASE + timedelta(minutes=rng.randrange(365 * 24 * 60)) for _ in range(args.queries))
+        ]
+
+        with Session(engine) as session:
+            index = MissionIntervalIndex()
+            started = time.perf_counter()
+            index.load(session)
+            print(f"  index built in {time.perf_counter() - started:.2f}s")
+
+            samples, matches = [], 0
+            for low, high in windows:
+                started = time.perf_counter()
+                matches += len(index.overlapping(low, high))
+                samples.append(time.perf_counter() - started)
+            report("index", samples, matches)
+
+            statement = select(Mission.start_time, Mission.id).order_by(Mission.start_time, Mission.id)
+            samples, matches = [], 0
+            for low, high in windows:
+                started = time.perf_counter()
+                bound = statement.where(Mission.start_time < high, Mission.end_time > low)
+                matches += len(session.execute(bound).all())
+                samples.append(time.perf_counter() - started)
+            report("sql", samples, matches)
+        engine.dispose()
+        os.remove(workdir / "bench.db")
+
+
+if __name__ == "__main__":
+    main()
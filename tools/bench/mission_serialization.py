@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Compare encoding a large mission list: per-row models plus stdlib json versus TypeAdapter bytes."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BASE = datetime(2026, 1, 1)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time turning loaded Mission rows into a JSON response body."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000], help="Missions encoded per run."
+    )
+    parser.add_argument("--repeat", type=int, default=10, help="Timed runs per size and path.")
+    return parser.parse_args()
+
+
+def seed(engine, count: int) -> None:  # noqa: ANN001
+    from app.models import Mission
+
+    rows = []
+    for number in range(count):
+        start = BASE + timedelta(minutes=30 * number)
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "title": f"Mission {number}",
+                "start_time": start,
+                "end_time": start + timedelta(hours=2),
+                "status": "PLANNED",
+                "notes": "Bring the spare radio and check the weather before departure.",
+                "created_at": BASE,
+                "updated_at": BASE,
+            }
+        )
+    with engine.begin() as connection:
+        connection.execute(Mission.__table__.insert(), rows)
+
+
+def timed(encode, repeat: int) -> tuple[float, bytes]:  # noqa: ANN001
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = encode()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples), body
+
+
+def main() -> None:
+    args = parse_args()
+    from pydantic import TypeAdapter
+    from sqlalchemy import create_engine, select
+    from sqlalchemy.orm import Session
+
+    from app.db import Base
+    from app.models import Mission
+    from app.schemas import MissionPage, MissionRead
+    from app.schemas.serializers import MISSION_PAGE, dump_json
+
+    page_field = TypeAdapter(MissionPage)
+
+    def per_row(missions: list[Mission]) -> bytes:
+        # What a route returning a MissionPage paid through FastAPI's generic
+        # path: a model per row, response validation, a dict tree, then json.
+        page = MissionPage(items=[MissionRead.model_validate(mission) for mission in missions])
+        content = page_field.dump_python(page_field.validate_python(page), mode="json")
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+    def per_row_native(missions: list[Mission]) -> bytes:
+        # The same models encoded by pydantic-core, as newer FastAPI releases do.
+        page = MissionPage(items=[MissionRead.model_validate(mission) for mission in missions])
+        return page_field.dump_json(page_field.validate_python(page))
+
+    def adapter(missions: list[Mission]) -> bytes:
+        return dump_json(MISSION_PAGE, {"items": missions, "next_cursor": None})
+
+    for size in args.sizes:
+        workdir = Path(tempfile.mkdtemp(prefix="codex-bench-"))
+        engine = create_engine(f"sqlite:///{workdir / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        seed(engine, size)
+        with Session(engine) as session:
+            missions = list(session.scalars(select(Mission).order_by(Mission.start_time)))
+            print(f"missions={size}")
+            bodies = {}
+            for label, encode in (("per-row", per_row), ("native", per_row_native), ("adapter", adapter)):
+                seconds, body = timed(lambda: encode(missions), args.repeat)
+                bodies[label] = body
+                print(f"  {label:<8} {seconds * 1000:8.2f}ms  {seconds / size * 1e6:6.2f}us/mission  {len(body)} bytes")
+            assert json.loads(bodies["per-row"]) == json.loads(bodies["adapter"])
+        engine.dispose()
+        os.remove(workdir / "bench.db")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Compare board reads from the columnar mission snapshot with the ORM path."""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BASE = datetime(2026, 1, 1)
+STATUSES = ["DRAFT", "PLANNED", "CONFIRMED", "CANCELED"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Measure memory per mission and board-read latency: snapshot versus ORM."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000], help="Mission counts to load."
+    )
+    parser.add_argument("--queries", type=int, default=200, help="Board reads timed per size.")
+    parser.add_argument("--window-days", type=float, default=7.0, help="Width of each board window.")
+    parser.add_argument("--limit", type=int, default=500, help="Rows returned per board read.")
+    parser.add_argument("--changes", type=int, default=100, help="Rows updated before an incremental refresh.")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for missions and windows.")
+    return parser.parse_args()
+
+
+def seed(engine, count: int, rng: random.Random) -> None:  # noqa: ANN001
+    from app.models import Mission
+
+    table = Mission.__table__
+    with engine.begin() as connection:
+        for offset in range(0, count, 50_000):
+            rows = []
+            for _ in range(min(50_000, count - offset)):
+                start = BASE + timedelta(minutes=rng.randrange(365 * 24 * 60))
+                # Spread edits over the preceding month so the watermark is selective.
+                edited = BASE - timedelta(seconds=rng.randrange(30 * 24 * 3600))
+                rows.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "title": f"Mission {rng.randrange(100_000)}",
+                        "start_time": start,
+                        "end_time": start + timedelta(hours=rng.choice([1, 2, 4, 8])),
+                        "status": rng.choice(STATUSES),
+                        "notes": None,
+                        "created_at": edited,
+                        "updated_at": edited,
+                    }
+                )
+            connection.execute(table.insert(), rows)
+
+
+def traced(build):  # noqa: ANN001, ANN201
+    """Return what ``build`` returns plus the bytes it left allocated."""
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, retained
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def report(label: str, samples: list[float], rows: int) -> None:
+    print(
+        f"  {label:<8} mean={statistics.fmean(samples) * 1000:8.3f}ms "
+        f"p95={percentile(samples, 0.95) * 1000:8.3f}ms rows/read={rows / len(samples):.0f}"
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    from sqlalchemy import create_engine, select, update
+    from sqlalchemy.orm import Session
+
+    from app.db import Base
+    from app.missions import MissionSnapshot
+    from app.models import Mission, MissionStatus
+    from app.models.mission import utcnow
+    from app.schemas import MissionBoardItem
+
+    for size in args.sizes:
+        rng = random.Random(args.seed)
+        workdir = Path(tempfile.mkdtemp(prefix="codex-bench-"))
+        engine = create_engine(f"sqlite:///{workdir / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        seed(engine, size, rng)
+        print(f"missions={size}")
+
+        with Session(engine) as session:
+            # Timings are taken without tracemalloc, which slows allocation down.
+            started = time.perf_counter()
+            loaded = session.scalars(select(Mission)).all()
+            orm_seconds = time.perf_counter() - started
+            del loaded
+            session.expunge_all()
+            loaded, orm_bytes = traced(lambda: session.scalars(select(Mission)).all())
+            print(f"  orm      load={orm_seconds:6.2f}s bytes/mission={orm_bytes / size:7.0f}")
+            del loaded
+            session.expunge_all()
+
+            snapshot = MissionSnapshot()
+            started = time.perf_counter()
+            snapshot.load(session)
+            snapshot_seconds = time.perf_counter() - started
+            snapshot = MissionSnapshot()
+            _, snapshot_bytes = traced(lambda: snapshot.load(session))
+            print(
+                f"  snapshot load={snapshot_seconds:6.2f}s bytes/mission={snapshot_bytes / size:7.0f} "
+                f"(columns {snapshot.nbytes / size:.0f})"
+            )
+
+            width = timedelta(days=args.window_days)
+            windows = [
+                (start, start + width)
+                for start in (BASE + timedelta(days=rng.uniform(0, 358)) for _ in range(args.queries))
+            ]
+            statuses = [MissionStatus.PLANNED, MissionStatus.CONFIRMED]
+
+            samples, rows = [], 0
+            for low, high in windows:
+                started = time.perf_counter()
+                statement = (
+                    select(Mission)
+                    .where(Mission.start_time >= low, Mission.start_time < high, Mission.status.in_(statuses))
+                    .order_by(Mission.start_time, Mission.id)
+                    .limit(args.limit)
+                )
+                items = [MissionBoardItem.model_validate(mission) for mission in session.scalars(statement)]
+                samples.append(time.perf_counter() - started)
+                rows += len(items)
+                session.expunge_all()
+            report("orm", samples, rows)
+
+            samples, rows = [], 0
+            for low, high in windows:
+                started = time.perf_counter()
+                found = snapshot.select(start_from=low, start_to=high, statuses=statuses, limit=args.limit)
+                items = [MissionBoardItem.model_validate(row._asdict()) for row in found]
+                samples.append(time.perf_counter() - started)
+                rows += len(items)
+            report("snapshot", samples, rows)
+
+            changed = session.scalars(select(Mission.id).limit(args.changes)).all()
+            session.execute(
+                update(Mission).where(Mission.id.in_(changed)).values(status="CANCELED", updated_at=utcnow())
+            )
+            session.commit()
+            started = time.perf_counter()
+            applied = snapshot.refresh(session)
+            print(f"  refresh  {applied} changed rows in {(time.perf_counter() - started) * 1000:.1f}ms")
+        engine.dispose()
+        os.remove(workdir / "bench.db")
+
+
+if __name__ == "__main__":
+    main()
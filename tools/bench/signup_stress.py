@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Stress /auth/signup with concurrent, partly duplicated registrations."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Fire concurrent signups where several clients race for the same email."
+    )
+    parser.add_argument("--requests", type=int, default=200, help="Signups issued in total.")
+    parser.add_argument(
+        "--duplicates", type=int, default=4, help="Concurrent requests sharing each email."
+    )
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients.")
+    return parser.parse_args()
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run(total: int, duplicates: int, concurrency: int) -> tuple[Counter[int], list[float]]:
+    import httpx
+
+    from app.main import create_app
+
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses: Counter[int] = Counter()
+    latencies: list[float] = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def one(index: int) -> None:
+            payload = {"email": f"race{index // duplicates}@example.com", "password": "BenchSecret1!"}
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post("/auth/signup", json=payload)
+                latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] += 1
+
+        await asyncio.gather(*(one(index) for index in range(total)))
+    return statuses, latencies
+
+
+def main() -> None:
+    args = parse_args()
+    workdir = Path(tempfile.mkdtemp(prefix="codex-bench-"))
+    os.environ["DATABASE_URL"] = f"sqlite:///{workdir / 'bench.db'}"
+    os.environ["PASSWORD_QUEUE_LIMIT"] = str(args.requests)
+
+    from app.db import Base, get_engine
+    from app.security import shutdown_password_service
+
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    try:
+        statuses, latencies = asyncio.run(run(args.requests, args.duplicates, args.concurrency))
+    finally:
+        shutdown_password_service()
+
+    print(f"requests={args.requests} duplicates={args.duplicates} concurrency={args.concurrency}")
+    print("statuses=" + ", ".join(f"{code}:{count}" for code, count in sorted(statuses.items())))
+    print(
+        f"p50={statistics.median(latencies) * 1000:.1f}ms "
+        f"p99={percentile(latencies, 0.99) * 1000:.1f}ms"
+    )
+    if any(code >= 500 for code in statuses):
+        raise SystemExit("server errors observed")
+
+
+if __name__ == "__main__":
+    main()
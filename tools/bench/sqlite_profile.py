@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Compare signup/login throughput with and without the SQLite profile."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark auth throughput on SQLite with SQLITE_TUNING off and on."
+    )
+    parser.add_argument("--users", type=int, default=50, help="Accounts created per run.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients.")
+    parser.add_argument(
+        "--profile",
+        choices=["off", "on"],
+        help="Run a single configuration in-process and print JSON (used internally).",
+    )
+    return parser.parse_args()
+
+
+async def run_workload(users: int, concurrency: int) -> dict[str, float]:
+    import httpx
+
+    from app.main import create_app
+
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+    accounts = [{"email": f"bench{i}@example.com", "password": "BenchSecret1!"} for i in range(users)]
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def call(path: str, payload: dict[str, str]) -> None:
+            async with semaphore:
+                response = await client.post(path, json=payload)
+                response.raise_for_status()
+
+        results: dict[str, float] = {}
+        for path, label in (("/auth/signup", "signup"), ("/auth/login", "login")):
+            started = time.perf_counter()
+            await asyncio.gather(*(call(path, account) for account in accounts))
+            results[label] = users / (time.perf_counter() - started)
+    return results
+
+
+def run_single(users: int, concurrency: int) -> None:
+    from app.db import Base, get_engine
+    from app.security import shutdown_password_service
+
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    try:
+        results = asyncio.run(run_workload(users, concurrency))
+    finally:
+        shutdown_password_service()
+    print(json.dumps(results))
+
+
+def main() -> None:
+    args = parse_args()
+    if args.profile:
+        run_single(args.users, args.concurrency)
+        return
+
+    print(f"users={args.users} concurrency={args.concurrency}")
+    for profile in ("off", "on"):
+        workdir = Path(tempfile.mkdtemp(prefix="codex-bench-"))
+        env = dict(
+            os.environ,
+            DATABASE_URL=f"sqlite:///{workdir / 'bench.db'}",
+            SQLITE_TUNING="true" if profile == "on" else "false",
+            PASSWORD_QUEUE_LIMIT=str(args.users),
+            AUTH_LOGIN_EMAIL_BURST="0",
+            AUTH_LOGIN_IP_BURST="0",
+        )
+        completed = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--profile",
+                profile,
+                "--users",
+                str(args.users),
+                "--concurrency",
+                str(args.concurrency),
+            ],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        results = json.loads(completed.stdout.strip().splitlines()[-1])
+        print(
+            f"profile={profile:<3} signup {results['signup']:8.1f}/s  login {results['login']:8.1f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
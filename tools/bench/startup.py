@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Measure worker cold start: import time, lifespan startup and the first request."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BUDGET_PATH = Path(__file__).with_name("startup_budget.json")
+
+# Runs in a fresh interpreter per sample so nothing is cached between runs.
+CHILD = """
+import asyncio, json, time
+started = time.perf_counter()
+import app.main
+application = app.main.app
+imported = time.perf_counter()
+
+SCOPE = {
+    "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+    "scheme": "http", "path": "/health", "raw_path": b"/health", "root_path": "",
+    "query_string": b"", "headers": [(b"host", b"bench")],
+    "client": ("127.0.0.1", 1), "server": ("bench", 80),
+}
+
+async def first_request():
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    async with application.router.lifespan_context(application):
+        ready = time.perf_counter()
+        await application(SCOPE, receive, send)
+        assert messages[0]["status"] == 200, messages
+        return ready, time.perf_counter()
+
+ready, answered = asyncio.run(first_request())
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "startup_ms": (ready - imported) * 1000,
+    "first_request_ms": (answered - started) * 1000,
+}))
+"""
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time importing app.main and serving the first request in fresh interpreters."
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters started.")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports listed from -X importtime.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help=f"Exit non-zero when a median exceeds {BUDGET_PATH.name}.",
+    )
+    return parser.parse_args()
+
+
+def child_env(workdir: Path) -> dict[str, str]:
+    env = dict(os.environ)
+    env["DATABASE_URL"] = f"sqlite:///{workdir / 'bench.db'}"
+    env.setdefault("AUTH_SECRET", "bench-secret")
+    return env
+
+
+def sample(env: dict[str, str]) -> dict[str, float]:
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD], env=env, check=True, capture_output=True, text=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    # Includes interpreter start-up, as a respawned worker would pay it.
+    result["process_ms"] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def slowest_imports(env: dict[str, str], top: int) -> list[tuple[int, int, str]]:
+    """Return ``(self_us, cumulative_us, module)`` for the slowest top-level imports."""
+
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        rows.append((int(own), int(cumulative), name.rstrip()))
+    return sorted(rows, key=lambda row: row[0], reverse=True)[:top]
+
+
+def main() -> None:
+    args = parse_args()
+    workdir = Path(tempfile.mkdtemp(prefix="codex-bench-"))
+    env = child_env(workdir)
+    sample(env)  # warm the OS page cache and bytecode caches
+
+    samples = [sample(env) for _ in range(args.runs)]
+    medians = {key: statistics.median(run[key] for run in samples) for key in samples[0]}
+    for key, value in medians.items():
+        print(f"{key:<17} median={value:8.1f}ms  min={min(run[key] for run in samples):8.1f}ms")
+
+    print("slowest imports (self time, -X importtime):")
+    for own, cumulative, name in slowest_imports(env, args.top):
+        print(f"  {own / 1000:7.1f}ms self {cumulative / 1000:7.1f}ms total  {name.strip()}")
+
+    if args.check:
+        budget = json.loads(BUDGET_PATH.read_text(encoding="utf-8"))
+        over = {key: (medians[key], limit) for key, limit in budget.items() if medians[key] > limit}
+        for key, (value, limit) in over.items():
+            print(f"OVER BUDGET {key}: {value:.1f}ms > {limit}ms")
+        if over:
+            raise SystemExit(1)
+        print(f"within budget ({BUDGET_PATH.name})")
+
+
+if __name__ == "__main__":
+    main()